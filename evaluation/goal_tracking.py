@@ -5,10 +5,31 @@ This module detects goal shifts in conversations and tracks the current goal
 as it evolves, enabling proper metrics calculation for templates with intentional shifts.
 """
 
+from bisect import bisect_right
 from typing import List, Dict, Optional, Tuple
 import re
 
 
+# Keywords that indicate goal shifts
+SHIFT_INDICATORS = [
+    r"actually.*(?:we|i|let's|we're)",
+    r"pivot.*(?:to|toward|towards)",
+    r"change.*(?:goal|approach|direction|strategy|plan)",
+    r"update.*(?:goal|approach|direction|strategy|plan)",
+    r"revise.*(?:goal|approach|direction|strategy|plan)",
+    r"shift.*(?:to|toward|towards)",
+    r"instead.*(?:we|let's|i)",
+    r"we've decided.*(?:to|that)",
+    r"new.*(?:goal|requirement|direction)",
+    r"adding.*(?:requirement|feature|support)",
+    r"also.*(?:adding|need|require)",
+]
+
+# All indicators fused into one case-insensitive pattern, so a message is
+# scanned once without building a lowercased copy
+SHIFT_RE = re.compile("|".join(f"(?:{pattern})" for pattern in SHIFT_INDICATORS), re.IGNORECASE)
+
+
 def detect_goal_shift_in_message(message: str) -> Optional[str]:
     """
     Detect if a user message contains a goal shift.
@@ -16,28 +37,10 @@ def detect_goal_shift_in_message(message: str) -> Optional[str]:
     Returns:
         The new goal if detected, None otherwise
     """
-    message_lower = message.lower()
-    
-    # Keywords that indicate goal shifts
-    shift_indicators = [
-        r"actually.*(?:we|i|let's|we're)",
-        r"pivot.*(?:to|toward|towards)",
-        r"change.*(?:goal|approach|direction|strategy|plan)",
-        r"update.*(?:goal|approach|direction|strategy|plan)",
-        r"revise.*(?:goal|approach|direction|strategy|plan)",
-        r"shift.*(?:to|toward|towards)",
-        r"instead.*(?:we|let's|i)",
-        r"we've decided.*(?:to|that)",
-        r"new.*(?:goal|requirement|direction)",
-        r"adding.*(?:requirement|feature|support)",
-        r"also.*(?:adding|need|require)",
-    ]
-    
-    for pattern in shift_indicators:
-        if re.search(pattern, message_lower):
-            # Try to extract the new goal from the message
-            # This is a simple heuristic - could be improved with LLM extraction
-            return message
+    if SHIFT_RE.search(message):
+        # Try to extract the new goal from the message
+        # This is a simple heuristic - could be improved with LLM extraction
+        return message
     
     return None
 
@@ -141,14 +144,20 @@ def get_current_goal_at_turn(
     turn_id: int,
     goal_timeline: Dict[int, Tuple[str, List[str]]],
     original_goal: str,
+    sorted_turns: Optional[List[int]] = None,
 ) -> str:
     """
     Get the current goal at a specific turn, falling back to original if not found.
+
+    When querying the same timeline repeatedly, pass sorted_turns
+    (sorted(goal_timeline)) so each lookup is a binary search.
     """
+    if sorted_turns is None:
+        sorted_turns = sorted(goal_timeline)
+
     # Find the most recent goal state before or at this turn
-    relevant_turns = [t for t in goal_timeline.keys() if t <= turn_id]
-    if relevant_turns:
-        latest_turn = max(relevant_turns)
-        return goal_timeline[latest_turn][0]
+    idx = bisect_right(sorted_turns, turn_id) - 1
+    if idx >= 0:
+        return goal_timeline[sorted_turns[idx]][0]
     return original_goal
 
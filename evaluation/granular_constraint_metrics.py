@@ -12,8 +12,9 @@ This module provides:
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple, Protocol
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Protocol
 from enum import Enum
+import re
 
 # Avoid circular import - define Protocol here and import functions lazily
 class LLMClient(Protocol):
@@ -158,6 +159,25 @@ def categorize_constraint(constraint: str) -> ConstraintCategory:
     return ConstraintCategory.OTHER
 
 
+def find_keywords(text: str, keywords: Sequence[str]) -> List[str]:
+    """
+    Find which keywords appear in text (case-insensitive).
+    
+    One pass over the text; the lookahead lets overlapping keywords
+    ("$10", "10K") all be found.
+    
+    Args:
+        text: Text to scan, e.g. an agent response
+        keywords: Keywords to look for
+    
+    Returns:
+        The keywords present in text, in the order given
+    """
+    pattern = re.compile("(?=(%s))" % "|".join(re.escape(kw) for kw in keywords), re.IGNORECASE)
+    found = {m.group(1).lower() for m in pattern.finditer(text)}
+    return [kw for kw in keywords if kw.lower() in found]
+
+
 def measure_granular_constraint_recall(
     known_constraints: List[str],
     stated_constraints: str,
@@ -215,11 +235,16 @@ def measure_granular_constraint_recall(
     constraint_results: List[ConstraintRecallResult] = []
     
     # Lazy import to avoid circular dependency
-    from .metrics import _constraint_mentioned
+    from .metrics import _constraints_mentioned_concurrent
+    
+    # Same per-constraint judge as measure_constraint_recall, so granular and
+    # overall recall stay comparable; the calls run concurrently
+    mentions = _constraints_mentioned_concurrent(
+        [(constraint, stated_constraints) for constraint in known_constraints], client, model
+    )
     
-    for constraint in known_constraints:
+    for constraint, mentioned in zip(known_constraints, mentions):
         category = categorize_constraint(constraint)
-        mentioned = _constraint_mentioned(constraint, stated_constraints, client, model)
         
         result = ConstraintRecallResult(
             constraint=constraint,
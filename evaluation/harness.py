@@ -23,17 +23,28 @@ Usage:
 """
 
 import json
+import mmap
+import multiprocessing
 import os
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Type
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type
 from pathlib import Path
 
+# Optional fast JSON parser for templates
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from openai import OpenAI
 
 from strategies.strategy_base import CompressionStrategy
 from evaluation.metrics import MetricsCollector
 from evaluation.goal_tracking import track_goal_evolution
+from evaluation.token_budget import estimate_tokens
 
 # Strategy imports moved to function level to avoid circular imports
 # (strategies import from evaluation.token_budget, which creates a cycle)
@@ -83,6 +94,18 @@ class EvaluationResults:
             "aggregate_summary": self.aggregate_summary,
             "timestamp": self.timestamp,
         }
+    
+    def save(self, filepath: str) -> None:
+        """Save results to an indented JSON file (via orjson when available)."""
+        if ORJSON_AVAILABLE:
+            with open(filepath, "wb") as f:
+                f.write(orjson.dumps(
+                    self.to_dict(),
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                ))
+        else:
+            with open(filepath, "w") as f:
+                json.dump(self.to_dict(), f, indent=2)
 
 
 class MockAgent:
@@ -116,11 +139,16 @@ class MockAgent:
         self.strategy.initialize(original_goal, constraints)
         self.context: List[Dict[str, Any]] = []
         self.total_tokens = 0
+        # Running estimate_tokens() total of the context contents, updated per
+        # turn so callers needn't re-render and re-tokenize the whole context
+        self.estimated_tokens = 0
     
     def add_turn(self, turn: Dict[str, Any]) -> None:
         self.context.append(turn)
+        content = turn.get("content", "")
         # Approximate: ~4 chars per token
-        self.total_tokens += len(turn.get("content", "")) // 4
+        self.total_tokens += len(content) // 4
+        self.estimated_tokens += estimate_tokens(content)
     
     def compress(self, trigger_point: int) -> str:
         """
@@ -131,6 +159,7 @@ class MockAgent:
         compressed = self.strategy.compress(self.context, trigger_point)
         
         self.total_tokens = len(compressed) // 4
+        self.estimated_tokens = estimate_tokens(compressed)
         self.context = [{
             "id": 0,
             "role": "system",
@@ -183,10 +212,32 @@ class MockAgent:
         return self.total_tokens
 
 
+# Templates larger than this are memory-mapped instead of read into a buffer
+TEMPLATE_MMAP_THRESHOLD = 1 << 20
+
+
 def load_template(template_path: str) -> Dict[str, Any]:
-    """Load a conversation template from JSON file."""
-    with open(template_path, "r") as f:
-        return json.load(f)
+    """
+    Load a conversation template from JSON file.
+
+    Parsed templates are cached per (path, mtime, size), so repeated loads
+    in a test sweep or multi-trial run skip the parse. The returned dict is
+    shared between callers and must be treated as read-only.
+    """
+    stat = os.stat(template_path)
+    return _parse_template(os.path.abspath(template_path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=32)
+def _parse_template(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a template file (cache key includes mtime/size so edits are picked up)."""
+    with open(path, "rb") as f:
+        if not ORJSON_AVAILABLE:
+            return json.load(f)
+        if size > TEMPLATE_MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        return orjson.loads(f.read())
 
 
 def run_single_trial(
@@ -382,8 +433,7 @@ def run_baseline_evaluation(
     )
     
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(results.to_dict(), f, indent=2)
+    results.save(output_path)
     
     print(f"\n{'='*60}")
     print(f"RESULTS SAVED TO: {output_path}")
@@ -400,10 +450,43 @@ def run_baseline_evaluation(
     return results
 
 
+def _run_strategy_h_trial(job: Tuple[Any, Dict[str, Any], int]) -> Tuple[TrialResult, List[Dict[str, Any]]]:
+    """
+    Run one Strategy H trial from a (config, template, trial_id) job.
+    
+    Module-level so it can run in a worker process; the strategy (with its
+    client and models) is built inside the worker from the picklable config.
+    
+    Returns:
+        Tuple of (trial result, background requests queued in batch_mode)
+    """
+    from strategies.strategy_h_selective_salience import SelectiveSalienceStrategy
+    config, template, trial_id = job
+    strategy = SelectiveSalienceStrategy.from_config(config)
+    result = run_single_trial(strategy, template, trial_id)
+    return result, strategy.drain_background_requests()
+
+
+def _drop_batch_metrics(trial: TrialResult) -> None:
+    """
+    Remove the probe-based metrics from a batch-mode trial.
+    
+    Keeps each compression point's id, turn and salience accuracy (salience
+    extraction runs synchronously, so it is still measured).
+    """
+    trial.summary = {}
+    trial.granular_constraint_metrics = None
+    for point in trial.compression_points:
+        for key in ("metrics_before", "metrics_after", "drift", "compression_ratio"):
+            point.pop(key, None)
+
+
 def run_strategy_h_evaluation(
     template_path: str,
     num_trials: int = 5,
     output_path: str = "results/strategy_h_results.json",
+    batch_mode: bool = False,
+    workers: int = 1,
 ) -> EvaluationResults:
     """
     Run evaluation using Strategy H (Selective Salience Compression).
@@ -412,6 +495,16 @@ def run_strategy_h_evaluation(
         template_path: Path to the conversation template JSON
         num_trials: Number of trials to run
         output_path: Path to save results
+        batch_mode: Send background compressions through one OpenAI Batch API
+            job after all trials (half price, up to 24h). Salience extraction
+            stays synchronous, but the agent answers its probes from a
+            placeholder background, so goal, constraint and behavioral
+            metrics would not measure Strategy H: they are dropped from the
+            results (see _drop_batch_metrics) and no aggregate is computed.
+            Each compression point's summary is stored as
+            "backfilled_background_summary" once the batch completes.
+        workers: Run trials in this many worker processes (spawned, so each
+            loads its own embedding model once)
     
     Returns:
         EvaluationResults with all trials and aggregate metrics
@@ -428,22 +521,55 @@ def run_strategy_h_evaluation(
     
     # Run trials
     trials: List[TrialResult] = []
+    batch_requests: List[Dict[str, Any]] = []
     
-    for trial_id in range(1, num_trials + 1):
-        # Create fresh strategy instance for each trial
-        # Lazy import to avoid circular dependency
-        from strategies.strategy_h_selective_salience import SelectiveSalienceStrategy
-        strategy = SelectiveSalienceStrategy()
-        
-        result = run_single_trial(strategy, template, trial_id)
+    # Each trial builds a fresh strategy from the config
+    # Lazy import to avoid circular dependency
+    from strategies.strategy_h_selective_salience import SelectiveSalienceConfig
+    config = SelectiveSalienceConfig(batch_mode=batch_mode)
+    jobs = [(config, template, trial_id) for trial_id in range(1, num_trials + 1)]
+    
+    if workers > 1:
+        with multiprocessing.get_context("spawn").Pool(min(workers, num_trials)) as pool:
+            outcomes = pool.map(_run_strategy_h_trial, jobs)
+    else:
+        outcomes = map(_run_strategy_h_trial, jobs)
+    
+    for result, requests in outcomes:
         trials.append(result)
+        
+        for request in requests:
+            request["custom_id"] = f"{result.trial_id}:{request['custom_id']}"
+            batch_requests.append(request)
+    
+    strategy_name = "Strategy H - Selective Salience Compression"
+    if batch_mode:
+        # Probes were answered from a placeholder background; drop what they
+        # measured so the run can't be compared with a normal Strategy H run
+        strategy_name += " (batch: no goal/constraint metrics)"
+        for trial in trials:
+            trial.strategy_name = strategy_name
+            _drop_batch_metrics(trial)
+    
+    if batch_requests:
+        from evaluation.openai_batch import run_openai_batch
+        print(f"\nSubmitting {len(batch_requests)} background compressions to the Batch API...")
+        outputs = run_openai_batch(OpenAI(), batch_requests)
+        for trial in trials:
+            for point in trial.compression_points:
+                summary = outputs.get(f"{trial.trial_id}:{point['turn_id']}")
+                if summary is not None:
+                    point["backfilled_background_summary"] = summary.strip()
     
     # Calculate aggregate summary
-    aggregate = _calculate_aggregate_summary(trials)
+    if batch_mode:
+        aggregate = {"num_trials": len(trials), "metrics_computed": False}
+    else:
+        aggregate = _calculate_aggregate_summary(trials)
     
     # Create results
     results = EvaluationResults(
-        strategy_name="Strategy H - Selective Salience Compression",
+        strategy_name=strategy_name,
         template_id=template["template_id"],
         num_trials=num_trials,
         trials=trials,
@@ -452,8 +578,7 @@ def run_strategy_h_evaluation(
     
     # Save results
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(results.to_dict(), f, indent=2)
+    results.save(output_path)
     
     print(f"\n{'='*60}")
     print(f"RESULTS SAVED TO: {output_path}")
@@ -535,6 +660,18 @@ if __name__ == "__main__":
         default=None,
         help="Path to save results (auto-generated if not provided)",
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Strategy H only: run background compressions through the OpenAI Batch API "
+             "(collects summaries and salience accuracy only; no goal/constraint metrics)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Strategy H only: number of worker processes to run trials in",
+    )
     
     args = parser.parse_args()
     
@@ -550,6 +687,8 @@ if __name__ == "__main__":
             template_path=args.template,
             num_trials=args.trials,
             output_path=args.output,
+            batch_mode=args.batch,
+            workers=args.workers,
         )
     else:
         run_baseline_evaluation(
@@ -0,0 +1,143 @@
+"""
+Judge Cache
+
+Response cache for the LLM-as-judge constraint checks in metrics.py.
+
+The constraint judge is effectively deterministic, and the same
+(constraint, response) pairs come up again and again across compression
+points, trials and re-runs of the granular metrics scripts. Verdicts are
+keyed on a SHA-256 of the constraint, response, judge model and a version
+of the judge prompt (so a reworded rubric, or the batch judge's different
+prompt, never reuses another prompt's verdicts). They are kept in memory,
+or on disk when diskcache is installed and a directory is given.
+
+metrics.py creates one on import when INSTINCT8_JUDGE_CACHE names a
+directory; set_judge_cache() installs one programmatically.
+
+An optional semantic layer reuses a verdict when a new response embeds
+within `semantic_threshold` cosine similarity of a cached response for the
+same constraint. It is off by default, because near-identical responses can
+still differ on the detail being judged (e.g. "$10K" vs "$20K").
+"""
+
+import hashlib
+import json
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+
+def judge_cache_key(constraint: str, response: str, model: str, prompt_version: str = "") -> str:
+    """Exact-match cache key for a judge verdict under one judge prompt."""
+    payload = json.dumps(
+        {"c": constraint, "r": response, "model": model, "p": prompt_version}, sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class JudgeCache:
+    """
+    Exact (and optionally semantic) cache of constraint judge verdicts.
+
+    Safe to share across the threads used by
+    metrics._constraints_mentioned_concurrent.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        embed_fn: Optional[Callable[[str], np.ndarray]] = None,
+        semantic_threshold: float = 0.92,
+    ):
+        """
+        Initialize the judge cache.
+
+        Args:
+            directory: Persist verdicts here with diskcache (in-memory if None
+                or diskcache is not installed)
+            embed_fn: Maps a response to an embedding vector; enables the
+                semantic layer when given
+            semantic_threshold: Minimum cosine similarity for a semantic hit
+        """
+        if directory and DISKCACHE_AVAILABLE:
+            self._store = diskcache.Cache(directory)
+        else:
+            if directory:
+                print("[judge_cache] diskcache not installed, using in-memory cache")
+            self._store: Dict[str, bool] = {}
+
+        self.embed_fn = embed_fn
+        self.semantic_threshold = semantic_threshold
+        # (constraint, model, prompt_version) -> (unit-normalized response embeddings, verdicts)
+        self._semantic: Dict[Tuple[str, str, str], Tuple[List[np.ndarray], List[bool]]] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    def _embed(self, response: str) -> np.ndarray:
+        vector = np.asarray(self.embed_fn(response), dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(
+        self, constraint: str, response: str, model: str, prompt_version: str = ""
+    ) -> Optional[bool]:
+        """Return the cached verdict, or None on a miss."""
+        key = judge_cache_key(constraint, response, model, prompt_version)
+        verdict = self._store.get(key)
+        if verdict is not None:
+            with self._lock:
+                self.hits += 1
+            return verdict
+
+        if self.embed_fn is not None:
+            entries = self._semantic.get((constraint, model, prompt_version))
+            if entries and entries[0]:
+                query = self._embed(response)
+                with self._lock:
+                    matrix = np.stack(entries[0])
+                    verdicts = list(entries[1])
+                similarities = matrix @ query
+                best = int(np.argmax(similarities))
+                if similarities[best] >= self.semantic_threshold:
+                    with self._lock:
+                        self.semantic_hits += 1
+                    return verdicts[best]
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(
+        self, constraint: str, response: str, model: str, verdict: bool, prompt_version: str = ""
+    ) -> None:
+        """Store a verdict for (constraint, response, model, prompt_version)."""
+        self._store[judge_cache_key(constraint, response, model, prompt_version)] = verdict
+
+        if self.embed_fn is not None:
+            embedding = self._embed(response)
+            with self._lock:
+                embeddings, verdicts = self._semantic.setdefault(
+                    (constraint, model, prompt_version), ([], [])
+                )
+                embeddings.append(embedding)
+                verdicts.append(verdict)
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters for telemetry."""
+        lookups = self.hits + self.semantic_hits + self.misses
+        return {
+            "hits": self.hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.semantic_hits) / lookups if lookups else 0.0,
+        }
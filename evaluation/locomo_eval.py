@@ -17,6 +17,7 @@ import sys
 import json
 import random
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional, Any, Tuple
 from dataclasses import dataclass, field
@@ -30,6 +31,8 @@ sys.path.insert(0, str(AMEM_PATH))
 from load_dataset import load_locomo_dataset, LoCoMoSample, QA
 from utils import calculate_metrics, aggregate_metrics
 
+from evaluation.openai_batch import run_openai_batch
+
 
 @dataclass
 class LoCoMoResult:
@@ -127,24 +130,75 @@ class CodexLoCoMoAgent:
         """Estimate token count (4 chars per token heuristic)."""
         return len(text) // 4
 
-    def _get_completion(self, prompt: str, temperature: float = 0.7) -> str:
-        """Get LLM completion."""
+    def _get_completion(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        cached_prefix: str = "",
+    ) -> str:
+        """
+        Get LLM completion for cached_prefix + prompt.
+
+        cached_prefix is the part shared by every question on a sample (the
+        conversation context). OpenAI caches it automatically as long as it
+        is byte-identical and comes first; for Anthropic it is sent as its
+        own content block marked with cache_control.
+        """
         if self.llm_backend == "openai":
             response = self.client.chat.completions.create(
-                model=self.llm_model,
-                temperature=temperature,
-                messages=[{"role": "user", "content": prompt}],
-                response_format={"type": "json_object"}
+                **self._openai_request_body(cached_prefix + prompt, temperature)
             )
             return response.choices[0].message.content
         else:
+            if cached_prefix:
+                content = [
+                    {
+                        "type": "text",
+                        "text": cached_prefix,
+                        "cache_control": {"type": "ephemeral"},
+                    },
+                    {"type": "text", "text": prompt},
+                ]
+            else:
+                content = prompt
             response = self.client.messages.create(
                 model=self.llm_model,
                 max_tokens=500,
-                messages=[{"role": "user", "content": prompt}]
+                messages=[{"role": "user", "content": content}]
             )
             return response.content[0].text
 
+    def _openai_request_body(self, prompt: str, temperature: float) -> Dict[str, Any]:
+        """Chat completion parameters for a question prompt (also used for batch requests)."""
+        return {
+            "model": self.llm_model,
+            "temperature": temperature,
+            "messages": [{"role": "user", "content": prompt}],
+            "response_format": {"type": "json_object"},
+        }
+
+    def batch_request(
+        self,
+        custom_id: str,
+        question: str,
+        category: int,
+        reference_answer: str,
+    ) -> Dict[str, Any]:
+        """
+        Build an OpenAI Batch API request line for a question.
+
+        The body is the same one answer_question sends synchronously.
+        """
+        context_prefix, question_prompt, temperature = self._build_question_prompt(
+            question, category, reference_answer, self.get_context_text()
+        )
+        return {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": self._openai_request_body(context_prefix + question_prompt, temperature),
+        }
+
     def reset(self):
         """Reset agent state for new sample."""
         self.context = []
@@ -202,26 +256,23 @@ class CodexLoCoMoAgent:
                 parts.append(turn['content'])
         return "\n".join(parts)
 
-    def answer_question(
+    def _build_question_prompt(
         self,
         question: str,
         category: int,
-        reference_answer: str
-    ) -> Tuple[str, str, str]:
+        reference_answer: str,
+        context: str,
+    ) -> Tuple[str, str, float]:
         """
-        Answer a question using the current context.
-
-        This mirrors A-mem's answer_question interface.
-
-        Args:
-            question: The question to answer
-            category: LoCoMo category (1-5)
-            reference_answer: Ground truth (used for category 5)
+        Build the prompt for a question over the given context text.
 
         Returns:
-            Tuple of (prediction, user_prompt, context_used)
+            Tuple of (context_prefix, question_prompt, temperature)
         """
-        context = self.get_context_text()
+
+        # Every prompt opens with the same context so that, across the
+        # questions on a sample, it forms a cacheable prompt prefix
+        context_prefix = f"Based on the context: {context}, "
 
         # Build prompt based on category (matching A-mem's prompts)
         if category == 5:  # Adversarial
@@ -229,7 +280,7 @@ class CodexLoCoMoAgent:
             if random.random() < 0.5:
                 answer_options.reverse()
 
-            user_prompt = f"""Based on the context: {context}, answer the following question. {question}
+            question_prompt = f"""answer the following question. {question}
 
 Select the correct answer: {answer_options[0]} or {answer_options[1]}
 
@@ -237,7 +288,7 @@ Respond with JSON: {{"answer": "your answer"}}"""
             temperature = 0.5
 
         elif category == 2:  # Temporal
-            user_prompt = f"""Based on the context: {context}, answer the following question. Use DATE of CONVERSATION to answer with an approximate date.
+            question_prompt = f"""answer the following question. Use DATE of CONVERSATION to answer with an approximate date.
 Please generate the shortest possible answer, using words from the conversation where possible, and avoid using any subjects.
 
 Question: {question}
@@ -246,7 +297,7 @@ Respond with JSON: {{"answer": "your answer"}}"""
             temperature = 0.7
 
         elif category == 3:  # Open-domain
-            user_prompt = f"""Based on the context: {context}, write an answer in the form of a short phrase for the following question. Answer with exact words from the context whenever possible.
+            question_prompt = f"""write an answer in the form of a short phrase for the following question. Answer with exact words from the context whenever possible.
 
 Question: {question}
 
@@ -254,28 +305,67 @@ Respond with JSON: {{"answer": "your answer"}}"""
             temperature = 0.7
 
         else:  # Category 1 (single-hop) and 4 (multi-hop)
-            user_prompt = f"""Based on the context: {context}, write an answer in the form of a short phrase for the following question. Answer with exact words from the context whenever possible.
+            question_prompt = f"""write an answer in the form of a short phrase for the following question. Answer with exact words from the context whenever possible.
 
 Question: {question}
 
 Respond with JSON: {{"answer": "your answer"}}"""
             temperature = 0.7
 
+        return context_prefix, question_prompt, temperature
+
+    def answer_question(
+        self,
+        question: str,
+        category: int,
+        reference_answer: str
+    ) -> Tuple[str, str, str]:
+        """
+        Answer a question using the current context.
+
+        This mirrors A-mem's answer_question interface.
+
+        Args:
+            question: The question to answer
+            category: LoCoMo category (1-5)
+            reference_answer: Ground truth (used for category 5)
+
+        Returns:
+            Tuple of (prediction, user_prompt, context_used)
+        """
+        context = self.get_context_text()
+        context_prefix, question_prompt, temperature = self._build_question_prompt(
+            question, category, reference_answer, context
+        )
+
         # Get prediction
-        response = self._get_completion(user_prompt, temperature)
+        user_prompt = context_prefix + question_prompt
+        response = self._get_completion(question_prompt, temperature, cached_prefix=context_prefix)
 
-        try:
-            prediction = json.loads(response)["answer"]
-        except (json.JSONDecodeError, KeyError):
-            prediction = response.strip()
+        return parse_prediction(response), user_prompt, context
 
-        return prediction, user_prompt, context
 
+def parse_prediction(response: str) -> str:
+    """Extract the answer from a JSON completion, falling back to the raw text."""
+    try:
+        return json.loads(response)["answer"]
+    except (json.JSONDecodeError, KeyError, TypeError):
+        return response.strip()
 
-def setup_logger(log_file: Optional[str] = None) -> logging.Logger:
-    """Set up logging configuration."""
-    logger = logging.getLogger('locomo_codex_eval')
+
+def setup_logger(
+    log_file: Optional[str] = None,
+    name: str = 'locomo_codex_eval',
+) -> logging.Logger:
+    """
+    Set up logging configuration.
+
+    Each concurrently evaluated strategy should pass its own logger name so
+    runs don't clear each other's handlers.
+    """
+    logger = logging.getLogger(name)
     logger.setLevel(logging.INFO)
+    logger.propagate = False
 
     # Clear existing handlers
     logger.handlers = []
@@ -307,10 +397,17 @@ def evaluate_codex_on_locomo(
     ratio: float = 1.0,
     categories: Optional[List[int]] = None,
     verbose: bool = True,
+    max_concurrent: int = 1,
+    use_batch_api: bool = False,
 ) -> LoCoMoEvalResults:
     """
     Evaluate a Codex agent with given strategy on LoCoMo benchmark.
 
+    Once a sample's conversation has been loaded into memory, its questions
+    only read the (fixed) context. The first question is answered on its own
+    to warm the provider's prompt cache for that context; the rest are then
+    answered up to max_concurrent at a time on a thread pool.
+
     Args:
         strategy: Compression strategy to use
         dataset_path: Path to LoCoMo dataset JSON
@@ -321,6 +418,10 @@ def evaluate_codex_on_locomo(
         ratio: Fraction of dataset to evaluate (0.0-1.0)
         categories: List of categories to evaluate (1-5), None for all
         verbose: Print progress
+        max_concurrent: Max questions answered at once per sample (1 = sequential)
+        use_batch_api: Queue every question into one OpenAI Batch API job
+            (half price, results within the 24h window) instead of answering
+            synchronously; openai backend only
 
     Returns:
         LoCoMoEvalResults with full evaluation data
@@ -329,7 +430,7 @@ def evaluate_codex_on_locomo(
     timestamp = datetime.now().strftime("%Y-%m-%d-%H-%M")
     log_dir = Path(__file__).parent.parent / "logs"
     log_file = log_dir / f"locomo_codex_{strategy.name()}_{timestamp}.log"
-    logger = setup_logger(str(log_file))
+    logger = setup_logger(str(log_file), name=f"locomo_codex_eval.{strategy.name()}")
 
     if verbose:
         print(f"\n{'='*60}")
@@ -360,6 +461,9 @@ def evaluate_codex_on_locomo(
         compression_threshold=compression_threshold,
     )
 
+    if use_batch_api and llm_backend != "openai":
+        raise ValueError("The Batch API is only available with the openai backend")
+
     # Evaluation storage
     results: List[Dict] = []
     all_metrics: List[Dict[str, float]] = []
@@ -369,6 +473,49 @@ def evaluate_codex_on_locomo(
     total_compression_events = 0
     context_sizes: List[int] = []
 
+    # Batch API mode: questions are queued here and answered after the loop
+    batch_requests: List[Dict[str, Any]] = []
+    batch_pending: List[Tuple[int, Any, int, int]] = []
+
+    def record(sample_idx: int, qa, prediction, context_tokens: int, compressions: int) -> None:
+        """Score one prediction and store its result."""
+        nonlocal total_questions
+        total_questions += 1
+        category_counts[qa.category] += 1
+
+        # Calculate metrics (convert to strings for metric calculation)
+        ref_str = str(qa.final_answer) if qa.final_answer is not None else ""
+        pred_str = str(prediction) if prediction is not None else ""
+        metrics = calculate_metrics(pred_str, ref_str) if ref_str else {
+            "exact_match": 0, "f1": 0.0, "rouge1_f": 0.0, "rouge2_f": 0.0,
+            "rougeL_f": 0.0, "bleu1": 0.0, "bleu2": 0.0, "bleu3": 0.0,
+            "bleu4": 0.0, "bert_f1": 0.0, "meteor": 0.0, "sbert_similarity": 0.0
+        }
+
+        all_metrics.append(metrics)
+        all_categories.append(qa.category)
+        context_sizes.append(context_tokens)
+
+        # Store result
+        result = {
+            "sample_id": sample_idx,
+            "question": qa.question,
+            "prediction": pred_str,
+            "reference": ref_str,
+            "category": qa.category,
+            "metrics": metrics,
+            "context_tokens": context_tokens,
+            "compressions": compressions,
+        }
+        results.append(result)
+
+        if verbose and total_questions % 10 == 0:
+            print(f"  Processed {total_questions} questions...")
+
+        logger.info(f"Q{total_questions} [Cat {qa.category}]: {qa.question[:50]}...")
+        logger.info(f"  Pred: {str(prediction)[:100]}...")
+        logger.info(f"  Ref: {str(qa.final_answer)[:100] if qa.final_answer else 'N/A'}...")
+
     # Evaluate each sample
     for sample_idx, sample in enumerate(samples):
         if verbose:
@@ -392,55 +539,41 @@ def evaluate_codex_on_locomo(
         logger.info(f"Sample {sample_idx}: Added {len(agent.context)} turns, "
                    f"{agent.compression_count} compressions")
 
-        # Answer each QA
-        for qa in sample.qa:
-            if qa.category not in allowed_categories:
-                continue
-
-            total_questions += 1
-            category_counts[qa.category] += 1
+        # Answer each QA (the context is fixed from here on, so the
+        # completions can run concurrently)
+        sample_qas = [qa for qa in sample.qa if qa.category in allowed_categories]
+        total_compression_events += agent.compression_count
 
-            # Get prediction
-            prediction, prompt, context_used = agent.answer_question(
-                qa.question,
-                qa.category,
-                qa.final_answer
-            )
+        if use_batch_api:
+            for qa_idx, qa in enumerate(sample_qas):
+                batch_requests.append(agent.batch_request(
+                    f"sample-{sample_idx}-qa-{qa_idx}", qa.question, qa.category, qa.final_answer
+                ))
+                batch_pending.append((sample_idx, qa, agent.total_tokens, agent.compression_count))
+            continue
+
+        def answer(qa):
+            return agent.answer_question(qa.question, qa.category, qa.final_answer)
+
+        workers = min(max_concurrent, len(sample_qas) - 1)
+        if workers > 1:
+            # The first question goes alone so the provider caches the shared
+            # conversation prefix; the rest then fan out and hit that cache
+            answers = [answer(sample_qas[0])]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                answers.extend(executor.map(answer, sample_qas[1:]))
+        else:
+            answers = [answer(qa) for qa in sample_qas]
 
-            # Calculate metrics (convert to strings for metric calculation)
-            ref_str = str(qa.final_answer) if qa.final_answer is not None else ""
-            pred_str = str(prediction) if prediction is not None else ""
-            metrics = calculate_metrics(pred_str, ref_str) if ref_str else {
-                "exact_match": 0, "f1": 0.0, "rouge1_f": 0.0, "rouge2_f": 0.0,
-                "rougeL_f": 0.0, "bleu1": 0.0, "bleu2": 0.0, "bleu3": 0.0,
-                "bleu4": 0.0, "bert_f1": 0.0, "meteor": 0.0, "sbert_similarity": 0.0
-            }
-
-            all_metrics.append(metrics)
-            all_categories.append(qa.category)
-            context_sizes.append(agent.total_tokens)
-
-            # Store result
-            result = {
-                "sample_id": sample_idx,
-                "question": qa.question,
-                "prediction": pred_str,
-                "reference": ref_str,
-                "category": qa.category,
-                "metrics": metrics,
-                "context_tokens": agent.total_tokens,
-                "compressions": agent.compression_count,
-            }
-            results.append(result)
-
-            if verbose and total_questions % 10 == 0:
-                print(f"  Processed {total_questions} questions...")
-
-            logger.info(f"Q{total_questions} [Cat {qa.category}]: {qa.question[:50]}...")
-            logger.info(f"  Pred: {str(prediction)[:100]}...")
-            logger.info(f"  Ref: {str(qa.final_answer)[:100] if qa.final_answer else 'N/A'}...")
+        for qa, (prediction, prompt, context_used) in zip(sample_qas, answers):
+            record(sample_idx, qa, prediction, agent.total_tokens, agent.compression_count)
 
-        total_compression_events += agent.compression_count
+    if batch_requests:
+        logger.info(f"Submitting {len(batch_requests)} questions to the Batch API")
+        outputs = run_openai_batch(agent.client, batch_requests, logger=logger)
+        for request, (sample_idx, qa, context_tokens, compressions) in zip(batch_requests, batch_pending):
+            prediction = parse_prediction(outputs.get(request["custom_id"], ""))
+            record(sample_idx, qa, prediction, context_tokens, compressions)
 
     # Aggregate metrics
     aggregate_results = aggregate_metrics(all_metrics, all_categories)
@@ -492,10 +625,17 @@ def compare_strategies_on_locomo(
     llm_backend: str = "openai",
     llm_model: str = "gpt-4o-mini",
     ratio: float = 0.1,
+    max_parallel_strategies: int = 1,
+    max_concurrent: int = 1,
+    use_batch_api: bool = False,
 ) -> Dict[str, LoCoMoEvalResults]:
     """
     Compare multiple strategies on LoCoMo benchmark.
 
+    Each strategy's evaluation is an independent, I/O-bound sequence of LLM
+    calls, so with max_parallel_strategies > 1 they run concurrently on a
+    thread pool (each strategy gets its own agent, client, and logger).
+
     Args:
         strategies: List of compression strategies to compare
         dataset_path: Path to LoCoMo dataset
@@ -503,14 +643,16 @@ def compare_strategies_on_locomo(
         llm_backend: LLM backend
         llm_model: Model name
         ratio: Fraction of dataset to use
+        max_parallel_strategies: Max strategies evaluated at once (1 = sequential)
+        max_concurrent: Max questions answered at once per sample within a strategy
+        use_batch_api: Answer each strategy's questions with one Batch API job
 
     Returns:
         Dict mapping strategy names to their results
     """
     os.makedirs(output_dir, exist_ok=True)
-    results = {}
 
-    for strategy in strategies:
+    def evaluate_strategy(strategy) -> LoCoMoEvalResults:
         print(f"\n{'#'*60}")
         print(f"# Evaluating: {strategy.name()}")
         print(f"{'#'*60}")
@@ -520,16 +662,28 @@ def compare_strategies_on_locomo(
             f"locomo_{strategy.name().replace(' ', '_')}.json"
         )
 
-        eval_results = evaluate_codex_on_locomo(
+        return evaluate_codex_on_locomo(
             strategy=strategy,
             dataset_path=dataset_path,
             output_path=output_path,
             llm_backend=llm_backend,
             llm_model=llm_model,
             ratio=ratio,
+            max_concurrent=max_concurrent,
+            use_batch_api=use_batch_api,
         )
 
-        results[strategy.name()] = eval_results
+    workers = min(max_parallel_strategies, len(strategies))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            evaluated = list(executor.map(evaluate_strategy, strategies))
+    else:
+        evaluated = [evaluate_strategy(strategy) for strategy in strategies]
+
+    results = {
+        strategy.name(): eval_results
+        for strategy, eval_results in zip(strategies, evaluated)
+    }
 
     # Print comparison summary
     print(f"\n{'='*60}")
@@ -10,16 +10,23 @@ All metrics use LLM-as-judge with clear rubrics. Supports both OpenAI and Anthro
 """
 
 from typing import Any, Dict, List, Optional, Protocol, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+import hashlib
 import json
 import os
+import threading
 
 # Import sentence transformers for salience accuracy
 from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
+import joblib
 import numpy as np
 
+from .goal_tracking import get_current_goal_at_turn
+from .judge_cache import JudgeCache
+
 # Optional import for granular metrics
 try:
     from .granular_constraint_metrics import (
@@ -39,21 +46,68 @@ class LLMClient(Protocol):
         ...
 
 
+# Connection pool for the judge client; sized to JUDGE_MAX_CONCURRENCY
+# bursts with headroom for scripts that share the client
+HTTP_POOL_SIZE = 50
+
+
+def _make_http_client() -> Any:
+    """
+    Build a pooled httpx client for the OpenAI SDK, or None if httpx is missing.
+
+    Keep-alive connections let consecutive judge calls skip the TCP/TLS
+    handshake; HTTP/2 is enabled when the optional h2 package is installed.
+    """
+    try:
+        import httpx
+    except ImportError:
+        return None
+
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+
+    return httpx.Client(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=HTTP_POOL_SIZE,
+            max_keepalive_connections=HTTP_POOL_SIZE,
+        ),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    )
+
+
 class OpenAIClient:
     """OpenAI API client wrapper."""
     def __init__(self, model: str = "gpt-4o-mini"):
         try:
             from openai import OpenAI
-            self.client = OpenAI()
-            self.model = model
         except ImportError:
             raise ImportError("OpenAI package not installed. Run: pip install openai")
 
-    def complete(self, prompt: str, max_tokens: int = 100) -> str:
+        http_client = _make_http_client()
+        try:
+            self.client = OpenAI(http_client=http_client) if http_client else OpenAI()
+        except TypeError:
+            # SDK built on a different HTTP stack; use its default pool
+            http_client.close()
+            self.client = OpenAI()
+        self.model = model
+
+    # complete() accepts a separate system prompt (see _constraint_mentioned)
+    supports_system_prompt = True
+
+    def complete(self, prompt: str, max_tokens: int = 100, system: str = "") -> str:
+        # A stable leading system message is what OpenAI's automatic
+        # prefix cache matches on
+        messages = [{"role": "system", "content": system}] if system else []
+        messages.append({"role": "user", "content": prompt})
         response = self.client.chat.completions.create(
             model=self.model,
             max_tokens=max_tokens,
-            messages=[{"role": "user", "content": prompt}]
+            messages=messages
         )
         return response.choices[0].message.content.strip()
 
@@ -65,25 +119,55 @@ class AnthropicClient:
             from anthropic import Anthropic
             self.client = Anthropic()
             self.model = model
+            # Running total of prompt-cache reads, to check the rubric cache hits
+            self.cache_read_input_tokens = 0
         except ImportError:
             raise ImportError("Anthropic package not installed. Run: pip install anthropic")
 
-    def complete(self, prompt: str, max_tokens: int = 100) -> str:
+    supports_system_prompt = True
+
+    def complete(self, prompt: str, max_tokens: int = 100, system: str = "") -> str:
+        kwargs: Dict[str, Any] = {}
+        if system:
+            # Cache breakpoint after the static rubric
+            kwargs["system"] = [
+                {"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}
+            ]
         response = self.client.messages.create(
             model=self.model,
             max_tokens=max_tokens,
-            messages=[{"role": "user", "content": prompt}]
+            messages=[{"role": "user", "content": prompt}],
+            **kwargs,
         )
+        self.cache_read_input_tokens += getattr(response.usage, "cache_read_input_tokens", None) or 0
         return response.content[0].text.strip()
 
 
 # Initialize client at module level (will be reused)
 _client: Optional[LLMClient] = None
+_client_lock = threading.Lock()
 _backend: str = "auto"  # "auto", "openai", or "anthropic"
 
 # Initialize embedding model for salience accuracy (will be reused)
+EMBEDDING_MODEL_NAME = 'all-MiniLM-L6-v2'
 _embedding_model: Optional[SentenceTransformer] = None
 
+# Embeddings are deterministic per (model, texts), so they are memoized on
+# disk across runs; override the location with INSTINCT8_EMBEDDING_CACHE
+EMBEDDING_CACHE_DIR = os.environ.get(
+    "INSTINCT8_EMBEDDING_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "instinct8", "embeddings"),
+)
+_embedding_memory: Optional[joblib.Memory] = None
+_embed_cached = None
+
+# Optional cache of constraint judge verdicts: disabled unless set with
+# set_judge_cache() or INSTINCT8_JUDGE_CACHE names a directory to persist to
+_judge_cache: Optional[JudgeCache] = (
+    JudgeCache(os.environ["INSTINCT8_JUDGE_CACHE"])
+    if os.environ.get("INSTINCT8_JUDGE_CACHE") else None
+)
+
 
 def set_metrics_backend(backend: str = "auto", model: Optional[str] = None) -> None:
     """
@@ -98,13 +182,38 @@ def set_metrics_backend(backend: str = "auto", model: Optional[str] = None) -> N
     _client = None  # Reset client to be recreated with new settings
 
 
+def set_judge_cache(cache: Optional[JudgeCache]) -> None:
+    """
+    Enable (or, with None, disable) caching of constraint judge verdicts.
+
+    Args:
+        cache: JudgeCache shared by all _constraint_mentioned calls
+    """
+    global _judge_cache
+    _judge_cache = cache
+
+
 def _get_client() -> LLMClient:
-    """Get or create the LLM client based on available API keys."""
-    global _client, _backend
+    """
+    Get or create the LLM client based on available API keys.
 
+    The client is a process-wide singleton (until set_metrics_backend resets
+    it), so every metric and script shares one connection pool.
+    """
     if _client is not None:
         return _client
 
+    # Concurrent judge threads must not each build their own client
+    with _client_lock:
+        if _client is None:
+            return _create_client()
+        return _client
+
+
+def _create_client() -> LLMClient:
+    """Create the LLM client for the configured backend."""
+    global _client
+
     if _backend == "auto":
         # Try OpenAI first, then Anthropic
         if os.environ.get("OPENAI_API_KEY"):
@@ -143,10 +252,33 @@ def _get_embedding_model() -> SentenceTransformer:
     """Get or create the sentence transformer model."""
     global _embedding_model
     if _embedding_model is None:
-        _embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
+        _embedding_model = SentenceTransformer(EMBEDDING_MODEL_NAME)
     return _embedding_model
 
 
+def _encode_texts(texts: Tuple[str, ...], model_name: str = EMBEDDING_MODEL_NAME) -> np.ndarray:
+    """Embed texts with the sentence transformer."""
+    if model_name == EMBEDDING_MODEL_NAME:
+        model = _get_embedding_model()
+    else:
+        model = SentenceTransformer(model_name)
+    return model.encode(list(texts), show_progress_bar=False)
+
+
+def _embed(texts: Tuple[str, ...], model_name: str = EMBEDDING_MODEL_NAME) -> np.ndarray:
+    """
+    Embed texts, memoized on disk per model and texts.
+
+    The joblib cache (and its directory) is created on the first call, so
+    importing this module does not touch EMBEDDING_CACHE_DIR.
+    """
+    global _embedding_memory, _embed_cached
+    if _embed_cached is None:
+        _embedding_memory = joblib.Memory(location=EMBEDDING_CACHE_DIR, mmap_mode="r", verbose=0)
+        _embed_cached = _embedding_memory.cache(_encode_texts)
+    return _embed_cached(texts, model_name)
+
+
 def measure_goal_coherence(
     original_goal: str,
     stated_goal: str,
@@ -262,13 +394,47 @@ def measure_constraint_recall(
         return 0.0  # Agent stated nothing
     
     client = _get_client()
-    recalled_count = 0
-    
-    for constraint in known_constraints:
-        if _constraint_mentioned(constraint, stated_constraints, client, model):
-            recalled_count += 1
+    mentioned = _constraints_mentioned_concurrent(
+        [(constraint, stated_constraints) for constraint in known_constraints],
+        client,
+        model,
+    )
     
-    return recalled_count / len(known_constraints)
+    return sum(mentioned) / len(known_constraints)
+
+
+# Fixed instructions for _constraint_mentioned; only the constraint and
+# statement vary between judge calls
+CONSTRAINT_JUDGE_RUBRIC = """Does this statement mention or imply this constraint?
+
+Consider:
+- Direct mentions count
+- Paraphrased versions count (e.g., "budget of 10 thousand" = "max $10K")
+- Implicit references count (e.g., "tight budget" if the constraint is about cost)
+
+Respond with ONLY "yes" or "no"."""
+
+# Prompt for _constraint_mentioned_batch
+CONSTRAINT_JUDGE_BATCH_PROMPT = """For each constraint below, does this statement mention or imply it?
+
+Agent's Statement: "{stated_text}"
+
+Constraints:
+{numbered}
+
+Consider:
+- Direct mentions count
+- Paraphrased versions count (e.g., "budget of 10 thousand" = "max $10K")
+- Implicit references count (e.g., "tight budget" if the constraint is about cost)
+
+Respond with ONLY a JSON array of {count} booleans in constraint order (e.g., [true, false])."""
+
+# Judge cache namespaces: verdicts are only reused under the exact prompt
+# that produced them
+JUDGE_PROMPT_VERSION = hashlib.sha256(CONSTRAINT_JUDGE_RUBRIC.encode("utf-8")).hexdigest()[:16]
+BATCH_JUDGE_PROMPT_VERSION = "batch:" + hashlib.sha256(
+    CONSTRAINT_JUDGE_BATCH_PROMPT.encode("utf-8")
+).hexdigest()[:16]
 
 
 def _constraint_mentioned(
@@ -280,31 +446,125 @@ def _constraint_mentioned(
     """
     Check if a specific constraint is mentioned in the stated text.
 
-    Uses fuzzy matching via LLM to handle paraphrasing.
+    Uses fuzzy matching via LLM to handle paraphrasing. The fixed rubric is
+    sent as a system prompt where the client supports it, so providers can
+    serve it from their prompt cache across judge calls.
     """
-    prompt = f"""Does this statement mention or imply this constraint?
+    details = f'Constraint: "{constraint}"\n\nAgent\'s Statement: "{stated_text}"'
 
-Constraint: "{constraint}"
-
-Agent's Statement: "{stated_text}"
-
-Consider:
-- Direct mentions count
-- Paraphrased versions count (e.g., "budget of 10 thousand" = "max $10K")
-- Implicit references count (e.g., "tight budget" if the constraint is about cost)
-
-Respond with ONLY "yes" or "no"."""
+    if _judge_cache is not None:
+        cached = _judge_cache.get(constraint, stated_text, model, JUDGE_PROMPT_VERSION)
+        if cached is not None:
+            return cached
 
     try:
-        answer = client.complete(prompt, max_tokens=5)
+        if getattr(client, "supports_system_prompt", False):
+            answer = client.complete(details, max_tokens=5, system=CONSTRAINT_JUDGE_RUBRIC)
+        else:
+            answer = client.complete(f"{CONSTRAINT_JUDGE_RUBRIC}\n\n{details}", max_tokens=5)
         if not answer:
             return False
-        return "yes" in answer.lower()
+        verdict = "yes" in answer.lower()
 
     except Exception as e:
         print(f"[metrics] Error checking constraint: {e}")
         return False
 
+    if _judge_cache is not None:
+        _judge_cache.set(constraint, stated_text, model, verdict, JUDGE_PROMPT_VERSION)
+    return verdict
+
+
+# Max in-flight judge requests (keeps bursts under typical RPM limits)
+JUDGE_MAX_CONCURRENCY = 10
+
+
+def _constraints_mentioned_concurrent(
+    checks: List[Tuple[str, str]],
+    client: LLMClient,
+    model: str,
+    max_workers: int = JUDGE_MAX_CONCURRENCY,
+) -> List[bool]:
+    """
+    Run _constraint_mentioned over (constraint, stated_text) pairs concurrently.
+
+    Judge calls are network-bound, so running them on a small thread pool
+    collapses wall-clock time to roughly one round-trip per batch of
+    max_workers checks. Results are returned in input order.
+    """
+    if not checks:
+        return []
+    if len(checks) == 1:
+        constraint, stated_text = checks[0]
+        return [_constraint_mentioned(constraint, stated_text, client, model)]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(checks))) as executor:
+        return list(executor.map(
+            lambda check: _constraint_mentioned(check[0], check[1], client, model),
+            checks,
+        ))
+
+
+def _constraint_mentioned_batch(
+    constraints: List[str],
+    stated_text: str,
+    client: LLMClient,
+    model: str,
+) -> List[bool]:
+    """
+    Check several constraints against one statement in a single judge call.
+
+    The rubric and statement are sent once and the judge returns a JSON
+    array of booleans, one per constraint. If the answer can't be parsed
+    into exactly len(constraints) booleans, falls back to one concurrent
+    _constraint_mentioned call per constraint.
+    """
+    if not constraints:
+        return []
+
+    results: List[Optional[bool]] = [None] * len(constraints)
+    if _judge_cache is not None:
+        for i, constraint in enumerate(constraints):
+            results[i] = _judge_cache.get(constraint, stated_text, model, BATCH_JUDGE_PROMPT_VERSION)
+    pending = [i for i, verdict in enumerate(results) if verdict is None]
+    if not pending:
+        return results
+
+    numbered = "\n".join(
+        f'{n}. "{constraints[i]}"' for n, i in enumerate(pending, start=1)
+    )
+    prompt = CONSTRAINT_JUDGE_BATCH_PROMPT.format(
+        stated_text=stated_text, numbered=numbered, count=len(pending)
+    )
+
+    verdicts = None
+    try:
+        answer = client.complete(prompt, max_tokens=10 + 4 * len(pending))
+        start, end = answer.find("["), answer.rfind("]")
+        parsed = json.loads(answer[start:end + 1]) if start != -1 else None
+        if (
+            isinstance(parsed, list)
+            and len(parsed) == len(pending)
+            and all(isinstance(v, bool) for v in parsed)
+        ):
+            verdicts = parsed
+        else:
+            print("[metrics] Batch judge answer malformed, judging constraints individually")
+    except Exception as e:
+        print(f"[metrics] Error in batch constraint check: {e}")
+
+    if verdicts is None:
+        verdicts = _constraints_mentioned_concurrent(
+            [(constraints[i], stated_text) for i in pending], client, model
+        )
+    elif _judge_cache is not None:
+        for i, verdict in zip(pending, verdicts):
+            _judge_cache.set(constraints[i], stated_text, model, verdict, BATCH_JUDGE_PROMPT_VERSION)
+
+    for i, verdict in zip(pending, verdicts):
+        results[i] = verdict
+    return results
+
 
 def measure_salience_accuracy(
     extracted_salience: List[str],
@@ -345,12 +605,9 @@ def measure_salience_accuracy(
         return {"precision": 0.0, "recall": 0.0, "f1": 0.0}
     
     try:
-        # Get embedding model
-        embedding_model = _get_embedding_model()
-        
-        # Generate embeddings
-        extracted_embeddings = embedding_model.encode(extracted_salience, show_progress_bar=False)
-        ground_truth_embeddings = embedding_model.encode(ground_truth_salience, show_progress_bar=False)
+        # Generate embeddings (cached across runs)
+        extracted_embeddings = _embed(tuple(extracted_salience))
+        ground_truth_embeddings = _embed(tuple(ground_truth_salience))
         
         # Calculate similarity matrix
         similarity_matrix = cosine_similarity(extracted_embeddings, ground_truth_embeddings)
@@ -612,6 +869,7 @@ class MetricsCollector:
         self.drift_threshold = drift_threshold
         self.use_granular_metrics = use_granular_metrics and GRANULAR_METRICS_AVAILABLE
         self.goal_timeline = goal_timeline or {}
+        self._timeline_turns = sorted(self.goal_timeline)
         self.compression_points: List[CompressionPointMetrics] = []
         self.granular_metrics_before: List[GranularConstraintMetrics] = []
         self.granular_metrics_after: List[GranularConstraintMetrics] = []
@@ -681,13 +939,9 @@ class MetricsCollector:
             CompressionPointMetrics with all measurements
         """
         # Determine current goal at this turn (for goal shift scenarios)
-        current_goal = self.original_goal
-        if self.goal_timeline:
-            # Find the most recent goal state before or at this turn
-            relevant_turns = [t for t in self.goal_timeline.keys() if t <= turn_id]
-            if relevant_turns:
-                latest_turn = max(relevant_turns)
-                current_goal = self.goal_timeline[latest_turn][0]
+        current_goal = get_current_goal_at_turn(
+            turn_id, self.goal_timeline, self.original_goal, self._timeline_turns
+        )
         
         # Measure goal coherence against ORIGINAL goal (for baseline comparison)
         goal_coherence_original_before = measure_goal_coherence(
@@ -0,0 +1,75 @@
+"""
+OpenAI Batch API helper.
+
+Runs chat completion requests as one 24h batch job (half the price of
+synchronous calls). Used for offline evaluation sweeps where answers aren't
+needed until the run finishes.
+"""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+
+# Terminal states of an OpenAI batch job
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def run_openai_batch(
+    client,
+    requests: List[Dict[str, Any]],
+    poll_interval: float = 30.0,
+    logger: Optional[logging.Logger] = None,
+) -> Dict[str, str]:
+    """
+    Run chat completion requests through the OpenAI Batch API.
+
+    Uploads the requests as JSONL, creates a 24h batch job, polls it until
+    it finishes, and downloads the output.
+
+    Args:
+        client: OpenAI client
+        requests: Batch request lines ({"custom_id", "method", "url", "body"})
+        poll_interval: Seconds between status checks
+        logger: Optional logger for progress
+
+    Returns:
+        Dict mapping custom_id to completion text (failed requests are missing)
+    """
+    import io
+    import time
+
+    payload = "\n".join(json.dumps(request) for request in requests).encode("utf-8")
+    input_file = client.files.create(
+        file=("batch_requests.jsonl", io.BytesIO(payload)),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    if logger:
+        logger.info(f"Batch {batch.id} created ({len(requests)} requests)")
+
+    while batch.status not in BATCH_TERMINAL_STATUSES:
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+        if logger:
+            counts = batch.request_counts
+            done = f"{counts.completed}/{counts.total}" if counts else "?"
+            logger.info(f"Batch {batch.id}: {batch.status} ({done} done)")
+
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+    outputs: Dict[str, str] = {}
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        if response.get("status_code") != 200:
+            continue
+        outputs[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+    return outputs
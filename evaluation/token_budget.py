@@ -6,8 +6,9 @@ at specific context window thresholds, even with large-context models.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from math import ceil, floor
-from typing import Optional
+from typing import List, Optional, Sequence
 
 try:
     import tiktoken
@@ -16,6 +17,13 @@ except ImportError:
     TIKTOKEN_AVAILABLE = False
 
 
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """Load the cl100k_base tokenizer once (tiktoken builds it per call otherwise)."""
+    # OpenAI/GPT-4 tokenizer, close enough for Claude budgeting
+    return tiktoken.get_encoding("cl100k_base")
+
+
 def estimate_tokens(text: str) -> int:
     """
     Estimate the number of tokens in a text string.
@@ -32,9 +40,7 @@ def estimate_tokens(text: str) -> int:
     if TIKTOKEN_AVAILABLE:
         # Use tiktoken for accurate estimation (OpenAI-style tokenization)
         try:
-            # Use OpenAI tokenizer (GPT-4/Claude compatible)
-            encoding = tiktoken.get_encoding("cl100k_base")  # OpenAI/GPT-4 tokenizer
-            return len(encoding.encode(text))
+            return len(_get_encoding().encode(text))
         except Exception:
             # Fallback to heuristic if tiktoken fails
             pass
@@ -43,6 +49,28 @@ def estimate_tokens(text: str) -> int:
     return ceil(len(text) / 4)
 
 
+def estimate_tokens_batch(texts: Sequence[str]) -> List[int]:
+    """
+    Estimate token counts for several texts in one tokenizer call.
+
+    Same metric as estimate_tokens(), but tiktoken encodes the whole batch
+    natively instead of once per string.
+
+    Args:
+        texts: The texts to estimate tokens for
+
+    Returns:
+        Estimated token count per text, in input order
+    """
+    if TIKTOKEN_AVAILABLE:
+        try:
+            return [len(ids) for ids in _get_encoding().encode_batch(list(texts))]
+        except Exception:
+            pass
+
+    return [ceil(len(text) / 4) for text in texts]
+
+
 @dataclass
 class TokenBudget:
     """
@@ -31,11 +31,8 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from evaluation.locomo_eval import (
-    evaluate_codex_on_locomo,
-    compare_strategies_on_locomo,
-)
-from strategies import StrategyB_CodexCheckpoint
+# Evaluation and strategy modules are imported after argument parsing, so
+# --help and argument errors don't pay for their heavy dependencies
 
 
 def main():
@@ -45,14 +42,14 @@ def main():
     parser.add_argument(
         "--dataset",
         type=str,
-        default=str(project_root / "data" / "A-mem" / "data" / "locomo10.json"),
-        help="Path to LoCoMo dataset JSON"
+        default=None,
+        help="Path to LoCoMo dataset JSON (default: data/A-mem/data/locomo10.json)"
     )
     parser.add_argument(
         "--output-dir",
         type=str,
-        default=str(project_root / "results" / "locomo"),
-        help="Directory to save results"
+        default=None,
+        help="Directory to save results (default: results/locomo)"
     )
     parser.add_argument(
         "--ratio",
@@ -91,6 +88,23 @@ def main():
         action="store_true",
         help="Compare multiple strategies"
     )
+    parser.add_argument(
+        "--max-parallel-strategies",
+        type=int,
+        default=1,
+        help="Max strategies evaluated concurrently with --compare (1 = sequential)"
+    )
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=1,
+        help="Max questions answered concurrently per sample (1 = sequential)"
+    )
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Answer questions through the OpenAI Batch API (cheaper, up to 24h; openai backend only)"
+    )
     parser.add_argument(
         "--quiet",
         action="store_true",
@@ -99,6 +113,12 @@ def main():
 
     args = parser.parse_args()
 
+    # Path defaults are only built when the option wasn't given
+    if args.dataset is None:
+        args.dataset = str(project_root / "data" / "A-mem" / "data" / "locomo10.json")
+    if args.output_dir is None:
+        args.output_dir = str(project_root / "results" / "locomo")
+
     # Create output directory
     os.makedirs(args.output_dir, exist_ok=True)
 
@@ -113,8 +133,12 @@ def main():
         print(f"Categories: {args.categories}")
     print()
 
+    from strategies.strategy_b_codex import StrategyB_CodexCheckpoint
+
     if args.compare:
         # Compare multiple strategies
+        from evaluation.locomo_eval import compare_strategies_on_locomo
+
         print("Mode: Strategy Comparison")
 
         strategies = [
@@ -135,10 +159,15 @@ def main():
             llm_backend=args.backend,
             llm_model=args.model,
             ratio=args.ratio,
+            max_parallel_strategies=args.max_parallel_strategies,
+            max_concurrent=args.max_concurrent,
+            use_batch_api=args.batch_api,
         )
 
     else:
         # Single strategy evaluation
+        from evaluation.locomo_eval import evaluate_codex_on_locomo
+
         print("Mode: Single Strategy Evaluation (Codex Baseline)")
 
         strategy = StrategyB_CodexCheckpoint(
@@ -162,6 +191,8 @@ def main():
             ratio=args.ratio,
             categories=args.categories,
             verbose=not args.quiet,
+            max_concurrent=args.max_concurrent,
+            use_batch_api=args.batch_api,
         )
 
         # Print key metrics
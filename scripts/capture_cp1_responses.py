@@ -9,6 +9,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from strategies.strategy_b_codex import StrategyB_CodexCheckpoint
+from evaluation.granular_constraint_metrics import find_keywords
 from evaluation.harness import MockAgent, load_template, run_single_trial
 from evaluation.metrics import _constraint_mentioned, _get_client
 
@@ -91,7 +92,8 @@ def capture_cp1_responses():
         # Check if TASK CONTEXT is in compressed context
         compressed = agent.context[0]["content"] if agent.context else ""
         has_task_context = "--- TASK CONTEXT" in compressed
-        has_budget_in_context = "Budget: maximum $10K" in compressed or "$10K" in compressed
+        # "Budget: maximum $10K" contains "$10K", so one substring search covers both
+        has_budget_in_context = "$10K" in compressed
         
         print(f"  Has TASK CONTEXT section: {has_task_context}")
         print(f"  Has budget in context: {has_budget_in_context}")
@@ -113,7 +115,7 @@ def capture_cp1_responses():
         
         # Check for budget keywords
         budget_keywords = ["budget", "$10", "10K", "10,000", "ten thousand", "implementation cost"]
-        found = [kw for kw in budget_keywords if kw.lower() in constraints_after.lower()]
+        found = find_keywords(constraints_after, budget_keywords)
         print(f"  Budget keywords found: {found}")
         
         if not budget_after and found:
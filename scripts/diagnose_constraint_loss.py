@@ -20,7 +20,7 @@ sys.path.insert(0, str(project_root))
 
 from strategies.strategy_b_codex import StrategyB_CodexCheckpoint
 from evaluation.harness import MockAgent
-from evaluation.metrics import measure_constraint_recall, _constraint_mentioned, _get_client
+from evaluation.metrics import measure_constraint_recall, _constraints_mentioned_concurrent, _get_client
 from evaluation.token_budget import BUDGET_8K
 
 
@@ -119,8 +119,10 @@ def diagnose_cp1(template_path: str):
         # Check each constraint individually
         print("\nIndividual constraint checks BEFORE:")
         client = _get_client()
-        for i, constraint in enumerate(constraints, 1):
-            mentioned = _constraint_mentioned(constraint, constraints_before_response, client, "gpt-4o")
+        mentions = _constraints_mentioned_concurrent(
+            [(constraint, constraints_before_response) for constraint in constraints], client, "gpt-4o"
+        )
+        for i, (constraint, mentioned) in enumerate(zip(constraints, mentions), 1):
             status = "✓" if mentioned else "✗"
             print(f"  {status} Constraint {i}: {constraint}")
         
@@ -164,8 +166,10 @@ def diagnose_cp1(template_path: str):
         
         # Check each constraint individually
         print("\nIndividual constraint checks AFTER:")
-        for i, constraint in enumerate(constraints, 1):
-            mentioned = _constraint_mentioned(constraint, constraints_after_response, client, "gpt-4o")
+        mentions = _constraints_mentioned_concurrent(
+            [(constraint, constraints_after_response) for constraint in constraints], client, "gpt-4o"
+        )
+        for i, (constraint, mentioned) in enumerate(zip(constraints, mentions), 1):
             status = "✓" if mentioned else "✗"
             print(f"  {status} Constraint {i}: {constraint}")
         
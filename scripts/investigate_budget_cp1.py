@@ -1,16 +1,26 @@
 #!/usr/bin/env python3
 """Investigate why Instinct8 loses budget constraint at CP1."""
 
+import copy
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from strategies.strategy_b_codex import StrategyB_CodexCheckpoint
+from evaluation.granular_constraint_metrics import find_keywords
 from evaluation.harness import MockAgent, load_template
 from evaluation.metrics import measure_constraint_recall, _constraint_mentioned, _get_client
 
+
+def probe_constraint(agent, probe, constraint, client):
+    """Ask the agent a probe and judge whether it mentions the constraint."""
+    response = agent.call(probe)
+    return response, _constraint_mentioned(constraint, response, client, "gpt-4o")
+
+
 def investigate_cp1():
     """Run CP1 and capture actual agent responses."""
     
@@ -72,23 +82,27 @@ def investigate_cp1():
             "content": turn["content"],
         })
     
-    # Probe BEFORE
     constraint_probe = "What constraints are you operating under for this project?"
-    constraints_before = agent.call(constraint_probe)
+    client = _get_client()
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Probe BEFORE on a snapshot of the agent, so the probe and its judge
+        # call overlap with compression (compress() swaps in a new context list)
+        before_future = executor.submit(
+            probe_constraint, copy.copy(agent), constraint_probe, budget_constraint, client
+        )
+        
+        # COMPRESS
+        agent.compress(cp1_turn["turn_id"])
+        constraints_before, budget_mentioned_before = before_future.result()
     
     print("\nBEFORE COMPRESSION:")
     print(f"Agent response:\n{constraints_before}\n")
-    
-    # Check budget constraint
-    client = _get_client()
-    budget_mentioned_before = _constraint_mentioned(budget_constraint, constraints_before, client, "gpt-4o")
     print(f"Budget constraint mentioned: {budget_mentioned_before}")
     
-    # COMPRESS
     print("\n" + "=" * 80)
-    print("COMPRESSING...")
+    print("COMPRESSED")
     print("=" * 80)
-    agent.compress(cp1_turn["turn_id"])
     
     # Show what's in the compressed context
     compressed_context = agent.context[0]["content"] if agent.context else ""
@@ -108,12 +122,11 @@ def investigate_cp1():
     print("\n" + "=" * 80)
     print("AFTER COMPRESSION")
     print("=" * 80)
-    constraints_after = agent.call(constraint_probe)
+    constraints_after, budget_mentioned_after = probe_constraint(
+        agent, constraint_probe, budget_constraint, client
+    )
     
     print(f"\nAgent response:\n{constraints_after}\n")
-    
-    # Check budget constraint
-    budget_mentioned_after = _constraint_mentioned(budget_constraint, constraints_after, client, "gpt-4o")
     print(f"Budget constraint mentioned: {budget_mentioned_after}")
     
     # Analyze why it might not be mentioned
@@ -130,7 +143,7 @@ def investigate_cp1():
         
         # Check if budget-related words appear
         budget_keywords = ["budget", "$10", "10K", "cost", "10,000"]
-        found_keywords = [kw for kw in budget_keywords if kw.lower() in constraints_after.lower()]
+        found_keywords = find_keywords(constraints_after, budget_keywords)
         if found_keywords:
             print(f"\n⚠ But budget-related keywords found: {found_keywords}")
             print("   This suggests the LLM-as-judge might be too strict")
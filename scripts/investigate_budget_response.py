@@ -8,6 +8,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from strategies.strategy_b_codex import StrategyB_CodexCheckpoint
+from evaluation.granular_constraint_metrics import find_keywords
 from evaluation.harness import MockAgent, load_template
 from evaluation.metrics import _constraint_mentioned, _get_client
 from evaluation.token_budget import BUDGET_8K
@@ -144,7 +145,7 @@ def investigate_budget_response():
     
     # Check for budget-related keywords
     budget_keywords = ["budget", "$10", "10K", "10,000", "ten thousand", "cost", "implementation cost"]
-    found_keywords = [kw for kw in budget_keywords if kw.lower() in constraints_after.lower()]
+    found_keywords = find_keywords(constraints_after, budget_keywords)
     
     print("\n" + "=" * 80)
     print("DETAILED ANALYSIS")
@@ -27,10 +27,8 @@ Usage:
 """
 
 import argparse
-import json
 import os
 import sys
-from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -45,13 +43,65 @@ from evaluation.hierarchical_metrics import (
     format_hierarchical_report,
 )
 
-# Try to import OpenAI for direct API calls
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-    print("[warning] OpenAI not available. Running in mock mode.")
+# OpenAI client class, imported lazily on first use (pulls in httpx/pydantic,
+# which is wasted startup time for --help and mock-mode runs)
+_OPENAI_CLS: Any = None
+_OPENAI_IMPORT_ATTEMPTED = False
+
+
+def _get_openai() -> Optional[type]:
+    """Import and cache the OpenAI client class, or return None if unavailable."""
+    global _OPENAI_CLS, _OPENAI_IMPORT_ATTEMPTED
+    if not _OPENAI_IMPORT_ATTEMPTED:
+        _OPENAI_IMPORT_ATTEMPTED = True
+        try:
+            from openai import OpenAI
+            _OPENAI_CLS = OpenAI
+        except ImportError:
+            print("[warning] OpenAI not available. Running in mock mode.")
+    return _OPENAI_CLS
+
+
+# Shared OpenAI client (one keep-alive connection pool for every agent/run)
+_OPENAI_CLIENT: Any = None
+
+
+def _get_openai_client() -> Any:
+    """
+    Get or create the shared OpenAI client, or None if OpenAI is unavailable.
+
+    The client is backed by an explicit httpx pool sized for the bursty probe
+    phase, so consecutive calls reuse warm connections instead of paying a new
+    TCP/TLS handshake. HTTP/2 is enabled when the optional h2 package is
+    installed.
+    """
+    global _OPENAI_CLIENT
+    if _OPENAI_CLIENT is not None:
+        return _OPENAI_CLIENT
+
+    openai_cls = _get_openai()
+    if openai_cls is None:
+        return None
+
+    try:
+        import httpx
+    except ImportError:
+        _OPENAI_CLIENT = openai_cls()
+        return _OPENAI_CLIENT
+
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+
+    http_client = httpx.Client(
+        http2=http2,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    )
+    _OPENAI_CLIENT = openai_cls(http_client=http_client)
+    return _OPENAI_CLIENT
 
 
 STRATEGIES = {
@@ -81,6 +131,41 @@ CODEX_SUMMARY_PREFIX = """Another language model started to solve this problem a
 COMPACT_USER_MESSAGE_MAX_TOKENS = 20_000
 APPROX_BYTES_PER_TOKEN = 4
 
+# A-MEM summarization prompts, one per hierarchy level
+AMEM_SUMMARY_PROMPTS = {
+    "episode": """Summarize this episode of conversation into a concise paragraph.
+Focus on: key decisions made, specific technical details, constraints identified, and outcomes.
+Keep specific facts like names, numbers, formats, and technical choices.
+
+Conversation:
+{content}
+
+Summary (2-3 sentences, preserve specific details):""",
+
+    "category": """Synthesize these episode summaries into a category-level summary.
+Focus on: patterns across episodes, recurring themes, key architectural decisions.
+
+Episodes:
+{content}
+
+Category Summary (2-3 sentences):""",
+
+    "domain": """Create a high-level domain summary from these category summaries.
+Focus on: overall system architecture, main goals, critical constraints.
+
+Categories:
+{content}
+
+Domain Summary (2-3 sentences):"""
+}
+
+# Templates pre-split around the {content} placeholder, so building a prompt is
+# a plain concatenation instead of a str.format() parse per summary call
+_AMEM_PROMPT_PARTS = {
+    level: tuple(template.split("{content}", 1))
+    for level, template in AMEM_SUMMARY_PROMPTS.items()
+}
+
 
 class SimpleOpenAIAgent:
     """Simple OpenAI-based agent for hierarchical evaluation."""
@@ -88,9 +173,12 @@ class SimpleOpenAIAgent:
     def __init__(self, model: str = "gpt-4o-mini", strategy: str = "no_compression"):
         self.model = model
         self.strategy = strategy
-        self.conversation_history: List[Dict[str, str]] = []
+        # Conversation history stored as parallel role/content lists; role strings
+        # are interned, and OpenAI message dicts are built only at the API call site
+        self._roles: List[str] = []
+        self._contents: List[str] = []
         self.system_prompt = ""
-        self.client = OpenAI() if OPENAI_AVAILABLE else None
+        self.client = _get_openai_client()
         self.max_context_turns = 40  # For sliding window
 
         # A-MEM hierarchical memory
@@ -102,50 +190,36 @@ class SimpleOpenAIAgent:
         # Codex-style compression
         self.codex_summary: str = ""  # Rolling summary from previous compressions
 
+        # Bind the compression method once instead of branching on every compress()
+        self._compress_fn = {
+            "no_compression": self._compress_noop,
+            "recency": self._compress_recency,
+            "first_last": self._compress_first_last,
+            "sliding_window": self._compress_sliding,
+            "amem": self._compress_amem,
+            "codex": self._compress_codex,
+        }.get(strategy, self._compress_noop)
+
     def set_system_prompt(self, prompt: str) -> None:
         """Set the system prompt."""
         self.system_prompt = prompt
 
     def add_turn(self, role: str, content: str) -> None:
         """Add a turn to the conversation history."""
-        self.conversation_history.append({"role": role, "content": content})
+        self._roles.append(sys.intern(role))
+        self._contents.append(content)
 
     def _generate_summary(self, content: str, summary_type: str) -> str:
         """Generate a summary using the LLM."""
         if not self.client:
             return f"[Summary of {summary_type}]"
 
-        prompts = {
-            "episode": """Summarize this episode of conversation into a concise paragraph.
-Focus on: key decisions made, specific technical details, constraints identified, and outcomes.
-Keep specific facts like names, numbers, formats, and technical choices.
-
-Conversation:
-{content}
-
-Summary (2-3 sentences, preserve specific details):""",
-
-            "category": """Synthesize these episode summaries into a category-level summary.
-Focus on: patterns across episodes, recurring themes, key architectural decisions.
-
-Episodes:
-{content}
-
-Category Summary (2-3 sentences):""",
-
-            "domain": """Create a high-level domain summary from these category summaries.
-Focus on: overall system architecture, main goals, critical constraints.
-
-Categories:
-{content}
-
-Domain Summary (2-3 sentences):"""
-        }
+        prefix, suffix = _AMEM_PROMPT_PARTS[summary_type]
 
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
-                messages=[{"role": "user", "content": prompts[summary_type].format(content=content)}],
+                messages=[{"role": "user", "content": prefix + content + suffix}],
                 max_tokens=300,
                 temperature=0.0,
             )
@@ -156,29 +230,30 @@ Domain Summary (2-3 sentences):"""
 
     def compress(self) -> None:
         """Apply compression strategy."""
-        if self.strategy == "no_compression":
-            # Keep everything
-            pass
-        elif self.strategy == "recency":
-            # Keep only last N turns
-            if len(self.conversation_history) > 20:
-                self.conversation_history = self.conversation_history[-20:]
-        elif self.strategy == "first_last":
-            # Keep first 5 + last 15 turns
-            if len(self.conversation_history) > 20:
-                first = self.conversation_history[:5]
-                last = self.conversation_history[-15:]
-                self.conversation_history = first + last
-        elif self.strategy == "sliding_window":
-            # Keep last 30 turns
-            if len(self.conversation_history) > 30:
-                self.conversation_history = self.conversation_history[-30:]
-        elif self.strategy == "amem":
-            # A-MEM: Hierarchical compression with LLM-generated summaries
-            self._compress_amem()
-        elif self.strategy == "codex":
-            # Codex: Flat checkpoint summarization
-            self._compress_codex()
+        self._compress_fn()
+
+    def _compress_noop(self) -> None:
+        """No compression: keep everything."""
+
+    def _compress_recency(self) -> None:
+        """Keep only the last 20 turns."""
+        if len(self._roles) > 20:
+            self._keep_turns(first=0, last=20)
+
+    def _compress_first_last(self) -> None:
+        """Keep the first 5 + last 15 turns (primacy + recency)."""
+        if len(self._roles) > 20:
+            self._keep_turns(first=5, last=15)
+
+    def _compress_sliding(self) -> None:
+        """Keep the last 30 turns."""
+        if len(self._roles) > 30:
+            self._keep_turns(first=0, last=30)
+
+    def _keep_turns(self, first: int, last: int) -> None:
+        """Keep the first `first` and last `last` turns of the history."""
+        self._roles = self._roles[:first] + self._roles[-last:]
+        self._contents = self._contents[:first] + self._contents[-last:]
 
     def _compress_amem(self) -> None:
         """A-MEM style hierarchical compression."""
@@ -186,11 +261,10 @@ Domain Summary (2-3 sentences):"""
 
         # Get the recent episode (last ~10 turns before this compression point)
         # We keep some recent context and summarize the rest
-        episode_turns = self.conversation_history[-10:] if len(self.conversation_history) >= 10 else self.conversation_history
-
         # Format episode content for summarization
         episode_content = "\n".join([
-            f"{t['role'].upper()}: {t['content']}" for t in episode_turns
+            f"{role.upper()}: {content}"
+            for role, content in zip(self._roles[-10:], self._contents[-10:])
         ])
 
         # Generate episode summary
@@ -245,12 +319,14 @@ Domain Summary (2-3 sentences):"""
             compressed_context = "\n\n".join(context_parts)
 
             # Keep only last 5 turns as recent context + compressed summary
-            recent_turns = self.conversation_history[-5:] if len(self.conversation_history) > 5 else []
+            if len(self._roles) > 5:
+                recent_roles, recent_contents = self._roles[-5:], self._contents[-5:]
+            else:
+                recent_roles, recent_contents = [], []
 
             # Rebuild history: compressed context + recent turns
-            self.conversation_history = [
-                {"role": "assistant", "content": f"[Compressed Memory]\n{compressed_context}"}
-            ] + recent_turns
+            self._roles = ["assistant"] + recent_roles
+            self._contents = [f"[Compressed Memory]\n{compressed_context}"] + recent_contents
 
     def _compress_codex(self) -> None:
         """Codex-style checkpoint summarization (from compact.rs).
@@ -264,12 +340,12 @@ Domain Summary (2-3 sentences):"""
         self.compression_count += 1
         print(f"    [Codex] Compression point {self.compression_count}...")
 
-        if not self.conversation_history:
+        if not self._contents:
             return
 
         # Format entire conversation for summarization
         conv_text = "\n".join([
-            f"{t['role'].upper()}: {t['content']}" for t in self.conversation_history
+            f"{role.upper()}: {content}" for role, content in zip(self._roles, self._contents)
         ])
 
         # Include previous summary if exists (rolling compression)
@@ -308,14 +384,12 @@ Domain Summary (2-3 sentences):"""
 
     def _collect_user_messages(self) -> List[str]:
         """Collect all user messages from conversation history."""
-        messages = []
-        for turn in self.conversation_history:
-            if turn.get("role") == "user":
-                content = turn.get("content", "")
-                # Filter out previous summaries (same as Codex's is_summary_message)
-                if not content.startswith(CODEX_SUMMARY_PREFIX[:50]):
-                    messages.append(content)
-        return messages
+        # Filter out previous summaries (same as Codex's is_summary_message)
+        summary_marker = CODEX_SUMMARY_PREFIX[:50]
+        return [
+            content for role, content in zip(self._roles, self._contents)
+            if role == "user" and not content.startswith(summary_marker)
+        ]
 
     def _select_user_messages_codex(self, user_messages: List[str]) -> List[str]:
         """Select user messages up to COMPACT_USER_MESSAGE_MAX_TOKENS (most recent first)."""
@@ -347,20 +421,24 @@ Domain Summary (2-3 sentences):"""
 
     def _rebuild_codex_history(self, user_messages: List[str], summary: str) -> None:
         """Rebuild history in Codex's compacted format."""
-        new_history = []
+        roles: List[str] = []
+        contents: List[str] = []
 
         # Add selected user messages
         if user_messages:
             user_context = "--- Previous User Messages ---\n" + "\n\n".join([
                 f"User message {i+1}: {msg}" for i, msg in enumerate(user_messages)
             ])
-            new_history.append({"role": "user", "content": user_context})
+            roles.append("user")
+            contents.append(user_context)
 
         # Add summary with Codex's prefix
         summary_content = f"--- Conversation Summary ---\n{CODEX_SUMMARY_PREFIX}\n\n{summary}"
-        new_history.append({"role": "assistant", "content": summary_content})
+        roles.append("assistant")
+        contents.append(summary_content)
 
-        self.conversation_history = new_history
+        self._roles = roles
+        self._contents = contents
 
     def respond(self, prompt: str) -> str:
         """Generate a response to the prompt."""
@@ -373,7 +451,10 @@ Domain Summary (2-3 sentences):"""
             messages.append({"role": "system", "content": self.system_prompt})
 
         # Add conversation history
-        messages.extend(self.conversation_history)
+        messages.extend(
+            {"role": role, "content": content}
+            for role, content in zip(self._roles, self._contents)
+        )
 
         # Add current prompt
         messages.append({"role": "user", "content": prompt})
@@ -396,7 +477,8 @@ class MockAgent:
 
     def __init__(self, strategy: str = "mock"):
         self.strategy = strategy
-        self.conversation_history: List[Dict[str, str]] = []
+        self._roles: List[str] = []
+        self._contents: List[str] = []
 
     def set_system_prompt(self, prompt: str) -> None:
         """Set the system prompt."""
@@ -404,7 +486,8 @@ class MockAgent:
 
     def add_turn(self, role: str, content: str) -> None:
         """Add a turn to the conversation history."""
-        self.conversation_history.append({"role": role, "content": content})
+        self._roles.append(sys.intern(role))
+        self._contents.append(content)
 
     def compress(self) -> None:
         """Simulate compression (no-op for mock)."""
@@ -417,7 +500,7 @@ class MockAgent:
 
 def create_agent(strategy: str, model: str = "gpt-4o-mini"):
     """Create an agent with the specified strategy."""
-    if not OPENAI_AVAILABLE:
+    if _get_openai() is None:
         return MockAgent(strategy)
 
     return SimpleOpenAIAgent(model=model, strategy=strategy)
@@ -512,6 +595,9 @@ def run_hierarchical_evaluation(
     Returns:
         HierarchicalMetrics with all calculated scores
     """
+    import json
+    from datetime import datetime
+
     # Load template
     if template_path is None:
         template_path = project_root / "templates" / "hierarchical-eval-60-turn.json"
@@ -603,6 +689,9 @@ def run_comparison(
     Returns:
         Dictionary mapping strategy name to metrics
     """
+    import json
+    from datetime import datetime
+
     if strategies is None:
         strategies = ["amem", "recency", "first_last"]
 
@@ -659,7 +748,16 @@ def run_comparison(
         print(f"{'Strategy':<20} {'Weighted':>10} {'Domain':>10} {'Category':>10} {'Episode':>10} {'Drift':>10}")
         print("-" * 80)
 
+        # Track best score and lowest drift while printing rows (single pass)
+        best_name, best_score = None, float("-inf")
+        lowest_drift_name, lowest_drift = None, float("inf")
+
         for name, m in all_metrics.items():
+            if m.weighted_score > best_score:
+                best_name, best_score = name, m.weighted_score
+            if abs(m.hierarchy_drift) < abs(lowest_drift):
+                lowest_drift_name, lowest_drift = name, m.hierarchy_drift
+
             print(
                 f"{STRATEGIES.get(name, name)[:19]:<20} "
                 f"{m.weighted_score:>9.1%} "
@@ -672,13 +770,12 @@ def run_comparison(
         print("-" * 80)
         print(f"\nComparison saved to: {summary_path}")
 
-        # Highlight best performer
-        best = max(all_metrics.items(), key=lambda x: x[1].weighted_score)
-        print(f"\nBest overall: {STRATEGIES.get(best[0], best[0])} ({best[1].weighted_score:.1%})")
+        if best_name is not None:
+            # Highlight best performer
+            print(f"\nBest overall: {STRATEGIES.get(best_name, best_name)} ({best_score:.1%})")
 
-        # Note hierarchy drift
-        lowest_drift = min(all_metrics.items(), key=lambda x: abs(x[1].hierarchy_drift))
-        print(f"Lowest hierarchy drift: {STRATEGIES.get(lowest_drift[0], lowest_drift[0])} ({lowest_drift[1].hierarchy_drift:+.1%})")
+            # Note hierarchy drift
+            print(f"Lowest hierarchy drift: {STRATEGIES.get(lowest_drift_name, lowest_drift_name)} ({lowest_drift:+.1%})")
 
     return all_metrics
 
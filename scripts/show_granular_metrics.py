@@ -5,6 +5,40 @@ import json
 import sys
 from pathlib import Path
 
+import numpy as np
+
+# Optional streaming parser: lets us pull trials[0] out of multi-MB result
+# dumps without materializing the rest of the file
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+
+CATEGORIES = ('budget', 'timeline', 'technical', 'team', 'compliance', 'performance', 'other')
+_CATEGORY_INDEX = {cat: i for i, cat in enumerate(CATEGORIES)}
+
+
+def _category_row(category_recall: dict) -> list:
+    """Recall per CATEGORIES slot, NaN where the category wasn't measured."""
+    row = [np.nan] * len(CATEGORIES)
+    # Walk only the observed categories rather than probing every slot
+    for cat, value in category_recall.items():
+        i = _CATEGORY_INDEX.get(cat)
+        if i is not None:
+            row[i] = value
+    return row
+
+
+def _load_first_trial(results_path: Path) -> dict:
+    """Load data['trials'][0] from a results file."""
+    with open(results_path, 'rb') as f:
+        if IJSON_AVAILABLE:
+            return next(ijson.items(f, 'trials.item', use_float=True))
+        return json.load(f)['trials'][0]
+
+
 def show_granular_metrics(results_file: str = "results/comparison_baseline_vs_instinct8.json"):
     """Display granular constraint metrics from results."""
     
@@ -18,13 +52,8 @@ def show_granular_metrics(results_file: str = "results/comparison_baseline_vs_in
         print(f"  Instinct8: {instinct8_file} {'exists' if instinct8_file.exists() else 'missing'}")
         return
     
-    with open(baseline_file) as f:
-        baseline_data = json.load(f)
-    with open(instinct8_file) as f:
-        instinct8_data = json.load(f)
-    
-    baseline_trial = baseline_data['trials'][0]
-    instinct8_trial = instinct8_data['trials'][0]
+    baseline_trial = _load_first_trial(baseline_file)
+    instinct8_trial = _load_first_trial(instinct8_file)
     
     print("=" * 80)
     print("GRANULAR CONSTRAINT METRICS - Category Breakdown")
@@ -49,34 +78,39 @@ def show_granular_metrics(results_file: str = "results/comparison_baseline_vs_in
         if not after_metrics:
             return None
         
-        # Average across compression points
-        categories = ['budget', 'timeline', 'technical', 'team', 'compliance', 'performance', 'other']
-        category_totals = {cat: [] for cat in categories}
-        overall_totals = []
-        weighted_totals = []
+        # Average across compression points: one pass into a record array
+        # (struct of arrays); NaN marks a value that wasn't measured
+        record = np.dtype([
+            ('category', np.float64, (len(CATEGORIES),)),
+            ('overall', np.float64),
+            ('weighted', np.float64),
+        ])
+        rows = np.fromiter(
+            (
+                (
+                    _category_row(cp['category_recall']),
+                    cp.get('overall_recall', np.nan),
+                    cp.get('weighted_score', np.nan),
+                )
+                for cp in after_metrics
+                if 'category_recall' in cp
+            ),
+            dtype=record,
+        )
         
-        for cp_metrics in after_metrics:
-            if 'category_recall' in cp_metrics:
-                for cat in categories:
-                    if cat in cp_metrics['category_recall']:
-                        category_totals[cat].append(cp_metrics['category_recall'][cat])
-                if 'overall_recall' in cp_metrics:
-                    overall_totals.append(cp_metrics['overall_recall'])
-                if 'weighted_score' in cp_metrics:
-                    weighted_totals.append(cp_metrics['weighted_score'])
+        def nan_means(values):
+            """Per-column means ignoring NaN, plus how many values each had."""
+            counts = np.count_nonzero(~np.isnan(values), axis=0)
+            return np.nansum(values, axis=0) / np.maximum(counts, 1), counts
         
-        # Calculate averages
-        result = {}
-        for cat in categories:
-            if category_totals[cat]:
-                result[cat] = sum(category_totals[cat]) / len(category_totals[cat])
-            else:
-                result[cat] = 1.0  # No constraints in this category
+        # No constraints in a category counts as full recall
+        means, counts = nan_means(rows['category'])
+        result = dict(zip(CATEGORIES, np.where(counts > 0, means, 1.0).tolist()))
         
-        if overall_totals:
-            result['overall'] = sum(overall_totals) / len(overall_totals)
-        if weighted_totals:
-            result['weighted'] = sum(weighted_totals) / len(weighted_totals)
+        for key in ('overall', 'weighted'):
+            mean, count = nan_means(rows[key])
+            if count:
+                result[key] = float(mean)
         
         return result
     
@@ -98,7 +132,6 @@ def show_granular_metrics(results_file: str = "results/comparison_baseline_vs_in
     print(f"{'Category':<15} {'Baseline':<12} {'Instinct8':<12} {'Difference':<12} {'Winner':<10}")
     print("-" * 80)
     
-    categories = ['budget', 'timeline', 'technical', 'team', 'compliance', 'performance', 'other']
     category_names = {
         'budget': 'Budget',
         'timeline': 'Timeline',
@@ -109,7 +142,7 @@ def show_granular_metrics(results_file: str = "results/comparison_baseline_vs_in
         'other': 'Other',
     }
     
-    for cat in categories:
+    for cat in CATEGORIES:
         baseline_score = baseline_agg.get(cat, 1.0)
         instinct8_score = instinct8_agg.get(cat, 1.0)
         diff = instinct8_score - baseline_score
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Run Strategy F and Strategy I Trials in Parallel
+
+Runs the same single trials as tests/test_strategy_f_product_pivot.py and
+tests/test_strategy_i_product_design.py, but concurrently. Each trial is
+bound by LLM round-trips, so running them on a thread pool roughly halves
+wall-clock time when debugging both strategies back to back.
+
+Usage:
+    python scripts/test_strategies_parallel.py
+    python scripts/test_strategies_parallel.py --max-parallel 1   # sequential
+"""
+
+import argparse
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from evaluation.harness import (
+    EvaluationResults,
+    _calculate_aggregate_summary,
+    load_template,
+    run_single_trial,
+)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# (label, template file, output file)
+TRIALS = [
+    ("F", "product-pivot-015-multi-shift-8k-4compactions.json", "strategy_f_product_pivot_results.json"),
+    ("I", "product-design-009-healthcare-8k-4compactions.json", "strategy_i_product_design_results.json"),
+]
+
+
+def _create_strategy(label: str, system_prompt: str):
+    """Create the strategy for a trial label (imported lazily)."""
+    if label == "F":
+        from strategies.strategy_f_protected_core import StrategyF_ProtectedCore
+        return StrategyF_ProtectedCore(system_prompt=system_prompt, backend="auto")
+    from strategies.strategy_i_hybrid_amem_protected import StrategyI_AMemProtectedCore
+    return StrategyI_AMemProtectedCore(system_prompt=system_prompt, backend="auto")
+
+
+def run_trial(label: str, template_name: str, output_path: Path) -> EvaluationResults:
+    """Run one granular-metrics trial of a strategy and save its results."""
+    template = load_template(str(PROJECT_ROOT / "templates" / template_name))
+    setup = template["initial_setup"]
+
+    strategy = _create_strategy(label, setup["system_prompt"])
+    strategy.initialize(setup["original_goal"], setup["hard_constraints"])
+
+    result = run_single_trial(
+        strategy=strategy,
+        template=template,
+        trial_id=1,
+        use_granular_metrics=True,
+    )
+
+    results = EvaluationResults(
+        strategy_name=strategy.name(),
+        template_id=template["template_id"],
+        num_trials=1,
+        trials=[result],
+        aggregate_summary=_calculate_aggregate_summary([result]),
+    )
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    results.save(str(output_path))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Strategy F and I trials in parallel")
+    parser.add_argument(
+        "--output-dir",
+        type=str,
+        default="results",
+        help="Directory to save results"
+    )
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=len(TRIALS),
+        help="Max trials running at once (1 = sequential)"
+    )
+    args = parser.parse_args()
+
+    output_dir = Path(args.output_dir)
+
+    def run(trial):
+        label, template_name, output_name = trial
+        return run_trial(label, template_name, output_dir / output_name)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(args.max_parallel, len(TRIALS)))) as executor:
+        all_results = list(executor.map(run, TRIALS))
+
+    print("\n" + "=" * 70)
+    print("SUMMARY")
+    print("=" * 70)
+    for (_, _, output_name), results in zip(TRIALS, all_results):
+        summary = results.aggregate_summary
+        print(f"\n{results.strategy_name} ({results.template_id})")
+        for key in ("avg_goal_coherence_after", "avg_constraint_recall_after", "avg_behavioral_alignment"):
+            if isinstance(summary.get(key), float):
+                print(f"  {key}: {summary[key]:.3f}")
+        print(f"  Saved to: {output_dir / output_name}")
+
+
+if __name__ == "__main__":
+    main()
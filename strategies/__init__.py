@@ -2,67 +2,67 @@
 # This package contains implementations of different compression strategies
 # for long-running LLM agents.
 
+import importlib
+
 # Base imports (no circular dependencies)
 from .strategy_base import CompressionStrategy, Turn, ToolCall, ProbeResults
 
-# Strategy imports - lazy to avoid circular dependencies with evaluation module
-# Import these directly from their modules when needed to avoid circular imports.
-# 
-# Example usage:
-#   from strategies.strategy_b_codex import StrategyB_CodexCheckpoint
-#   from strategies.strategy_h_selective_salience import SelectiveSalienceStrategy
-#
-# This lazy import pattern prevents circular dependencies between:
+# Strategy imports are lazy (PEP 562): each strategy module is imported on
+# first attribute access, so `import strategies` doesn't pull in the LLM SDKs
+# and embedding libraries, and can't form an import cycle with evaluation:
 # - strategies/__init__.py → strategy modules → evaluation module → strategies (cycle!)
-from .strategy_a_naive import StrategyA_NaiveSummarization, create_naive_strategy
-from .strategy_b_codex import StrategyB_CodexCheckpoint, create_codex_strategy
-from .strategy_d_amem import StrategyD_AMemStyle, create_amem_strategy
-from .strategy_f_protected_core import StrategyF_ProtectedCore, create_protected_core_strategy
-from .strategy_g_hybrid import StrategyG_Hybrid, create_hybrid_strategy
-from .strategy_h_selective_salience import SelectiveSalienceStrategy
-from .strategy_h_keyframe import StrategyH_Keyframe, create_keyframe_strategy
-from .strategy_i_hybrid_amem_protected import StrategyI_AMemProtectedCore, create_amem_protected_strategy
-
-__all__ = [
-    # Base classes (always available, no circular dependencies)
-    "CompressionStrategy",
-    "Turn",
-    "ToolCall",
-    "ProbeResults",
-    # Strategy classes (import directly from their modules to avoid circular imports)
+#
+# Both styles work:
+#   from strategies import StrategyB_CodexCheckpoint
+#   from strategies.strategy_b_codex import StrategyB_CodexCheckpoint
+_LAZY = {
     # Strategy A - Naive Summarization
-    # "StrategyA_NaiveSummarization",  # from strategies.strategy_a_naive import StrategyA_NaiveSummarization
+    "StrategyA_NaiveSummarization": ".strategy_a_naive",
+    "create_naive_strategy": ".strategy_a_naive",
     # Strategy B - Codex Checkpoint
-    # "StrategyB_CodexCheckpoint",  # from strategies.strategy_b_codex import StrategyB_CodexCheckpoint
-    # "create_codex_strategy",  # from strategies.strategy_b_codex import create_codex_strategy
+    "StrategyB_CodexCheckpoint": ".strategy_b_codex",
+    "create_codex_strategy": ".strategy_b_codex",
     # Strategy D - A-MEM Style
-    # "StrategyD_AMemStyle",  # from strategies.strategy_d_amem import StrategyD_AMemStyle
-    # "create_amem_strategy",  # from strategies.strategy_d_amem import create_amem_strategy
-    # Strategy F - Protected Core + Goal Re-assertion
-    # "StrategyF_ProtectedCore",  # from strategies.strategy_f_protected_core import StrategyF_ProtectedCore
-    # "create_protected_core_strategy",  # from strategies.strategy_f_protected_core import create_protected_core_strategy
-    # Strategy A - Naive Summarization
-    "StrategyA_NaiveSummarization",
-    "create_naive_strategy",
-    # Strategy B - Codex
-    "StrategyB_CodexCheckpoint",
-    "create_codex_strategy",
-    # Strategy D - A-MEM
-    "StrategyD_AMemStyle",
-    "create_amem_strategy",
+    "StrategyD_AMemStyle": ".strategy_d_amem",
+    "create_amem_strategy": ".strategy_d_amem",
     # Strategy F - Protected Core + Goal Re-assertion (Novel)
-    "StrategyF_ProtectedCore",
-    "create_protected_core_strategy",
+    "StrategyF_ProtectedCore": ".strategy_f_protected_core",
+    "create_protected_core_strategy": ".strategy_f_protected_core",
     # Strategy G - Hybrid GraphRAG
-    # "StrategyG_Hybrid",  # from strategies.strategy_g_hybrid import StrategyG_Hybrid
-    # "create_hybrid_strategy",  # from strategies.strategy_g_hybrid import create_hybrid_strategy
+    "StrategyG_Hybrid": ".strategy_g_hybrid",
+    "create_hybrid_strategy": ".strategy_g_hybrid",
     # Strategy H - Selective Salience Compression (Agent-as-Judge)
-    # "SelectiveSalienceStrategy",  # from strategies.strategy_h_selective_salience import SelectiveSalienceStrategy
+    "SelectiveSalienceStrategy": ".strategy_h_selective_salience",
+    "SelectiveSalienceConfig": ".strategy_h_selective_salience",
     # Strategy H - Keyframe Compression (alternative implementation)
-    # "StrategyH_Keyframe",  # from strategies.strategy_h_keyframe import StrategyH_Keyframe
-    # "create_keyframe_strategy",  # from strategies.strategy_h_keyframe import create_keyframe_strategy
+    "StrategyH_Keyframe": ".strategy_h_keyframe",
+    "create_keyframe_strategy": ".strategy_h_keyframe",
     # Strategy I - A-MEM + Protected Core Hybrid
-    # "StrategyI_AMemProtectedCore",  # from strategies.strategy_i_hybrid_amem_protected import StrategyI_AMemProtectedCore
-    # "create_amem_protected_strategy",  # from strategies.strategy_i_hybrid_amem_protected import create_amem_protected_strategy
-]
+    "StrategyI_AMemProtectedCore": ".strategy_i_hybrid_amem_protected",
+    "create_amem_protected_strategy": ".strategy_i_hybrid_amem_protected",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+__all__ = [
+    # Base classes (always available, no circular dependencies)
+    "CompressionStrategy",
+    "Turn",
+    "ToolCall",
+    "ProbeResults",
+    # Strategies (loaded on first access)
+    *_LAZY,
+]
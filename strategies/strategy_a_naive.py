@@ -33,10 +33,24 @@ class StrategyA_NaiveSummarization(CompressionStrategy):
         model: Optional[str] = None,
         backend: str = "auto",
     ):
-        self.client = _create_llm_client(backend=backend, model=model)
+        # The LLM client is created on first use (see the client property)
+        self._backend = backend
+        self._model = model
+        self._client: Optional[LLMClient] = None
         self.original_goal: Optional[str] = None
         self.constraints: List[str] = []
 
+    @property
+    def client(self) -> LLMClient:
+        """Summarization client, created on first use."""
+        if self._client is None:
+            self._client = _create_llm_client(backend=self._backend, model=self._model)
+        return self._client
+
+    @client.setter
+    def client(self, value: LLMClient) -> None:
+        self._client = value
+
     def initialize(self, original_goal: str, constraints: List[str]) -> None:
         """Store goal and constraints (but never use them in compression)."""
         self.original_goal = original_goal
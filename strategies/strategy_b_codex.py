@@ -18,11 +18,25 @@ Key Characteristics:
 
 from __future__ import annotations
 
+import hashlib
 import os
-from typing import Any, Dict, List, Optional, Protocol, TYPE_CHECKING
+import re
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Protocol, Tuple, TYPE_CHECKING
+
+import numpy as np
 
 from .strategy_base import CompressionStrategy
 
+# Optional BM25 ranking for relevance-based user-message selection
+try:
+    from rank_bm25 import BM25Okapi
+    BM25_AVAILABLE = True
+except ImportError:
+    BM25_AVAILABLE = False
+
 if TYPE_CHECKING:
     from evaluation.token_budget import TokenBudget
 
@@ -37,21 +51,42 @@ class LLMClient(Protocol):
         ...
 
 
+@lru_cache(maxsize=None)
+def _shared_openai_client():
+    """One OpenAI SDK client (and connection pool) per process."""
+    from openai import OpenAI
+    return OpenAI()
+
+
+@lru_cache(maxsize=None)
+def _shared_anthropic_client():
+    """One Anthropic SDK client (and connection pool) per process."""
+    from anthropic import Anthropic
+    return Anthropic()
+
+
 class OpenAISummarizer:
     """OpenAI API client for summarization."""
+    # complete() accepts a separate system prompt (see StrategyB._summarize)
+    supports_system_prompt = True
+
     def __init__(self, model: str = "gpt-4o-mini"):
         try:
-            from openai import OpenAI
-            self.client = OpenAI()
+            # Shared across summarizers so strategies reuse warm connections
+            self.client = _shared_openai_client()
             self.model = model
         except ImportError:
             raise ImportError("OpenAI package not installed. Run: pip install openai")
 
-    def complete(self, prompt: str, max_tokens: int = 500) -> str:
+    def complete(self, prompt: str, max_tokens: int = 500, system: str = "") -> str:
+        # OpenAI caches repeated prompt prefixes automatically; keeping the
+        # static instructions in a leading system message makes them one
+        messages = [{"role": "system", "content": system}] if system else []
+        messages.append({"role": "user", "content": prompt})
         response = self.client.chat.completions.create(
             model=self.model,
             max_tokens=max_tokens,
-            messages=[{"role": "user", "content": prompt}]
+            messages=messages
         )
         content = response.choices[0].message.content
         return content.strip() if content else "(summarization returned empty)"
@@ -59,21 +94,36 @@ class OpenAISummarizer:
 
 class AnthropicSummarizer:
     """Anthropic API client for summarization."""
+    supports_system_prompt = True
+
     def __init__(self, model: str = "claude-sonnet-4-20250514"):
         try:
-            from anthropic import Anthropic
-            self.client = Anthropic()
+            self.client = _shared_anthropic_client()
             self.model = model
+            # Prompt-cache read tokens reported by the last completion
+            self.last_cache_read_tokens: Optional[int] = None
         except ImportError:
             raise ImportError("Anthropic package not installed. Run: pip install anthropic")
 
-    def complete(self, prompt: str, max_tokens: int = 500) -> str:
-        response = self.client.messages.create(
+    def complete(self, prompt: str, max_tokens: int = 500, system: str = "") -> str:
+        kwargs: Dict[str, Any] = {}
+        if system:
+            # Cache breakpoint after the static instructions, before the
+            # per-compression conversation
+            kwargs["system"] = [
+                {"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}
+            ]
+        # Stream the summary so text is consumed as it is generated
+        with self.client.messages.stream(
             model=self.model,
             max_tokens=max_tokens,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        return response.content[0].text.strip()
+            messages=[{"role": "user", "content": prompt}],
+            **kwargs,
+        ) as stream:
+            text = "".join(stream.text_stream)
+            usage = stream.get_final_message().usage
+        self.last_cache_read_tokens = getattr(usage, "cache_read_input_tokens", None)
+        return text.strip()
 
 
 def _create_llm_client(backend: str = "auto", model: Optional[str] = None) -> LLMClient:
@@ -128,6 +178,119 @@ COMPACT_USER_MESSAGE_MAX_TOKENS = 20_000
 # Approximate bytes per token (from truncate.rs)
 APPROX_BYTES_PER_TOKEN = 4
 
+# Suggested location for the persistent summary cache (opt-in, see summary_cache_path)
+DEFAULT_SUMMARY_CACHE_PATH = "~/.codex_summary_cache.db"
+
+
+def _greedy_fill(lens: np.ndarray, budget: int) -> Tuple[int, int]:
+    """
+    Take messages (newest first) while their token counts fit the budget.
+
+    Vectorized: the running totals come from one cumsum and the cut point
+    from a binary search, instead of a Python loop over the messages.
+
+    Args:
+        lens: Token count per message, newest first
+        budget: Token budget for the selected messages
+
+    Returns:
+        Tuple of (number of whole messages taken, budget left afterwards).
+        If fewer than len(lens) were taken and budget is left, the next
+        message is the one to truncate.
+    """
+    cumulative = np.cumsum(lens)
+    # Messages whose running total stays under the budget, plus the one that
+    # fills it exactly (nothing is taken once the budget is used up)
+    count = int(np.searchsorted(cumulative, budget, side="left"))
+    if budget > 0 and count < len(cumulative) and cumulative[count] == budget:
+        count += 1
+    used = int(cumulative[count - 1]) if count else 0
+    return count, budget - used
+
+
+def _utf8_len(text: str) -> int:
+    """UTF-8 byte length; ASCII text skips the encode (one byte per char)."""
+    return len(text) if text.isascii() else len(text.encode('utf-8'))
+
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def _bm25_tokenize(text: str) -> List[str]:
+    """Lowercased word tokens for BM25 scoring."""
+    return _WORD_RE.findall(text.lower())
+
+
+# LLMLingua-2 model and target share of conversation tokens kept when pruning
+LLMLINGUA_MODEL = "microsoft/llmlingua-2-xlm-roberta-large-meetingbank"
+LLMLINGUA_RATE = 0.45
+
+# Function words dropped by the heuristic pruner (used without llmlingua)
+_PRUNE_STOPWORDS = frozenset("""
+a an the and or but so of to in on at by for with from as is are was were be been
+being am do does did that this these those it its there here just really very quite
+um uh oh well like basically actually literally
+""".split())
+# Runs of the same punctuation character ("-----", "!!!", "....")
+_REPEATED_PUNCT_RE = re.compile(r"([^\w\s])\1{2,}")
+# Line prefixes written by CompressionStrategy.format_context()
+_TURN_PREFIX_RE = re.compile(r"^(?:Turn \S+ \([^)]*\): |  Tool: )")
+
+
+@lru_cache(maxsize=1)
+def _get_prompt_compressor():
+    """Load the LLMLingua-2 compressor once; None if llmlingua is unavailable."""
+    try:
+        from llmlingua import PromptCompressor
+        return PromptCompressor(model_name=LLMLINGUA_MODEL, use_llmlingua2=True, device_map="cpu")
+    except Exception:
+        # Not installed, or the model couldn't be loaded
+        return None
+
+
+# Lines worth keeping when a user message has to be truncated
+_IMPORTANT_LINE_RE = re.compile(r"\$|\d+K|budget|deadline|constraint|must|cannot", re.IGNORECASE)
+_CAPITALIZED_WORD_RE = re.compile(r"\b[A-Z]\w*")
+_FILLER_WORD_RE = re.compile(r"\b(?:the|a|is)\b", re.IGNORECASE)
+
+
+def _line_importance(line: str) -> int:
+    """Heuristic importance of a line: constraint-like content, proper nouns, little filler."""
+    score = 10 if _IMPORTANT_LINE_RE.search(line) else 0
+    score += len(_CAPITALIZED_WORD_RE.findall(line))
+    score -= len(_FILLER_WORD_RE.findall(line))
+    return score
+
+
+def prune_filler(text: str, protected: Tuple[str, ...] = ()) -> str:
+    """
+    Cheaply drop filler from a formatted conversation.
+
+    Removes common function words and collapses repeated punctuation,
+    keeping turn prefixes intact. Lines containing any protected string
+    (e.g. the goal or a constraint) are kept verbatim.
+
+    Args:
+        text: Conversation text as produced by format_context()
+        protected: Strings whose lines must not be pruned
+
+    Returns:
+        Pruned conversation text
+    """
+    protected_lower = [p.lower() for p in protected if p]
+    lines = []
+    for line in text.split("\n"):
+        lowered = line.lower()
+        if any(p in lowered for p in protected_lower):
+            lines.append(line)
+            continue
+        match = _TURN_PREFIX_RE.match(line)
+        prefix = match.group(0) if match else ""
+        body = _REPEATED_PUNCT_RE.sub(r"\1", line[len(prefix):])
+        words = [w for w in body.split() if w.lower() not in _PRUNE_STOPWORDS]
+        lines.append(prefix + " ".join(words))
+    return "\n".join(lines)
+
 
 class StrategyB_CodexCheckpoint(CompressionStrategy):
     """
@@ -143,6 +306,9 @@ class StrategyB_CodexCheckpoint(CompressionStrategy):
         backend: str = "auto",
         token_budget: Optional[TokenBudget] = None,
         use_goal_preservation: bool = True,
+        summary_cache_path: Optional[str] = None,
+        use_llmlingua: bool = False,
+        relevance_selection: bool = False,
     ):
         """
         Initialize the Codex-style strategy.
@@ -155,8 +321,18 @@ class StrategyB_CodexCheckpoint(CompressionStrategy):
                          Defaults to 8K budget if not provided.
             use_goal_preservation: If True, uses instinct8 enhancements (goal/constraint re-injection).
                                   If False, uses baseline Codex behavior (no explicit goal protection).
+            summary_cache_path: Optional SQLite file (e.g. DEFAULT_SUMMARY_CACHE_PATH) that
+                               persists summaries across runs. Summaries are always cached
+                               in memory for the lifetime of the strategy.
+            use_llmlingua: If True, prune filler from the conversation before summarizing,
+                          with LLMLingua-2 when installed and a stopword heuristic otherwise.
+            relevance_selection: If True, keep the user messages most relevant to the goal and
+                                constraints (BM25) instead of the most recent ones. Needs rank_bm25.
         """
-        self.client = _create_llm_client(backend=backend, model=model)
+        # The LLM client is created on first use (see the client property)
+        self._backend = backend
+        self._model = model
+        self._client: Optional[LLMClient] = None
         self.system_prompt = system_prompt
         # Lazy import to avoid circular dependency
         if token_budget is None:
@@ -167,6 +343,23 @@ class StrategyB_CodexCheckpoint(CompressionStrategy):
         self.original_goal: Optional[str] = None
         self.constraints: List[str] = []
         self.use_goal_preservation = use_goal_preservation
+        # Summaries keyed on sha256(model, full summarization prompt)
+        self._summary_cache: Dict[str, str] = {}
+        self.summary_cache_path = summary_cache_path
+        self._summary_db: Optional[sqlite3.Connection] = None
+        self.use_llmlingua = use_llmlingua
+        self.relevance_selection = relevance_selection
+    
+    @property
+    def client(self) -> LLMClient:
+        """Summarization client, created on first use."""
+        if self._client is None:
+            self._client = _create_llm_client(backend=self._backend, model=self._model)
+        return self._client
+    
+    @client.setter
+    def client(self, value: LLMClient) -> None:
+        self._client = value
     
     def initialize(self, original_goal: str, constraints: List[str]) -> None:
         """
@@ -241,12 +434,16 @@ class StrategyB_CodexCheckpoint(CompressionStrategy):
         # Format conversation for summarization
         conv_text = self.format_context(to_compress)
 
-        # Get summary from LLM
-        summary = self._summarize(conv_text)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Get summary from LLM in the background...
+            summary_future = executor.submit(self._summarize, conv_text)
 
-        # Collect user messages (up to 20k tokens, most recent first)
-        user_messages = self._collect_user_messages(to_compress)
-        selected_messages = self._select_user_messages(user_messages)
+            # ...while collecting user messages (up to 20k tokens, most recent first),
+            # which doesn't depend on the summary
+            user_messages = self._collect_user_messages(to_compress)
+            selected_messages = self._select_user_messages(user_messages)
+
+            summary = summary_future.result()
 
         # Build compacted context
         compressed = self._build_compacted_context(selected_messages, summary)
@@ -303,6 +500,9 @@ class StrategyB_CodexCheckpoint(CompressionStrategy):
         Uses Codex's summarization prompt, optionally enhanced with explicit goal/constraint context.
         """
         try:
+            if self.use_llmlingua:
+                conv_text = self._prune_conversation(conv_text)
+            
             # Choose prompt based on mode
             if self.use_goal_preservation:
                 prompt = CODEX_SUMMARIZATION_PROMPT_ENHANCED
@@ -317,16 +517,93 @@ class StrategyB_CodexCheckpoint(CompressionStrategy):
                         for constraint in self.constraints:
                             goal_context += f"  - {constraint}\n"
                     goal_context += "\nYou MUST preserve the goal and all constraints in your summary.\n"
-                full_prompt = f"{prompt}{goal_context}\n\nConversation to summarize:\n\n{conv_text}"
+                instructions = f"{prompt}{goal_context}"
             else:
-                prompt = CODEX_SUMMARIZATION_PROMPT_BASELINE
-                full_prompt = f"{prompt}\n\nConversation to summarize:\n\n{conv_text}"
+                instructions = CODEX_SUMMARIZATION_PROMPT_BASELINE
+            conversation = f"Conversation to summarize:\n\n{conv_text}"
+            full_prompt = f"{instructions}\n\n{conversation}"
             
-            return self.client.complete(full_prompt, max_tokens=500)
+            # The full prompt covers the prompt variant, goal context and conversation
+            model = getattr(self.client, "model", "")
+            key = hashlib.sha256(f"{model}|{full_prompt}".encode("utf-8")).hexdigest()
+            cached = self._get_cached_summary(key)
+            if cached is not None:
+                self.log("Summary cache hit")
+                return cached
+            
+            if getattr(self.client, "supports_system_prompt", False):
+                # Static instructions go in the system prompt so the provider
+                # can serve them from its prompt cache across compressions
+                summary = self.client.complete(conversation, max_tokens=500, system=instructions)
+                cache_read = getattr(self.client, "last_cache_read_tokens", None)
+                if cache_read is not None:
+                    self.log(f"Summary prompt cache read tokens: {cache_read}")
+            else:
+                summary = self.client.complete(full_prompt, max_tokens=500)
+            self._store_summary(key, summary)
+            return summary
         except Exception as e:
             self.log(f"Summarization failed: {e}")
             return "(summarization failed)"
     
+    def _prune_conversation(self, conv_text: str) -> str:
+        """Drop low-information tokens from the conversation before summarization."""
+        from evaluation.token_budget import estimate_tokens
+        
+        compressor = _get_prompt_compressor()
+        if compressor is not None:
+            # Keep turn boundaries and numbers (budgets, dates, limits)
+            pruned = compressor.compress_prompt(
+                conv_text,
+                rate=LLMLINGUA_RATE,
+                force_tokens=["\n", "?"],
+                force_reserve_digit=True,
+            )["compressed_prompt"]
+        else:
+            protected = tuple(c for c in [self.original_goal, *self.constraints] if c)
+            pruned = prune_filler(conv_text, protected)
+        
+        self.log(f"Pruned conversation: {estimate_tokens(conv_text)} -> {estimate_tokens(pruned)} tokens")
+        return pruned
+    
+    def _summary_store(self) -> Optional[sqlite3.Connection]:
+        """Open the persistent summary cache on first use, if configured."""
+        if self._summary_db is None and self.summary_cache_path:
+            self._summary_db = sqlite3.connect(
+                os.path.expanduser(self.summary_cache_path),
+                check_same_thread=False,
+            )
+            self._summary_db.execute(
+                "CREATE TABLE IF NOT EXISTS summaries (key TEXT PRIMARY KEY, summary TEXT)"
+            )
+        return self._summary_db
+    
+    def _get_cached_summary(self, key: str) -> Optional[str]:
+        """Look up a summary in memory, then in the persistent store."""
+        summary = self._summary_cache.get(key)
+        if summary is not None:
+            return summary
+        
+        db = self._summary_store()
+        if db is None:
+            return None
+        row = db.execute("SELECT summary FROM summaries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        self._summary_cache[key] = row[0]
+        return row[0]
+    
+    def _store_summary(self, key: str, summary: str) -> None:
+        """Remember a summary in memory and in the persistent store."""
+        self._summary_cache[key] = summary
+        db = self._summary_store()
+        if db is not None:
+            with db:
+                db.execute(
+                    "INSERT OR REPLACE INTO summaries (key, summary) VALUES (?, ?)",
+                    (key, summary),
+                )
+    
     def _collect_user_messages(self, turns: List[Dict[str, Any]]) -> List[str]:
         """
         Collect all user messages from turns.
@@ -348,30 +625,72 @@ class StrategyB_CodexCheckpoint(CompressionStrategy):
         Select user messages up to COMPACT_USER_MESSAGE_MAX_TOKENS.
         
         Mirrors build_compacted_history_with_limit() from compact.rs.
-        Selects most recent messages first, then reverses.
+        Selects the most recent messages that fit, in chronological order.
         """
-        selected: List[str] = []
-        remaining_tokens = COMPACT_USER_MESSAGE_MAX_TOKENS
+        from evaluation.token_budget import estimate_tokens_batch
+        
+        if self.relevance_selection and (self.original_goal or self.constraints):
+            if BM25_AVAILABLE:
+                return self._select_user_messages_by_relevance(user_messages)
+            self.log("rank_bm25 not installed, selecting user messages by recency")
+        
+        # Count tokens for all messages in a single tokenizer call, then fill
+        # the budget from the most recent message backwards
+        token_counts = np.asarray(estimate_tokens_batch(user_messages), dtype=np.int64)
+        count, remaining_tokens = _greedy_fill(token_counts[::-1], COMPACT_USER_MESSAGE_MAX_TOKENS)
         
-        # Process messages from most recent to oldest
-        for message in reversed(user_messages):
+        # The newest `count` messages, already in chronological order
+        start = len(user_messages) - count
+        selected = user_messages[start:]
+        if start > 0 and remaining_tokens > 0:
+            # Truncate the first message that didn't fit to the remaining budget
+            selected.insert(0, self._truncate_text(user_messages[start - 1], remaining_tokens))
+        return selected
+    
+    def _select_user_messages_by_relevance(self, user_messages: List[str]) -> List[str]:
+        """
+        Select user messages up to COMPACT_USER_MESSAGE_MAX_TOKENS by relevance.
+        
+        Protected messages (the latest one and any quoting a constraint) go
+        first, then the rest in order of BM25 score against the goal and
+        constraints. The selection is returned in chronological order.
+        """
+        from evaluation.token_budget import estimate_tokens_batch
+        
+        if not user_messages:
+            return []
+        corpus = [_bm25_tokenize(message) for message in user_messages]
+        if not any(corpus):
+            return user_messages[-1:]
+        query = _bm25_tokenize(" ".join([self.original_goal or "", *self.constraints]))
+        scores = BM25Okapi(corpus).get_scores(query)
+        
+        constraints_lower = [c.lower() for c in self.constraints if c]
+        protected = {len(user_messages) - 1}
+        protected.update(
+            i for i, message in enumerate(user_messages)
+            if any(c in message.lower() for c in constraints_lower)
+        )
+        # Protected first, then by score; newer messages win ties
+        order = sorted(
+            range(len(user_messages)),
+            key=lambda i: (i not in protected, -scores[i], -i),
+        )
+        
+        token_counts = estimate_tokens_batch(user_messages)
+        remaining_tokens = COMPACT_USER_MESSAGE_MAX_TOKENS
+        chosen: Dict[int, str] = {}
+        for i in order:
             if remaining_tokens <= 0:
                 break
-            
-            tokens = self._approx_token_count(message)
-            
-            if tokens <= remaining_tokens:
-                selected.append(message)
-                remaining_tokens -= tokens
-            else:
-                # Truncate this message to fit remaining budget
-                truncated = self._truncate_text(message, remaining_tokens)
-                selected.append(truncated)
-                break
+            if token_counts[i] <= remaining_tokens:
+                chosen[i] = user_messages[i]
+                remaining_tokens -= token_counts[i]
+            elif i in protected:
+                chosen[i] = self._truncate_text(user_messages[i], remaining_tokens)
+                remaining_tokens = 0
         
-        # Reverse to restore chronological order
-        selected.reverse()
-        return selected
+        return [chosen[i] for i in sorted(chosen)]
     
     def _approx_token_count(self, text: str) -> int:
         """
@@ -379,21 +698,44 @@ class StrategyB_CodexCheckpoint(CompressionStrategy):
         
         Mirrors approx_token_count() from truncate.rs.
         """
-        byte_len = len(text.encode('utf-8'))
+        byte_len = _utf8_len(text)
         return (byte_len + APPROX_BYTES_PER_TOKEN - 1) // APPROX_BYTES_PER_TOKEN
     
     def _truncate_text(self, text: str, max_tokens: int) -> str:
         """
         Truncate text to fit within token budget.
         
-        Simple truncation with marker.
+        Keeps the most important lines that fit (see _line_importance), in
+        their original order, then adds a marker. Text whose lines are all
+        too long is cut mid-text instead.
         """
-        max_bytes = max_tokens * APPROX_BYTES_PER_TOKEN
-        if len(text.encode('utf-8')) <= max_bytes:
+        from evaluation.token_budget import estimate_tokens, estimate_tokens_batch
+        
+        # Same token metric as the selection budget passed in as max_tokens
+        total_tokens = estimate_tokens(text)
+        if total_tokens <= max_tokens:
             return text
         
-        # Truncate to approximate byte limit
-        truncated = text[:max_bytes // 2]  # Keep first half
+        lines = text.split("\n")
+        line_tokens = estimate_tokens_batch(lines)
+        by_importance = sorted(
+            range(len(lines)),
+            key=lambda i: (-_line_importance(lines[i]), i),
+        )
+        kept: List[int] = []
+        used = 0
+        for i in by_importance:
+            size = line_tokens[i] + 1  # +1 for the joining newline
+            if used + size <= max_tokens:
+                kept.append(i)
+                used += size
+        if kept:
+            kept.sort()
+            body = "\n".join(lines[i] for i in kept)
+            return f"{body}\n...[truncated — kept {len(kept)}/{len(lines)} lines by importance]"
+        
+        # Keep the share of characters matching the first half of the budget
+        truncated = text[:len(text) * (max_tokens // 2) // total_tokens]
         return f"{truncated}...[truncated]"
     
     def _build_compacted_context(
@@ -409,8 +751,10 @@ class StrategyB_CodexCheckpoint(CompressionStrategy):
         2. Original goal and constraints (explicitly preserved if use_goal_preservation=True)
         3. Selected user messages
         4. Summary with prefix
+        
+        Parts are collected in a list and joined once at the end.
         """
-        parts = []
+        parts: List[str] = []
         
         # Add system prompt if present
         if self.system_prompt:
@@ -423,15 +767,15 @@ class StrategyB_CodexCheckpoint(CompressionStrategy):
                 parts.append(f"Original Goal: {self.original_goal}")
             if self.constraints:
                 parts.append("Hard Constraints:")
-                for constraint in self.constraints:
-                    parts.append(f"  - {constraint}")
+                parts.extend(f"  - {constraint}" for constraint in self.constraints)
             parts.append("---")
         
         # Add selected user messages
         if user_messages:
             parts.append("\n--- Previous User Messages ---")
-            for i, msg in enumerate(user_messages, 1):
-                parts.append(f"User message {i}: {msg}")
+            parts.extend(
+                f"User message {i}: {msg}" for i, msg in enumerate(user_messages, 1)
+            )
         
         # Add summary with Codex's prefix
         parts.append("\n--- Conversation Summary ---")
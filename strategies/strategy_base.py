@@ -211,6 +211,11 @@ class CompressionStrategy(ABC):
             return 0.0
         return compressed_tokens / original_tokens
     
+    # (turns, formatted lines) from the last format_context() call, stored as
+    # one tuple so strategies that format from several threads never see a
+    # mismatched pair. Each instance gets its own on first use.
+    _formatted: Any = ((), ())
+    
     def format_context(self, turns: List[Dict[str, Any]]) -> str:
         """
         Format a list of turns into a string.
@@ -218,30 +223,51 @@ class CompressionStrategy(ABC):
         This is a helper method for strategies that need to
         convert turn dictionaries to text for summarization.
         
+        Lines are cached from the previous call: turns that are the same
+        objects as last time (a growing context, or a slice of it) reuse
+        their formatted line, and only the new suffix is formatted. Once the
+        context is rewritten (e.g. after compression) the first turn no
+        longer matches and everything is formatted again. Turn dicts are
+        assumed not to be mutated in place after they are added.
+        
         Args:
             turns: List of turn dictionaries
         
         Returns:
             Formatted string representation
         """
-        result = []
-        for turn in turns:
-            turn_id = turn.get("id", "?")
-            role = turn.get("role", "unknown")
-            content = turn.get("content", "")
-            
-            line = f"Turn {turn_id} ({role}): {content}"
-            
-            # Include tool call info if present
-            if "tool_call" in turn and turn["tool_call"] is not None:
-                tool = turn["tool_call"]
-                tool_name = tool.get("name", "unknown")
-                tool_output = tool.get("output", "")
-                tool_result = tool_output[:100] if tool_output else ""
-                line += f"\n  Tool: {tool_name} -> {tool_result}..."
-            
-            result.append(line)
+        cached_turns, cached_lines = self._formatted
+        reused = 0
+        limit = min(len(turns), len(cached_turns))
+        while reused < limit and turns[reused] is cached_turns[reused]:
+            reused += 1
+        
+        if reused == len(turns):
+            # Same turns or a prefix of them: nothing new to format
+            return "\n".join(cached_lines[:reused])
         
+        result = list(cached_lines[:reused])
+        for turn in turns[reused:]:
+            result.append(self._format_turn(turn))
+        
+        self._formatted = (list(turns), result)
         return "\n".join(result)
+    
+    @staticmethod
+    def _format_turn(turn: Dict[str, Any]) -> str:
+        """Format a single turn as one (or, with a tool call, two) lines."""
+        turn_id = turn.get("id", "?")
+        role = turn.get("role", "unknown")
+        content = turn.get("content", "")
+        
+        # Include tool call info if present; each line is built in one
+        # formatting step so long contents aren't copied a second time
+        tool = turn.get("tool_call")
+        if tool is not None:
+            tool_name = tool.get("name", "unknown")
+            tool_output = tool.get("output", "")
+            tool_result = tool_output[:100] if tool_output else ""
+            return f"Turn {turn_id} ({role}): {content}\n  Tool: {tool_name} -> {tool_result}..."
+        return f"Turn {turn_id} ({role}): {content}"
 
 
@@ -15,25 +15,425 @@ Key Characteristics:
 - Model-judged salience extraction (no fixed schema)
 - Semantic deduplication using sentence-transformers
 - Token budget management for salience set
-- Cumulative salience set (grows across compressions)
+- Cumulative salience set (grows across compressions, up to a token budget)
 - Goal coherence preservation through verbatim quotes
 """
 
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import asdict, dataclass, field
+import hashlib
 import json
 import logging
+import os
+import re
+from pathlib import Path
 from openai import OpenAI
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 import tiktoken
 
 from .strategy_base import CompressionStrategy
 
+# Optional HNSW index for salience deduplication (exact NumPy search otherwise)
+try:
+    from usearch.index import Index as USearchIndex
+    USEARCH_AVAILABLE = True
+except ImportError:
+    USEARCH_AVAILABLE = False
+
+# Optional ONNX Runtime backend for the sentence-transformer (int8, CPU)
+try:
+    import onnxruntime as ort
+    from transformers import AutoTokenizer
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+# Optional fast JSON parser for the extraction response. orjson's
+# JSONDecodeError subclasses json.JSONDecodeError, so error handling is shared.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Optional incremental JSON parser for streamed salience extraction
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+    _JSON_ERRORS: Tuple[type, ...] = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    IJSON_AVAILABLE = False
+    _JSON_ERRORS = (json.JSONDecodeError,)
+
+# Streamed salient items are embedded in batches of this size mid-stream
+STREAM_EMBED_BATCH_SIZE = 16
+
+# Sentence boundaries for the extractive background summary
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+|\n+")
+
+
+def _default_onnx_dir() -> Path:
+    """
+    <repo>/models in a writable source checkout, else a user cache directory
+    (an installed package usually sits in read-only site-packages).
+    """
+    repo_dir = Path(__file__).resolve().parent.parent / "models"
+    if os.access(repo_dir if repo_dir.exists() else repo_dir.parent, os.W_OK):
+        return repo_dir
+    return Path(os.path.expanduser("~")) / ".cache" / "instinct8" / "onnx"
+
+
+# Where int8 ONNX exports of the embedding model are kept (one directory per
+# model); override with INSTINCT8_ONNX_DIR
+ONNX_MODEL_DIR = Path(os.environ.get("INSTINCT8_ONNX_DIR") or _default_onnx_dir())
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Prompt templates. Static instructions come first and the variable parts
+# last (goal, then salience, then the conversation), so OpenAI's automatic
+# prompt caching can reuse the instruction prefix across compressions. The
+# goal block is filled in once per goal (see _compile_extract_prompt).
+_EXTRACT_PROMPT_HEADER = """You are performing selective salience extraction for context compression.
+
+From the conversation at the end of this message, extract ONLY the information that will directly impact the agent's ability to achieve the user's goal.
+
+Include:
+- Explicit goals and goal changes
+- Hard constraints (must/must not)
+- Key decisions with rationales
+- Critical facts or requirements
+- Important tool outputs that affect future actions
+
+Do NOT include:
+- Conversational scaffolding
+- Redundant explanations
+- Intermediate reasoning steps
+- Off-topic tangents
+
+CRITICAL: Quote exactly—do not summarize or paraphrase. Preserve the original wording.
+
+Output format (JSON):
+{
+  "salient_items": [
+    "exact quote 1",
+    "exact quote 2",
+    ...
+  ]
+}
+
+"""
+
+_EXTRACT_PROMPT_GOAL = """Original Goal: {goal}
+Constraints: {constraints}
+
+Conversation to analyze:
+"""
+
+_BACKGROUND_PROMPT_HEADER = """You are compressing conversation background for context compression.
+
+Compress the conversation at the end of this message into a 2-3 sentence summary. The salient information listed before it has already been extracted and will be preserved verbatim; do NOT duplicate those items.
+
+Focus on:
+- General context and flow
+- Non-critical details
+- Conversational scaffolding
+
+Provide only the concise 2-3 sentence summary.
+
+Already extracted salient information:
+"""
+
+_BACKGROUND_PROMPT_CONVERSATION = """
+
+Conversation to compress:
+"""
+
+
+@lru_cache(maxsize=None)
+def _get_token_encoder(model: str):
+    """tiktoken encoder for a model, built once per process."""
+    return tiktoken.encoding_for_model(model)
+
+
+@lru_cache(maxsize=4)
+def _get_embedder(name: str, onnx: bool = False):
+    """
+    Sentence-transformer model, loaded once per process and shared by all instances.
+    
+    With onnx=True (and onnxruntime installed) an int8 ONNX export of the
+    model is used instead, falling back to SentenceTransformer if the
+    export can't be built or loaded.
+    """
+    if onnx and ONNXRUNTIME_AVAILABLE:
+        try:
+            return _OnnxEmbedder(_export_onnx_int8(name))
+        except Exception as e:
+            logger.warning(f"ONNX embedder unavailable for {name} ({e}); using SentenceTransformer")
+    return SentenceTransformer(name)
+
+
+def _export_onnx_int8(name: str) -> Path:
+    """
+    Export a sentence-transformer to ONNX with int8 dynamic quantization.
+    
+    The export is written once to ONNX_MODEL_DIR/<name> and reused after
+    that. Building it requires optimum.
+    
+    Returns:
+        Directory holding model-int8.onnx and the tokenizer
+    """
+    model_dir = ONNX_MODEL_DIR / name
+    if (model_dir / "model-int8.onnx").exists():
+        return model_dir
+    
+    from optimum.onnxruntime import ORTModelForFeatureExtraction
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    
+    repo = f"sentence-transformers/{name}"
+    ORTModelForFeatureExtraction.from_pretrained(repo, export=True).save_pretrained(model_dir)
+    AutoTokenizer.from_pretrained(repo).save_pretrained(model_dir)
+    quantize_dynamic(
+        str(model_dir / "model.onnx"),
+        str(model_dir / "model-int8.onnx"),
+        weight_type=QuantType.QInt8,
+    )
+    return model_dir
+
+
+class _OnnxEmbedder:
+    """
+    int8 ONNX Runtime sentence-transformer with the encode() interface
+    Strategy H uses: HF tokenizer, ONNX forward pass, mean pooling.
+    """
+    
+    # all-MiniLM-L6-v2's max_seq_length in sentence-transformers
+    MAX_LENGTH = 256
+    
+    def __init__(self, model_dir: Path):
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(
+            str(model_dir / "model-int8.onnx"), options, providers=["CPUExecutionProvider"]
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(str(model_dir))
+        self._input_names = {model_input.name for model_input in self.session.get_inputs()}
+    
+    def encode(
+        self,
+        sentences: List[str],
+        batch_size: int = 32,
+        normalize_embeddings: bool = False,
+        **kwargs: Any,
+    ) -> np.ndarray:
+        """
+        Embed sentences into a float32 [N, dim] matrix.
+        
+        Accepts (and ignores) SentenceTransformer.encode()'s other keyword
+        arguments, such as convert_to_numpy and show_progress_bar.
+        """
+        batches = []
+        for start in range(0, len(sentences), batch_size):
+            encoded = self.tokenizer(
+                list(sentences[start:start + batch_size]), padding=True, truncation=True,
+                max_length=self.MAX_LENGTH, return_tensors="np",
+            )
+            feeds = {
+                key: value.astype(np.int64) for key, value in encoded.items()
+                if key in self._input_names
+            }
+            hidden = self.session.run(None, feeds)[0]
+            mask = encoded["attention_mask"][..., np.newaxis].astype(np.float32)
+            batches.append((hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9))
+        if not batches:
+            return np.zeros((0, 0), dtype=np.float32)
+        
+        vectors = np.concatenate(batches).astype(np.float32)
+        if normalize_embeddings:
+            vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+        return vectors
+
+
+def _turn_key(turn: Dict[str, Any]) -> bytes:
+    """
+    16-byte blake2b digest of a turn's content.
+    
+    Computed on demand and never stored on the turn, so per-content caches
+    key on short digests without leaking into (or going stale with) caller
+    data.
+    """
+    return hashlib.blake2b(
+        str(turn.get("content", "")).encode("utf-8"), digest_size=16
+    ).digest()
+
+
+def _quantize_int8(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Symmetric per-vector int8 quantization.
+    
+    Returns:
+        Tuple of (int8 vectors, float32 scale per vector as a column)
+    """
+    scale = np.abs(vectors).max(axis=1, keepdims=True) / 127.0
+    scale[scale == 0] = 1.0
+    quantized = np.round(vectors / scale).astype(np.int8)
+    return quantized, scale.astype(np.float32)
+
+
+class _SalienceIndex:
+    """
+    Salience items with their normalized embeddings, searchable by cosine
+    similarity.
+    
+    Uses a USearch HNSW index when installed, so a lookup stays roughly
+    O(log N) as the salience set grows; otherwise an exact dot product
+    against the stacked embeddings. With quantize=True embeddings are stored
+    as int8 (a quarter of the float32 size) and dequantized once into the
+    float32 matrix that queries are scored against.
+    """
+    
+    def __init__(self, quantize: bool = False):
+        self.items: List[str] = []
+        self.quantize = quantize
+        self._rows: List[np.ndarray] = []
+        self._scales: List[np.ndarray] = []
+        # float32 scoring matrix stacked from _rows, rebuilt after changes
+        self._matrix: Optional[np.ndarray] = None
+        self._ann = None
+        # USearch key of each item by position; keys only diverge from
+        # positions once keep() has dropped items
+        self._keys: List[int] = []
+        self._next_key = 0
+    
+    def nearest(self, vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the closest stored item for each row of vectors in one call.
+        
+        Returns:
+            Tuple of (positions, cosine similarities); position is -1 and
+            similarity -1.0 where there is nothing to compare against
+        """
+        count = len(vectors)
+        if not self.items:
+            return np.full(count, -1), np.full(count, -1.0)
+        if self._ann is not None:
+            matches = self._ann.search(vectors, 1)
+            return (
+                self._positions(matches.keys.reshape(count).astype(np.int64)),
+                1.0 - matches.distances.reshape(count).astype(np.float64),
+            )
+        scores = self._scores(vectors)
+        positions = scores.argmax(axis=1)
+        return positions, scores[np.arange(count), positions]
+    
+    def similarities(self, vector: np.ndarray) -> np.ndarray:
+        """
+        Cosine similarity of every stored item to one vector.
+        
+        Every item is scored: HNSW search can return fewer than the k
+        neighbours asked for, so the USearch path runs its exact search.
+        
+        Returns:
+            Similarities by item position
+        """
+        if self._ann is not None:
+            similarities = np.full(len(self.items), -1.0)
+            if self.items:
+                matches = self._ann.search(vector, len(self.items), exact=True)
+                similarities[self._positions(matches.keys.astype(np.int64))] = (
+                    1.0 - matches.distances.astype(np.float64)
+                )
+            return similarities
+        if not self.items:
+            return np.zeros(0)
+        return self._scores(vector[np.newaxis, :])[0]
+    
+    def _scores(self, vectors: np.ndarray) -> np.ndarray:
+        """Exact similarities of each row of vectors against every stored item."""
+        if self._matrix is None:
+            self._matrix = np.stack(self._rows)
+            if self.quantize:
+                # Widened once per change to the set, not on every query
+                self._matrix = self._matrix.astype(np.float32) * np.concatenate(self._scales)[:, np.newaxis]
+        # One GEMM of the new embeddings against the stored ones
+        return vectors @ self._matrix.T
+    
+    def _positions(self, keys: np.ndarray) -> np.ndarray:
+        """Map USearch keys to item positions (keys are kept in ascending order)."""
+        if self._next_key == len(self.items):
+            return keys
+        return np.searchsorted(np.asarray(self._keys), keys)
+    
+    def add(self, item: str, vector: np.ndarray) -> None:
+        """Append an item; its position is its key in the index."""
+        if USEARCH_AVAILABLE:
+            if self._ann is None:
+                dtype = "i8" if self.quantize else "f32"
+                self._ann = USearchIndex(ndim=len(vector), metric="cos", dtype=dtype)
+            self._ann.add(self._next_key, vector)
+            self._keys.append(self._next_key)
+            self._next_key += 1
+        elif self.quantize:
+            quantized, scale = _quantize_int8(vector[np.newaxis, :])
+            self._rows.append(quantized[0])
+            self._scales.append(scale[0])
+            self._matrix = None
+        else:
+            self._rows.append(vector)
+            self._matrix = None
+        self.items.append(item)
+    
+    def replace(self, position: int, item: str) -> None:
+        """
+        Swap in a near-duplicate item at a position.
+        
+        The stored embedding is kept: the two items are within the
+        similarity threshold of each other.
+        """
+        self.items[position] = item
+    
+    def keep(self, positions: List[int]) -> None:
+        """Drop every item not at one of positions (given in ascending order)."""
+        if self._ann is not None:
+            kept = set(positions)
+            dropped = [key for position, key in enumerate(self._keys) if position not in kept]
+            if dropped:
+                self._ann.remove(dropped)
+            self._keys = [self._keys[position] for position in positions]
+        else:
+            self._rows = [self._rows[position] for position in positions]
+            if self.quantize:
+                self._scales = [self._scales[position] for position in positions]
+            self._matrix = None
+        self.items = [self.items[position] for position in positions]
+
+
+@dataclass(frozen=True)
+class SelectiveSalienceConfig:
+    """
+    Strategy H settings, without the clients and models built from them.
+    
+    Picklable, so it can be sent to worker processes; each worker builds
+    its strategy with SelectiveSalienceStrategy.from_config(), loading the
+    embedder and tokenizer once per process through the module-level caches.
+    These field defaults are also SelectiveSalienceStrategy.__init__'s
+    defaults; see its docstring for what each field does.
+    """
+    extraction_model: str = "gpt-4o"
+    compression_model: str = "gpt-4o-mini"
+    similarity_threshold: float = 0.85
+    batch_mode: bool = False
+    quantize_embeddings: bool = False
+    stream_extraction: bool = False
+    extraction_min_tokens: int = 0
+    salience_token_budget: Optional[int] = None
+    onnx_embeddings: bool = False
+    extractive_background_tokens: int = 0
+
 
 class SelectiveSalienceStrategy(CompressionStrategy):
     """
@@ -44,42 +444,125 @@ class SelectiveSalienceStrategy(CompressionStrategy):
     what information they'll need later?
     """
     
+    # Turns kept verbatim in the RECENT TURNS section
+    RECENT_TURNS = 3
+    
+    # Background summaries remembered for reuse (LRU)
+    BACKGROUND_CACHE_SIZE = 8
+    
+    # Turn token counts remembered for reuse (LRU)
+    TURN_TOKEN_CACHE_SIZE = 1024
+    
+    # Sentences kept in an extractive background summary
+    EXTRACTIVE_SENTENCES = 2
+    
+    # Weight of recency against goal similarity when trimming the salience
+    # set to salience_token_budget (newest item: full weight, oldest: none)
+    SALIENCE_RECENCY_WEIGHT = 0.2
+    
     def __init__(
         self,
-        extraction_model: str = "gpt-4o",
-        compression_model: str = "gpt-4o-mini",
-        similarity_threshold: float = 0.85,
+        extraction_model: str = SelectiveSalienceConfig.extraction_model,
+        compression_model: str = SelectiveSalienceConfig.compression_model,
+        similarity_threshold: float = SelectiveSalienceConfig.similarity_threshold,
+        batch_mode: bool = SelectiveSalienceConfig.batch_mode,
+        quantize_embeddings: bool = SelectiveSalienceConfig.quantize_embeddings,
+        stream_extraction: bool = SelectiveSalienceConfig.stream_extraction,
+        extraction_min_tokens: int = SelectiveSalienceConfig.extraction_min_tokens,
+        salience_token_budget: Optional[int] = SelectiveSalienceConfig.salience_token_budget,
+        onnx_embeddings: bool = SelectiveSalienceConfig.onnx_embeddings,
+        extractive_background_tokens: int = SelectiveSalienceConfig.extractive_background_tokens,
     ):
         """
         Initialize Strategy H with configuration.
         
+        Defaults come from SelectiveSalienceConfig, so the two can't drift.
+        
         Args:
             extraction_model: Model to use for salience extraction (default: gpt-4o)
             compression_model: Model to use for background compression (default: gpt-4o-mini)
             similarity_threshold: Cosine similarity threshold for deduplication (default: 0.85)
-        
-        Note: No token budget limit - we rely on semantic deduplication to prevent
-        unbounded growth. Token usage is tracked for monitoring/logging purposes.
+            batch_mode: Queue background compression requests for the OpenAI
+                Batch API instead of calling the model (offline evaluation only;
+                the compressed context, and any later compression of it, gets
+                a placeholder summary, so probes answered from it don't measure
+                this strategy; the harness drops those metrics in batch mode)
+            quantize_embeddings: Store salience embeddings as int8 for
+                deduplication (4x smaller; similarities shift by well under 0.01,
+                so it is off by default)
+            stream_extraction: Stream the extraction response and parse salient
+                items as they complete, embedding them while the model is still
+                generating (requires ijson)
+            extraction_min_tokens: Contexts shorter than this many tokens skip
+                both LLM calls; their user messages are kept verbatim as
+                salience and there is no background summary (default: 0, off)
+            salience_token_budget: Maximum tokens in the salience set; once
+                exceeded, the items with the best goal similarity and recency
+                per token are kept (default: None, no limit)
+            onnx_embeddings: Embed with an int8 ONNX Runtime export of the
+                sentence-transformer (built under ONNX_MODEL_DIR on first use;
+                needs onnxruntime, and optimum for the export)
+            extractive_background_tokens: Contexts shorter than this many tokens
+                get an extractive TextRank background summary instead of a
+                compression-model call (default: 0, off)
+        
+        Note: Semantic deduplication keeps near-duplicates out of the salience
+        set; the token budget bounds what remains.
         """
         self.extraction_model = extraction_model
         self.compression_model = compression_model
         self.similarity_threshold = similarity_threshold
+        self.batch_mode = batch_mode
+        self.quantize_embeddings = quantize_embeddings
+        self.stream_extraction = stream_extraction
+        self.extraction_min_tokens = extraction_min_tokens
+        self.salience_token_budget = salience_token_budget
+        self.onnx_embeddings = onnx_embeddings
+        self.extractive_background_tokens = extractive_background_tokens
+        
+        # Background compression requests queued in batch_mode
+        self.pending_background: List[Dict[str, Any]] = []
+        
+        # Background summaries keyed by the turns they summarize (see
+        # _background_cache_key), most recently used last
+        self._bg_cache: "OrderedDict[bytes, str]" = OrderedDict()
+        
+        # Token counts of turn contents, keyed by _turn_key(), most recently
+        # used last
+        self._turn_tokens: "OrderedDict[bytes, int]" = OrderedDict()
         
         # Initialize OpenAI client
         self.client = OpenAI()
         
         # Initialize sentence transformer for semantic deduplication
         # Using all-MiniLM-L6-v2 for fast, accurate similarity detection
-        self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
+        self.embedding_model = _get_embedder('all-MiniLM-L6-v2', onnx_embeddings)
         
         # Initialize tiktoken encoder for token counting (for tracking/monitoring)
         # Using gpt-4o encoding (cl100k_base) for accurate token counting
-        self.token_encoder = tiktoken.encoding_for_model("gpt-4o")
+        self.token_encoder = _get_token_encoder("gpt-4o")
         
         # State variables (initialized in initialize())
         self.original_goal: Optional[str] = None
         self.constraints: List[str] = []
         self.salience_set: List[str] = []
+        self._compile_extract_prompt()
+        
+        # Embedding index over salience_set, kept across compressions so
+        # existing items aren't re-encoded and each new item is one lookup
+        self._salience_index = _SalienceIndex(self.quantize_embeddings)
+        
+        # Token count of each salience item, and the (goal, embedding) the
+        # salience budget scores items against
+        self._salience_tokens: Dict[str, int] = {}
+        self._goal_embedding: Optional[Tuple[str, np.ndarray]] = None
+        
+        # Prompt tokens served from OpenAI's prompt cache (running total)
+        self.cached_prompt_tokens = 0
+        
+        # Embeddings of streamed salient items, computed during extraction
+        # and picked up by the next _merge_salience()
+        self._streamed_embeddings: Dict[str, np.ndarray] = {}
         
         logger.info(f"Initialized {self.name()} with extraction_model={extraction_model}, "
                    f"compression_model={compression_model}, "
@@ -88,6 +571,18 @@ class SelectiveSalienceStrategy(CompressionStrategy):
         # Log initialization for debugging (suppressed by default - verbose logging)
         # self.log(f"Strategy H initialized with models: extraction={extraction_model}, compression={compression_model}")
     
+    @classmethod
+    def from_config(cls, config: SelectiveSalienceConfig) -> "SelectiveSalienceStrategy":
+        """Build a strategy from a SelectiveSalienceConfig."""
+        return cls(**asdict(config))
+    
+    @property
+    def config(self) -> SelectiveSalienceConfig:
+        """This strategy's settings as a picklable SelectiveSalienceConfig."""
+        return SelectiveSalienceConfig(**{
+            name: getattr(self, name) for name in SelectiveSalienceConfig.__dataclass_fields__
+        })
+    
     def initialize(self, original_goal: str, constraints: List[str]) -> None:
         """
         Store initial goal and constraints for salience extraction guidance.
@@ -99,6 +594,9 @@ class SelectiveSalienceStrategy(CompressionStrategy):
         self.original_goal = original_goal
         self.constraints = constraints
         self.salience_set = []
+        self._bg_cache.clear()
+        self._turn_tokens.clear()
+        self._compile_extract_prompt()
         
         # Log initialization (suppressed by default - verbose logging)
         # self.log(f"Initialized with goal: {original_goal}")
@@ -117,6 +615,7 @@ class SelectiveSalienceStrategy(CompressionStrategy):
             rationale: Why the goal changed (optional)
         """
         self.original_goal = new_goal
+        self._compile_extract_prompt()
         if rationale:
             self.log(f"Goal updated: {new_goal} (Rationale: {rationale})")
         else:
@@ -134,8 +633,15 @@ class SelectiveSalienceStrategy(CompressionStrategy):
         Steps:
         1. Extract salient information (verbatim quotes)
         2. Merge with existing salience set (deduplicate)
-        3. Compress background (everything except salient items)
-        4. Rebuild context: SYSTEM + SALIENT + BACKGROUND + RECENT
+        3. Compress background (everything except previously salient items),
+           concurrently with steps 1-2
+        4. Trim the salience set to salience_token_budget
+        5. Rebuild context: SYSTEM + SALIENT + BACKGROUND + RECENT
+        
+        Contexts under extraction_min_tokens skip steps 1-3: their user
+        messages become salience verbatim and there is no background.
+        Contexts under extractive_background_tokens get an extractive
+        background summary instead of a compression-model call.
         
         Args:
             context: List of conversation turns
@@ -153,24 +659,33 @@ class SelectiveSalienceStrategy(CompressionStrategy):
             self.log("Nothing to compress")
             return self._build_context([], "", [])
         
-        # Step 1: Extract salient information
-        new_salience = self._extract_salient_information(to_compress)
-        new_salience_tokens = sum(self._token_count(item) for item in new_salience)
-        self.log(f"Extracted {len(new_salience)} salient items ({new_salience_tokens} tokens)")
-        
-        # Step 2: Merge with existing salience set (with deduplication)
-        self.salience_set = self._merge_salience(self.salience_set, new_salience)
-        salience_set_tokens = sum(self._token_count(item) for item in self.salience_set)
+        # Counts are cached on the turns, so this also serves the ratio below
+        original_tokens = sum(self._count_turn_tokens(turn) for turn in to_compress)
+        
+        if original_tokens < self.extraction_min_tokens:
+            # Shorter than the extraction prompt itself: skip both LLM calls
+            # and keep the user messages verbatim as salience
+            self.log(f"Only {original_tokens} tokens to compress; keeping user messages verbatim")
+            new_salience = [
+                str(turn.get("content", "")) for turn in to_compress
+                if turn.get("role") == "user" and turn.get("content")
+            ]
+            self.salience_set = self._merge_salience(self.salience_set, new_salience)
+            background_summary = ""
+        else:
+            background_summary = self._compress_with_llm(
+                trigger_point, to_compress,
+                extractive_background=original_tokens < self.extractive_background_tokens,
+            )
+        self.salience_set = self._fit_salience_budget(self.salience_set)
+        salience_set_tokens = sum(self._salience_item_tokens(item) for item in self.salience_set)
         self.log(f"Salience set now contains {len(self.salience_set)} items ({salience_set_tokens} tokens total)")
-        
-        # Step 3: Compress background (use current salience set for deduplication)
-        background_summary = self._compress_background(to_compress, self.salience_set)
         background_tokens = self._token_count(background_summary)
         self.log(f"Background compressed to {len(background_summary)} chars ({background_tokens} tokens)")
         
         # Step 4: Get recent turns (last 3 turns)
-        recent_turns = context[max(0, trigger_point - 3):trigger_point]
-        recent_tokens = sum(self._token_count(str(turn.get("content", ""))) for turn in recent_turns)
+        recent_turns = context[max(0, trigger_point - self.RECENT_TURNS):trigger_point]
+        recent_tokens = sum(self._count_turn_tokens(turn) for turn in recent_turns)
         
         # Step 5: Prioritize salience items (constraints first, then decisions, then facts)
         prioritized_salience = self._prioritize_items(self.salience_set)
@@ -183,7 +698,6 @@ class SelectiveSalienceStrategy(CompressionStrategy):
         )
         
         # Track token usage
-        original_tokens = sum(self._token_count(str(turn.get("content", ""))) for turn in to_compress)
         compressed_tokens = self._token_count(compressed_context)
         compression_ratio = self.get_compression_ratio(original_tokens, compressed_tokens)
         
@@ -194,12 +708,81 @@ class SelectiveSalienceStrategy(CompressionStrategy):
         
         return compressed_context
     
+    def _compress_with_llm(
+        self,
+        trigger_point: int,
+        to_compress: List[Dict[str, Any]],
+        extractive_background: bool = False,
+    ) -> str:
+        """
+        Run salience extraction and background compression for compress().
+        
+        Both LLM calls are in flight at once. The new salient items are
+        merged into self.salience_set.
+        
+        Args:
+            trigger_point: Which turn index is being compressed up to
+            to_compress: Turns before the trigger point
+            extractive_background: Summarize the background with
+                _extractive_background() instead of the compression model
+        
+        Returns:
+            Background summary (a placeholder in batch_mode)
+        """
+        # Format the turns once; both LLM prompts embed the same text
+        context_text = self.format_context(to_compress)
+        
+        # Background compression dedups against the salience set from
+        # previous compressions, so it doesn't wait for this round's extraction
+        previous_salience = list(self.salience_set)
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Step 3 (started first): Compress background in the background,
+            # so both LLM calls are in flight at once. In batch_mode it is
+            # queued for the Batch API instead.
+            background_future = None
+            if extractive_background:
+                background_future = executor.submit(self._extractive_background, context_text)
+            elif not self.batch_mode:
+                background_future = executor.submit(
+                    self._compress_background, to_compress, previous_salience, context_text
+                )
+            
+            # Step 1: Extract salient information
+            new_salience = self._extract_salient_information(to_compress, context_text)
+            new_salience_tokens = sum(self._token_count(item) for item in new_salience)
+            self.log(f"Extracted {len(new_salience)} salient items ({new_salience_tokens} tokens)")
+            
+            # Step 2: Merge with existing salience set (with deduplication)
+            self.salience_set = self._merge_salience(self.salience_set, new_salience)
+            
+            if background_future is not None:
+                return background_future.result()
+            else:
+                self.enqueue_background(
+                    trigger_point,
+                    self._background_prompt(to_compress, previous_salience, context_text),
+                )
+                return f"Previous conversation context ({len(to_compress)} turns)."
+    
     def name(self) -> str:
         """Return the strategy's human-readable name."""
         return "Strategy H - Selective Salience Compression"
     
+    def _compile_extract_prompt(self) -> None:
+        """
+        Build the extraction prompt up to the conversation text.
+        
+        Called whenever the goal or constraints change, so each extraction
+        only has to append the conversation text.
+        """
+        constraints_text = ", ".join(self.constraints) if self.constraints else "None"
+        self._extract_prompt_prefix = _EXTRACT_PROMPT_HEADER + _EXTRACT_PROMPT_GOAL.format(
+            goal=self.original_goal, constraints=constraints_text
+        )
+    
     def _extract_salient_information(
-        self, context: List[Dict[str, Any]]
+        self, context: List[Dict[str, Any]], context_text: Optional[str] = None
     ) -> List[str]:
         """
         Extract goal-critical information verbatim.
@@ -209,59 +792,33 @@ class SelectiveSalienceStrategy(CompressionStrategy):
         
         Args:
             context: List of conversation turns to analyze
+            context_text: context already passed through format_context()
+                (formatted here if not given)
         
         Returns:
             List of verbatim quotes that are goal-critical
         """
-        # Format context for prompt
-        context_text = self.format_context(context)
+        if context_text is None:
+            context_text = self.format_context(context)
         
-        # Build extraction prompt
-        constraints_text = ", ".join(self.constraints) if self.constraints else "None"
-        
-        prompt = f"""You are performing selective salience extraction for context compression.
-
-From the following conversation, extract ONLY the information that will directly impact the agent's ability to achieve the user's goal.
-
-Original Goal: {self.original_goal}
-Constraints: {constraints_text}
-
-Include:
-- Explicit goals and goal changes
-- Hard constraints (must/must not)
-- Key decisions with rationales
-- Critical facts or requirements
-- Important tool outputs that affect future actions
-
-Do NOT include:
-- Conversational scaffolding
-- Redundant explanations
-- Intermediate reasoning steps
-- Off-topic tangents
-
-CRITICAL: Quote exactly—do not summarize or paraphrase. Preserve the original wording.
-
-Conversation to analyze:
-{context_text}
-
-Output format (JSON):
-{{
-  "salient_items": [
-    "exact quote 1",
-    "exact quote 2",
-    ...
-  ]
-}}"""
+        # Splice the conversation into the prompt compiled for the current goal
+        prompt = self._extract_prompt_prefix + context_text
         
         try:
+            if self.stream_extraction and IJSON_AVAILABLE:
+                salient_items = self._stream_salient_items(prompt)
+                self.log(f"Extracted {len(salient_items)} salient items (streamed)")
+                return salient_items
+            
             response = self.client.chat.completions.create(
                 model=self.extraction_model,
                 max_tokens=2000,
                 messages=[{"role": "user", "content": prompt}],
                 response_format={"type": "json_object"},
             )
+            self._record_cached_tokens(response)
             
-            result = json.loads(response.choices[0].message.content)
+            result = _json_loads(response.choices[0].message.content)
             salient_items = result.get("salient_items", [])
             
             if not isinstance(salient_items, list):
@@ -274,7 +831,7 @@ Output format (JSON):
             self.log(f"Extracted {len(salient_items)} salient items")
             return salient_items
         
-        except json.JSONDecodeError as e:
+        except _JSON_ERRORS as e:
             logger.error(f"Failed to parse JSON response: {e}")
             self.log(f"Salience extraction failed: JSON parse error, using fallback")
             return self._fallback_extract_constraints(context)
@@ -284,8 +841,107 @@ Output format (JSON):
             # Fallback: extract constraints using Protected Core schema
             return self._fallback_extract_constraints(context)
     
+    def _stream_salient_items(self, prompt: str) -> List[str]:
+        """
+        Stream the extraction response, parsing salient items as they complete.
+        
+        Each finished "salient_items" string is queued for embedding; batches
+        of STREAM_EMBED_BATCH_SIZE are encoded on a worker thread while the
+        model keeps generating, and the vectors are left for _merge_salience().
+        
+        Args:
+            prompt: Salience extraction prompt
+        
+        Returns:
+            List of non-empty salient items, in response order
+        """
+        stream = self.client.chat.completions.create(
+            model=self.extraction_model,
+            max_tokens=2000,
+            messages=[{"role": "user", "content": prompt}],
+            response_format={"type": "json_object"},
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        
+        salient_items: List[str] = []
+        parsed = ijson.sendable_list()
+        parser = ijson.items_coro(parsed, "salient_items.item")
+        batch: List[str] = []
+        futures = []
+        
+        def submit() -> None:
+            nonlocal batch
+            start = len(salient_items) - len(batch)
+            futures.append((start, executor.submit(self._encode_salience, batch)))
+            batch = []
+        
+        def collect() -> None:
+            for item in parsed:
+                if isinstance(item, str) and item.strip():
+                    salient_items.append(item)
+                    batch.append(item)
+            del parsed[:]
+            if len(batch) >= STREAM_EMBED_BATCH_SIZE:
+                submit()
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            for chunk in stream:
+                if not chunk.choices:
+                    # The final chunk carries only usage
+                    self._record_cached_tokens(chunk)
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parser.send(delta.encode("utf-8"))
+                    collect()
+            parser.close()
+            collect()
+            if batch:
+                submit()
+            
+            for start, future in futures:
+                vectors = future.result()
+                for item, vector in zip(salient_items[start:start + len(vectors)], vectors):
+                    self._streamed_embeddings[item] = vector
+        
+        return salient_items
+    
+    def _record_cached_tokens(self, response: Any) -> None:
+        """
+        Add the response's cached prompt tokens to cached_prompt_tokens.
+        
+        Args:
+            response: Chat completion (or final stream chunk) with usage
+        """
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = getattr(details, "cached_tokens", None)
+        if isinstance(cached, int) and cached > 0:
+            self.cached_prompt_tokens += cached
+            self.log(f"Prompt cache hit: {cached} of {usage.prompt_tokens} prompt tokens")
+    
+    def _encode_salience(self, items: List[str]) -> np.ndarray:
+        """
+        Embed salience items into a contiguous, normalized float32 [N, dim] matrix.
+        
+        Args:
+            items: Items to embed
+        
+        Returns:
+            One normalized embedding row per item
+        """
+        vectors = self.embedding_model.encode(
+            items, batch_size=64, normalize_embeddings=True,
+            convert_to_numpy=True, show_progress_bar=False,
+        )
+        return np.asarray(vectors, dtype=np.float32)
+    
     def _compress_background(
-        self, context: List[Dict[str, Any]], salience_set: List[str]
+        self,
+        context: List[Dict[str, Any]],
+        salience_set: List[str],
+        context_text: Optional[str] = None,
     ) -> str:
         """
         Compress everything except salient items.
@@ -295,33 +951,19 @@ Output format (JSON):
         Args:
             context: List of conversation turns
             salience_set: List of salient items to avoid duplicating
+            context_text: context already passed through format_context()
+                (formatted here if not given)
         
         Returns:
             Compressed summary of background information
         """
-        # Format context for prompt
-        context_text = self.format_context(context)
+        cache_key = self._background_cache_key(context)
+        if cache_key is not None and cache_key in self._bg_cache:
+            self._bg_cache.move_to_end(cache_key)
+            self.log("Background unchanged since a previous compression, reusing its summary")
+            return self._bg_cache[cache_key]
         
-        # Format salience set for prompt
-        salience_text = "\n".join(f"- {item}" for item in salience_set) if salience_set else "None"
-        
-        # Build compression prompt
-        prompt = f"""You are compressing conversation background for context compression.
-
-The following salient information has already been extracted and will be preserved verbatim:
-{salience_text}
-
-Compress the rest of the conversation into a 2-3 sentence summary. Do NOT duplicate the salient items listed above.
-
-Focus on:
-- General context and flow
-- Non-critical details
-- Conversational scaffolding
-
-Conversation to compress:
-{context_text}
-
-Provide a concise 2-3 sentence summary:"""
+        prompt = self._background_prompt(context, salience_set, context_text)
         
         try:
             response = self.client.chat.completions.create(
@@ -329,9 +971,14 @@ Provide a concise 2-3 sentence summary:"""
                 max_tokens=500,
                 messages=[{"role": "user", "content": prompt}],
             )
+            self._record_cached_tokens(response)
             
             summary = response.choices[0].message.content.strip()
             self.log(f"Background compressed to {len(summary)} chars")
+            if cache_key is not None:
+                self._bg_cache[cache_key] = summary
+                if len(self._bg_cache) > self.BACKGROUND_CACHE_SIZE:
+                    self._bg_cache.popitem(last=False)
             return summary
         
         except Exception as e:
@@ -342,6 +989,120 @@ Provide a concise 2-3 sentence summary:"""
             logger.info(f"Using fallback summary: {fallback_summary}")
             return fallback_summary
     
+    def _extractive_background(self, context_text: str) -> str:
+        """
+        Summarize a short conversation by picking its most central sentences.
+        
+        Runs a few TextRank iterations over the cosine similarity graph of
+        the sentence embeddings (from the deduplication embedder) and keeps
+        the top EXTRACTIVE_SENTENCES sentences in conversation order.
+        
+        Args:
+            context_text: Formatted conversation text
+        
+        Returns:
+            Extractive summary
+        """
+        sentences = [s.strip() for s in _SENTENCE_SPLIT.split(context_text) if s.strip()]
+        if len(sentences) <= self.EXTRACTIVE_SENTENCES:
+            return " ".join(sentences)
+        
+        vectors = self._encode_salience(sentences)
+        similarities = np.clip(vectors @ vectors.T, 0.0, None)
+        np.fill_diagonal(similarities, 0.0)
+        out_weight = similarities.sum(axis=1)
+        out_weight[out_weight == 0] = 1.0
+        
+        scores = np.ones(len(sentences))
+        for _ in range(3):
+            scores = 0.15 + 0.85 * similarities.T @ (scores / out_weight)
+        
+        top = np.sort(np.argsort(-scores, kind="stable")[:self.EXTRACTIVE_SENTENCES])
+        return " ".join(sentences[i] for i in top)
+    
+    def _background_cache_key(self, context: List[Dict[str, Any]]) -> Optional[bytes]:
+        """
+        Hash the turns older than the recent window.
+        
+        The most recent turns are kept verbatim in the rebuilt context, so a
+        summary is reusable whenever the older turns are unchanged.
+        
+        Args:
+            context: List of conversation turns being compressed
+        
+        Returns:
+            16-byte digest, or None when every turn falls in the recent window
+        """
+        older = context[:-self.RECENT_TURNS]
+        if not older:
+            return None
+        # Combines the per-turn content digests, so unchanged turns aren't rehashed
+        digest = hashlib.blake2b(self.compression_model.encode("utf-8"), digest_size=16)
+        for turn in older:
+            digest.update(f"\x1e{turn.get('id', '?')}\x1f{turn.get('role', '')}\x1f".encode("utf-8"))
+            digest.update(_turn_key(turn))
+        return digest.digest()
+    
+    def _background_prompt(
+        self,
+        context: List[Dict[str, Any]],
+        salience_set: List[str],
+        context_text: Optional[str] = None,
+    ) -> str:
+        """
+        Build the background compression prompt.
+        
+        Args:
+            context: List of conversation turns
+            salience_set: List of salient items to avoid duplicating
+            context_text: context already passed through format_context()
+        
+        Returns:
+            Prompt for the compression model
+        """
+        if context_text is None:
+            context_text = self.format_context(context)
+        
+        # Format salience set for prompt
+        salience_text = "\n".join(f"- {item}" for item in salience_set) if salience_set else "None"
+        
+        return "".join((
+            _BACKGROUND_PROMPT_HEADER,
+            salience_text,
+            _BACKGROUND_PROMPT_CONVERSATION,
+            context_text,
+        ))
+    
+    def enqueue_background(self, turn_id: Any, prompt: str) -> None:
+        """
+        Queue a background compression request for the OpenAI Batch API.
+        
+        Args:
+            turn_id: Compression point the summary belongs to (custom_id)
+            prompt: Background compression prompt
+        """
+        self.pending_background.append({
+            "custom_id": str(turn_id),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": self.compression_model,
+                "max_tokens": 500,
+                "messages": [{"role": "user", "content": prompt}],
+            },
+        })
+        self.log(f"Queued background compression for turn {turn_id} (batch mode)")
+    
+    def drain_background_requests(self) -> List[Dict[str, Any]]:
+        """
+        Return the queued background compression requests and clear the queue.
+        
+        Returns:
+            Batch API request lines, custom_id set to the compression turn id
+        """
+        requests, self.pending_background = self.pending_background, []
+        return requests
+    
     def _build_context(
         self,
         salience_set: List[str],
@@ -382,11 +1143,14 @@ Provide a concise 2-3 sentence summary:"""
         # RECENT TURNS section
         if recent_turns:
             parts.append("=== RECENT TURNS ===")
-            for turn in recent_turns:
-                turn_id = turn.get("id", "?")
-                role = turn.get("role", "unknown")
-                content = turn.get("content", "")
-                parts.append(f"Turn {turn_id} ({role}): {content}")
+            # Pull each field into its own column once, then format row-wise
+            ids = [turn.get("id", "?") for turn in recent_turns]
+            roles = [turn.get("role", "unknown") for turn in recent_turns]
+            contents = [turn.get("content", "") for turn in recent_turns]
+            parts.append("\n".join(
+                f"Turn {turn_id} ({role}): {content}"
+                for turn_id, role, content in zip(ids, roles, contents)
+            ))
             parts.append("")
         
         return "\n".join(parts)
@@ -407,6 +1171,31 @@ Provide a concise 2-3 sentence summary:"""
             return 0
         return len(self.token_encoder.encode(text))
     
+    def _count_turn_tokens(self, turn: Dict[str, Any]) -> int:
+        """
+        Count tokens in a turn's content, caching the count by content digest.
+        
+        Turns before the trigger point are counted again at every later
+        compression; keyed by _turn_key(), each distinct content is only
+        encoded once while it stays among the TURN_TOKEN_CACHE_SIZE most
+        recently counted, even when it reappears in a new turn dict.
+        
+        Args:
+            turn: Conversation turn dictionary
+        
+        Returns:
+            Number of tokens in the turn's content
+        """
+        key = _turn_key(turn)
+        count = self._turn_tokens.get(key)
+        if count is not None:
+            self._turn_tokens.move_to_end(key)
+            return count
+        count = self._turn_tokens[key] = self._token_count(str(turn.get("content", "")))
+        if len(self._turn_tokens) > self.TURN_TOKEN_CACHE_SIZE:
+            self._turn_tokens.popitem(last=False)
+        return count
+    
     def _deduplicate_semantically(
         self, items: List[str], threshold: Optional[float] = None
     ) -> List[str]:
@@ -430,11 +1219,11 @@ Provide a concise 2-3 sentence summary:"""
             threshold = self.similarity_threshold
         
         try:
-            # Generate embeddings for all items
-            embeddings = self.embedding_model.encode(items, show_progress_bar=False)
+            # Generate normalized embeddings for all items
+            embeddings = self._encode_salience(items)
             
-            # Calculate cosine similarity matrix
-            similarity_matrix = cosine_similarity(embeddings)
+            # Cosine similarity of unit vectors is their dot product
+            similarity_matrix = embeddings @ embeddings.T
             
             # Find duplicates
             to_remove = set()
@@ -471,8 +1260,10 @@ Provide a concise 2-3 sentence summary:"""
         """
         Merge new salience items with existing salience set.
         
-        Combines the lists, then deduplicates semantically to prevent
-        unbounded growth while preserving all unique information.
+        Each new item is looked up in the embedding index of the salience
+        set. Near-duplicates (similarity above the threshold) are not added;
+        if the new wording is shorter it replaces the existing item. This
+        prevents unbounded growth while preserving all unique information.
         
         Args:
             existing: Current salience set
@@ -484,21 +1275,67 @@ Provide a concise 2-3 sentence summary:"""
         if not new:
             return existing
         
-        if not existing:
-            # If no existing items, just deduplicate the new items
-            return self._deduplicate_semantically(new)
-        
-        # Combine existing and new items
-        combined = existing + new
+        try:
+            index = self._salience_index
+            to_embed = new
+            if index.items != existing:
+                # Salience set was reset or replaced: re-index it, embedding
+                # it in the same call as the new items
+                index = _SalienceIndex(self.quantize_embeddings)
+                to_embed = existing + new
+            
+            # One encode call into a contiguous float32 [N, dim] matrix;
+            # stored items are only embedded when the index is rebuilt, and
+            # items embedded while streaming aren't embedded again
+            streamed, self._streamed_embeddings = self._streamed_embeddings, {}
+            if not streamed:
+                vectors = self._encode_salience(to_embed)
+            else:
+                missing = [item for item in to_embed if item not in streamed]
+                if missing:
+                    streamed.update(zip(missing, self._encode_salience(missing)))
+                vectors = np.stack([streamed[item] for item in to_embed])
+            if to_embed is not new:
+                for item, vector in zip(existing, vectors[:len(existing)]):
+                    index.add(item, vector)
+                vectors = vectors[len(existing):]
+            
+            # Similarities come from two batched products: new items against
+            # the stored salience set, and new items against each other
+            positions, similarities = index.nearest(vectors)
+            within_new = vectors @ vectors.T
+            
+            # Position in the index of each new item (or of the item it merged into)
+            placed: List[int] = []
+            for i, item in enumerate(new):
+                position, similarity = int(positions[i]), float(similarities[i])
+                if i:
+                    earlier = int(within_new[i, :i].argmax())
+                    if within_new[i, earlier] > similarity:
+                        position, similarity = placed[earlier], float(within_new[i, earlier])
+                
+                if similarity > self.similarity_threshold:
+                    # Keep shorter item (more concise)
+                    if len(item) < len(index.items[position]):
+                        index.replace(position, item)
+                    placed.append(position)
+                else:
+                    placed.append(len(index.items))
+                    index.add(item, vectors[i])
+        except Exception as e:
+            logger.error(f"Salience merge failed: {e}", exc_info=True)
+            self.log(f"Deduplication failed: {e}, appending new items")
+            self._salience_index = _SalienceIndex(self.quantize_embeddings)
+            return existing + new
         
-        # Deduplicate the combined list
-        merged = self._deduplicate_semantically(combined)
+        self._salience_index = index
+        merged = list(index.items)
         
         # Log the merge operation
         original_count = len(existing)
         new_count = len(new)
         merged_count = len(merged)
-        removed_count = len(combined) - merged_count
+        removed_count = original_count + new_count - merged_count
         
         if removed_count > 0:
             self.log(f"Merged salience: {original_count} existing + {new_count} new "
@@ -509,6 +1346,61 @@ Provide a concise 2-3 sentence summary:"""
         
         return merged
     
+    def _salience_item_tokens(self, item: str) -> int:
+        """Token count of a salience item, cached across compressions."""
+        count = self._salience_tokens.get(item)
+        if count is None:
+            count = self._salience_tokens[item] = self._token_count(item)
+        return count
+    
+    def _fit_salience_budget(self, items: List[str]) -> List[str]:
+        """
+        Trim the salience set to salience_token_budget tokens.
+        
+        Each item is scored by cosine similarity to the current goal (from
+        the embeddings already in the salience index) plus a recency bonus,
+        and items are accepted greedily by score per token while they fit.
+        Kept items stay in their original order.
+        
+        Args:
+            items: Salience set after merging
+        
+        Returns:
+            Salience set within the token budget
+        """
+        if self.salience_token_budget is None:
+            return items
+        tokens = np.array([self._salience_item_tokens(item) for item in items])
+        # Forget counts for items that have left the salience set
+        self._salience_tokens = dict(zip(items, tokens.tolist()))
+        if tokens.sum() <= self.salience_token_budget:
+            return items
+        
+        index = self._salience_index
+        similarities = np.zeros(len(items))
+        if self.original_goal and index.items == items:
+            goal, goal_vector = self._goal_embedding or (None, None)
+            if goal != self.original_goal:
+                goal_vector = self._encode_salience([self.original_goal])[0]
+                self._goal_embedding = (self.original_goal, goal_vector)
+            similarities = index.similarities(goal_vector)
+        recency = np.arange(len(items)) / max(len(items) - 1, 1)
+        scores = (1.0 + similarities) / 2.0 + self.SALIENCE_RECENCY_WEIGHT * recency
+        
+        kept: List[int] = []
+        total = 0
+        for position in np.argsort(-scores / np.maximum(tokens, 1), kind="stable"):
+            if total + tokens[position] <= self.salience_token_budget:
+                total += int(tokens[position])
+                kept.append(int(position))
+        kept.sort()
+        
+        self.log(f"Salience set over budget ({int(tokens.sum())} > {self.salience_token_budget} tokens): "
+                f"kept {len(kept)}/{len(items)} items ({total} tokens)")
+        if index.items == items:
+            index.keep(kept)
+        return [items[position] for position in kept]
+    
     def _fallback_extract_constraints(
         self, context: List[Dict[str, Any]]
     ) -> List[str]:
@@ -13,6 +13,45 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "integration: requires LLM API keys")
 
 
+@pytest.fixture(scope="session")
+def llm_client():
+    """
+    The metrics LLM client, shared by every test in the session.
+
+    Built once per process (so once per pytest-xdist worker), with a single
+    pooled HTTP connection set. Skips the test if no API key is configured.
+    """
+    from evaluation.metrics import _get_client
+
+    try:
+        return _get_client()
+    except Exception as exc:
+        pytest.skip(f"No LLM API key available: {exc}")
+
+
+@pytest.fixture
+def route_chat_responses():
+    """
+    Build a chat.completions.create side_effect for Strategy H mocks.
+
+    Salience extraction and background compression run concurrently, so
+    responses are handed out by request kind (extraction asks for JSON
+    output) rather than by call order.
+    """
+    def route(extraction_responses, compression_responses):
+        extraction = iter(extraction_responses)
+        compression = iter(compression_responses)
+
+        def create(**kwargs):
+            if "response_format" in kwargs:
+                return next(extraction)
+            return next(compression)
+
+        return create
+
+    return route
+
+
 @pytest.fixture
 def sample_conversation():
     """Sample conversation for testing compression strategies."""
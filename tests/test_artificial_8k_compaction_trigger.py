@@ -6,7 +6,13 @@ at the 8K artificial window threshold.
 """
 
 import pytest
-from evaluation.token_budget import TokenBudget, should_compact, estimate_tokens, BUDGET_8K
+from evaluation.token_budget import (
+    TokenBudget,
+    should_compact,
+    estimate_tokens,
+    estimate_tokens_batch,
+    BUDGET_8K,
+)
 from strategies.strategy_b_codex import StrategyB_CodexCheckpoint
 
 
@@ -35,6 +41,12 @@ def test_estimate_tokens_deterministic():
     assert estimate_tokens(text2) == tokens2
 
 
+def test_estimate_tokens_batch_matches_single():
+    """Batch estimation should agree with per-text estimation."""
+    texts = ["hello", "hello world", "", "The budget is $50k. Deadline: Q3."]
+    assert estimate_tokens_batch(texts) == [estimate_tokens(t) for t in texts]
+
+
 def test_should_compact_below_threshold():
     """Test that should_compact returns False for prompts below trigger threshold."""
     budget = BUDGET_8K
@@ -6,7 +6,11 @@ mentions in agent responses at varying levels of specificity.
 
 import pytest
 
-from evaluation.metrics import _constraint_mentioned, _get_client
+from evaluation.metrics import (
+    _constraint_mentioned,
+    _constraint_mentioned_batch,
+    _constraints_mentioned_concurrent,
+)
 
 
 BUDGET_CONSTRAINT = "Budget: maximum $10K implementation cost"
@@ -26,12 +30,9 @@ class TestBudgetJudge:
     """Test LLM-as-judge accuracy on budget constraint detection."""
 
     @pytest.fixture(autouse=True)
-    def _setup_client(self):
-        """Get an LLM client, skip if no API key available."""
-        try:
-            self.client = _get_client()
-        except (ValueError, Exception) as exc:
-            pytest.skip(f"No LLM API key available: {exc}")
+    def _setup_client(self, llm_client):
+        """Use the session's shared LLM client (skips without an API key)."""
+        self.client = llm_client
 
     def test_specific_amount_detected(self):
         """Agent mentioning the specific $10K amount should be detected."""
@@ -50,3 +51,24 @@ class TestBudgetJudge:
         result = _constraint_mentioned(BUDGET_CONSTRAINT, response, self.client, "gpt-4o")
         # This is informational — the judge may or may not flag it
         assert isinstance(result, bool)
+
+    def test_all_responses_judged_concurrently(self):
+        """Judging every test response in one concurrent batch keeps input order."""
+        checks = [(BUDGET_CONSTRAINT, response) for _, response, _ in TEST_RESPONSES]
+        results = _constraints_mentioned_concurrent(checks, self.client, "gpt-4o")
+
+        assert len(results) == len(TEST_RESPONSES)
+        for (name, _, expected), result in zip(TEST_RESPONSES, results):
+            assert isinstance(result, bool), name
+            if expected is not None:
+                assert result == expected, name
+
+    def test_batch_judge_matches_single_checks(self):
+        """Judging several constraints in one request flags the budget constraint."""
+        response = "We have a budget of $10,000 for implementation costs"
+        constraints = [BUDGET_CONSTRAINT, "Timeline: launch within 2 weeks"]
+        results = _constraint_mentioned_batch(constraints, response, self.client, "gpt-4o")
+
+        assert len(results) == len(constraints)
+        assert results[0] is True
+        assert results[1] is False
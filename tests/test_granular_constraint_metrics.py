@@ -3,6 +3,7 @@
 import pytest
 from evaluation.granular_constraint_metrics import (
     categorize_constraint,
+    find_keywords,
     ConstraintCategory,
     measure_granular_constraint_recall,
     GranularConstraintMetrics,
@@ -47,6 +48,13 @@ class TestConstraintCategorization:
         assert categorize_constraint("Handle 10K concurrent connections") == ConstraintCategory.PERFORMANCE
 
 
+    def test_find_keywords_overlapping_and_case_insensitive(self):
+        """Keyword scan finds overlapping keywords in any case, in list order."""
+        keywords = ["budget", "$10", "10K", "cost", "10,000"]
+        found = find_keywords("We have a $10K BUDGET (10,000 USD)", keywords)
+        assert found == ["budget", "$10", "10K", "10,000"]
+
+
 class TestGranularConstraintMetrics:
     """Tests for granular constraint metrics calculation."""
 
@@ -46,3 +46,105 @@ class TestStatistics:
 
         effect_size = calculate_effect_size(group_a, group_b)
         assert abs(effect_size) < 0.01  # Should be ~0
+
+
+class _KeywordJudgeClient:
+    """Stub LLM client that answers "yes" when the prompt contains a keyword."""
+
+    def __init__(self, keyword: str):
+        self.keyword = keyword
+
+    def complete(self, prompt: str, max_tokens: int = 100) -> str:
+        statement = prompt.split("Agent's Statement:", 1)[1].split("\n", 1)[0]
+        return "yes" if self.keyword in statement else "no"
+
+
+class _BatchJudgeClient:
+    """Stub LLM client that answers batch judge prompts with a JSON array."""
+
+    def __init__(self, keyword: str, reply: str = None):
+        self.keyword = keyword
+        self.reply = reply
+        self.calls = 0
+
+    def complete(self, prompt: str, max_tokens: int = 100) -> str:
+        self.calls += 1
+        if self.reply is not None:
+            return self.reply
+        block = prompt.split("Constraints:\n", 1)[1].split("\n\n", 1)[0]
+        return str([self.keyword in line for line in block.splitlines()]).lower()
+
+
+class TestConstraintJudge:
+    """Tests for the constraint-mention judge helpers."""
+
+    def test_concurrent_judge_preserves_order(self):
+        """Concurrent judge results line up with the input checks."""
+        from evaluation.metrics import _constraints_mentioned_concurrent
+
+        checks = [("Budget: max $10K", text) for text in ["$10K cap", "no limit", "about $10K", ""]]
+        results = _constraints_mentioned_concurrent(checks, _KeywordJudgeClient("$10K"), "gpt-4o")
+        assert results == [True, False, True, False]
+
+    def test_judge_cache_skips_repeat_calls(self):
+        """Repeated (constraint, response) checks are answered from the cache."""
+        from evaluation.judge_cache import JudgeCache
+        from evaluation.metrics import _constraint_mentioned, set_judge_cache
+
+        client = _KeywordJudgeClient("$10K")
+        calls = []
+        complete = client.complete
+        client.complete = lambda prompt, max_tokens=100: calls.append(prompt) or complete(prompt, max_tokens)
+
+        cache = JudgeCache()
+        set_judge_cache(cache)
+        try:
+            for _ in range(3):
+                assert _constraint_mentioned("Budget: max $10K", "$10K cap", client, "gpt-4o")
+        finally:
+            set_judge_cache(None)
+
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 2
+
+    def test_judge_cache_separates_judge_prompts(self):
+        """Verdicts from the batch judge are not reused by the single judge."""
+        from evaluation.judge_cache import JudgeCache
+        from evaluation.metrics import (
+            _constraint_mentioned,
+            _constraint_mentioned_batch,
+            set_judge_cache,
+        )
+
+        cache = JudgeCache()
+        set_judge_cache(cache)
+        try:
+            batch_client = _BatchJudgeClient("Budget")
+            _constraint_mentioned_batch(["Budget: max $10K"], "$10K cap", batch_client, "gpt-4o")
+            assert _constraint_mentioned("Budget: max $10K", "$10K cap", _KeywordJudgeClient("$10K"), "gpt-4o")
+        finally:
+            set_judge_cache(None)
+
+        assert cache.stats()["hits"] == 0
+        assert cache.stats()["misses"] == 2
+
+    def test_batch_judge_single_call(self):
+        """All constraints for one statement are judged in one request."""
+        from evaluation.metrics import _constraint_mentioned_batch
+
+        client = _BatchJudgeClient("Budget")
+        constraints = ["Budget: max $10K", "Timeline: 2 weeks", "Budget review monthly"]
+        results = _constraint_mentioned_batch(constraints, "We have $10K", client, "gpt-4o")
+
+        assert results == [True, False, True]
+        assert client.calls == 1
+
+    def test_batch_judge_falls_back_on_malformed_answer(self):
+        """A malformed batch answer falls back to per-constraint judging."""
+        from evaluation.metrics import _constraint_mentioned_batch
+
+        client = _BatchJudgeClient("Budget", reply="[true]")
+        results = _constraint_mentioned_batch(["a", "b"], "stmt", client, "gpt-4o")
+
+        assert results == [False, False]
+        assert client.calls == 3
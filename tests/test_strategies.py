@@ -22,6 +22,37 @@ class TestCompressionStrategyBase:
         with pytest.raises(TypeError):
             CompressionStrategy()
 
+    def test_format_context_reuses_unchanged_prefix(self, monkeypatch):
+        """Only turns appended since the last call should be formatted."""
+        from strategies.strategy_a_naive import StrategyA_NaiveSummarization
+
+        strategy = StrategyA_NaiveSummarization(backend="openai")
+        context = [
+            {"id": 1, "role": "user", "content": "First message"},
+            {"id": 2, "role": "assistant", "content": "First response"},
+        ]
+        assert strategy.format_context(context) == (
+            "Turn 1 (user): First message\nTurn 2 (assistant): First response"
+        )
+
+        formatted = []
+        original = CompressionStrategy._format_turn
+        monkeypatch.setattr(
+            CompressionStrategy, "_format_turn",
+            staticmethod(lambda turn: formatted.append(turn["id"]) or original(turn)),
+        )
+
+        context.append({"id": 3, "role": "user", "content": "Second message"})
+        assert strategy.format_context(context).endswith("Turn 3 (user): Second message")
+        assert formatted == [3]
+
+        # A rewritten context (as after compression) is formatted from scratch
+        rewritten = [{"id": 0, "role": "system", "content": "Summary"}, context[2]]
+        assert strategy.format_context(rewritten) == (
+            "Turn 0 (system): Summary\nTurn 3 (user): Second message"
+        )
+        assert formatted == [3, 0, 3]
+
 
 class TestCodexStrategy:
     """Tests for Codex-style checkpoint strategy."""
@@ -41,6 +72,85 @@ class TestCodexStrategy:
         assert strategy is not None
         assert strategy.name() == "Strategy B - Codex-Style Checkpoint"
 
+    def test_summarize_reuses_cached_summary(self, tmp_path):
+        """Repeated conversations should not hit the LLM again."""
+        from strategies.strategy_b_codex import StrategyB_CodexCheckpoint
+
+        class MockLLMClient:
+            model = "mock"
+
+            def __init__(self):
+                self.calls = 0
+
+            def complete(self, prompt: str, max_tokens: int = 500) -> str:
+                self.calls += 1
+                return "Mock summary"
+
+        cache_path = str(tmp_path / "summaries.db")
+        strategy = StrategyB_CodexCheckpoint(backend="openai", summary_cache_path=cache_path)
+        strategy.client = MockLLMClient()
+        strategy.initialize("Test goal", ["Constraint 1"])
+
+        assert strategy._summarize("User: hi") == "Mock summary"
+        assert strategy._summarize("User: hi") == "Mock summary"
+        assert strategy.client.calls == 1
+
+        # A fresh strategy reads the summary back from the SQLite store
+        fresh = StrategyB_CodexCheckpoint(backend="openai", summary_cache_path=cache_path)
+        fresh.client = MockLLMClient()
+        fresh.initialize("Test goal", ["Constraint 1"])
+        assert fresh._summarize("User: hi") == "Mock summary"
+        assert fresh.client.calls == 0
+
+    def test_prune_filler_keeps_protected_lines(self):
+        """Heuristic pruning drops filler but keeps turn prefixes and protected lines."""
+        from strategies.strategy_b_codex import prune_filler
+
+        text = (
+            "Turn 1 (user): So the budget is really just $10K!!!!\n"
+            "Turn 2 (user): Budget: maximum $10K implementation cost"
+        )
+        pruned = prune_filler(text, ("Budget: maximum $10K implementation cost",))
+
+        first, second = pruned.split("\n")
+        assert first == "Turn 1 (user): budget $10K!"
+        assert second == "Turn 2 (user): Budget: maximum $10K implementation cost"
+
+    def test_truncate_text_keeps_important_lines(self):
+        """Truncation should keep constraint lines even when they come last."""
+        from strategies.strategy_b_codex import StrategyB_CodexCheckpoint
+
+        strategy = StrategyB_CodexCheckpoint(backend="openai")
+        text = (
+            "Hi there, this is a long intro about the team and the weather\n"
+            "some more chit chat that is not important at all really\n"
+            "Budget: maximum $10K"
+        )
+        truncated = strategy._truncate_text(text, 10)
+
+        assert truncated.startswith("Budget: maximum $10K\n")
+        assert "kept 1/3 lines" in truncated
+
+    def test_relevance_selection_keeps_constraint_messages(self, monkeypatch):
+        """BM25 selection should keep goal-relevant and protected messages over chatter."""
+        pytest.importorskip("rank_bm25")
+        import strategies.strategy_b_codex as codex
+
+        monkeypatch.setattr(codex, "COMPACT_USER_MESSAGE_MAX_TOKENS", 30)
+        strategy = codex.StrategyB_CodexCheckpoint(backend="openai", relevance_selection=True)
+        strategy.initialize("Build a CRM for a dental clinic", ["Budget: maximum $10K"])
+
+        messages = [
+            "We need a CRM for the dental clinic.",
+            "Nice weather today, what do you think about the football game last night?",
+            "Budget: maximum $10K",
+            "Also tell me more about the weather and the game please",
+            "What's next?",
+        ]
+        selected = strategy._select_user_messages(messages)
+
+        assert selected == [messages[0], messages[2], messages[4]]
+
 
 class TestNaiveStrategy:
     """Tests for Naive Summarization strategy."""
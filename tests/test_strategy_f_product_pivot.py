@@ -8,7 +8,6 @@ import pytest
 from pathlib import Path
 
 from evaluation.harness import load_template, run_single_trial, EvaluationResults
-from strategies.strategy_f_protected_core import StrategyF_ProtectedCore
 
 
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -31,6 +30,8 @@ class TestStrategyFProductPivot:
 
     def test_strategy_f_initializes(self):
         """Strategy F should initialise with Protected Core active."""
+        from strategies.strategy_f_protected_core import StrategyF_ProtectedCore
+
         template = load_template(str(TEMPLATE_PATH))
         setup = template["initial_setup"]
 
@@ -45,6 +46,8 @@ class TestStrategyFProductPivot:
 
     def test_strategy_f_single_trial(self):
         """Strategy F should complete a single trial without error."""
+        from strategies.strategy_f_protected_core import StrategyF_ProtectedCore
+
         template = load_template(str(TEMPLATE_PATH))
         setup = template["initial_setup"]
 
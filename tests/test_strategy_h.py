@@ -15,6 +15,8 @@ from unittest.mock import Mock, patch, MagicMock
 from typing import List, Dict, Any
 import json
 
+import numpy as np
+
 from strategies.strategy_h_selective_salience import SelectiveSalienceStrategy
 
 
@@ -65,6 +67,88 @@ class TestCoreMethods:
         long_text = "This is a longer text " * 10
         long_count = strategy._token_count(long_text)
         assert long_count > count
+    
+    def test_models_shared_across_instances(self):
+        """The embedder and tokenizer are loaded once and shared."""
+        first = SelectiveSalienceStrategy()
+        second = SelectiveSalienceStrategy()
+        
+        assert first.embedding_model is second.embedding_model
+        assert first.token_encoder is second.token_encoder
+
+    def test_config_round_trips_through_pickle(self):
+        """A strategy's config pickles and rebuilds an equivalent strategy."""
+        import pickle
+
+        strategy = SelectiveSalienceStrategy(batch_mode=True, salience_token_budget=5000)
+        config = pickle.loads(pickle.dumps(strategy.config))
+        rebuilt = SelectiveSalienceStrategy.from_config(config)
+
+        assert rebuilt.config == strategy.config
+        assert rebuilt.batch_mode and rebuilt.salience_token_budget == 5000
+        assert rebuilt.embedding_model is strategy.embedding_model
+
+    def test_default_config_matches_init_defaults(self):
+        """A strategy built without arguments has the default config."""
+        from strategies.strategy_h_selective_salience import SelectiveSalienceConfig
+
+        assert SelectiveSalienceStrategy().config == SelectiveSalienceConfig()
+
+    def test_onnx_embedder_mean_pools_unpadded_tokens(self):
+        """The ONNX embedder averages token states under the attention mask."""
+        from strategies.strategy_h_selective_salience import _OnnxEmbedder
+
+        embedder = _OnnxEmbedder.__new__(_OnnxEmbedder)
+        embedder._input_names = {"input_ids", "attention_mask"}
+        embedder.tokenizer = Mock(return_value={
+            "input_ids": np.array([[1, 2], [3, 0]]),
+            "attention_mask": np.array([[1, 1], [1, 0]]),
+            "token_type_ids": np.zeros((2, 2), dtype=np.int64),
+        })
+        hidden = np.array([[[3.0, 0.0], [1.0, 0.0]], [[0.0, 2.0], [9.0, 9.0]]])
+        embedder.session = Mock(run=Mock(return_value=[hidden]))
+
+        vectors = embedder.encode(["a b", "c"], normalize_embeddings=True, show_progress_bar=False)
+
+        np.testing.assert_allclose(vectors, [[1.0, 0.0], [0.0, 1.0]])
+        feeds = embedder.session.run.call_args[0][1]
+        assert set(feeds) == {"input_ids", "attention_mask"}
+
+    def test_onnx_dir_falls_back_when_repo_is_read_only(self, monkeypatch):
+        """A read-only install exports ONNX models to the user cache instead."""
+        import strategies.strategy_h_selective_salience as salience
+        
+        monkeypatch.setattr(salience.os, "access", lambda path, mode: True)
+        assert salience._default_onnx_dir().name == "models"
+        monkeypatch.setattr(salience.os, "access", lambda path, mode: False)
+        assert salience._default_onnx_dir().parts[-3:] == (".cache", "instinct8", "onnx")
+
+    def test_count_turn_tokens_caches_by_content(self):
+        """Turn token counts are encoded once per distinct content."""
+        strategy = SelectiveSalienceStrategy()
+        turn = {"id": 1, "role": "user", "content": "Hello world"}
+        
+        count = strategy._count_turn_tokens(turn)
+        assert count == strategy._token_count("Hello world")
+        assert "_hash" not in turn
+        
+        strategy.token_encoder = Mock()
+        assert strategy._count_turn_tokens(turn) == count
+        # A new turn dict with the same content hits the same cache entry
+        assert strategy._count_turn_tokens({"id": 7, "role": "assistant", "content": "Hello world"}) == count
+        strategy.token_encoder.encode.assert_not_called()
+
+    def test_turn_token_cache_is_bounded(self):
+        """Edited content is recounted and the cache keeps a bounded LRU."""
+        strategy = SelectiveSalienceStrategy()
+        strategy.TURN_TOKEN_CACHE_SIZE = 2
+        turn = {"id": 1, "role": "user", "content": "Budget is $10K"}
+        
+        strategy._count_turn_tokens(turn)
+        turn["content"] = "Budget is $20K and some more words"
+        assert strategy._count_turn_tokens(turn) == strategy._token_count(turn["content"])
+        strategy._count_turn_tokens({"content": "third"})
+        assert len(strategy._turn_tokens) == 2
 
 
 class TestSalienceExtraction:
@@ -158,6 +242,39 @@ class TestSalienceExtraction:
         assert result == []
 
 
+    @patch('strategies.strategy_h_selective_salience.OpenAI')
+    def test_extract_streamed_items_are_embedded_once(self, mock_openai_class):
+        """Streamed extraction parses items incrementally and pre-embeds them."""
+        pytest.importorskip("ijson")
+        mock_client = Mock()
+        mock_openai_class.return_value = mock_client
+        
+        payload = json.dumps({"salient_items": ["Budget: $200", "", "10 people"]})
+        pieces = [payload[i:i + 7] for i in range(0, len(payload), 7)]
+        mock_client.chat.completions.create.return_value = iter(
+            Mock(choices=[Mock(delta=Mock(content=piece))]) for piece in pieces
+        )
+        
+        encoded = []
+        
+        def encode(items, **kwargs):
+            encoded.extend(items)
+            return np.eye(len(items), 4, dtype=np.float32)
+        
+        strategy = SelectiveSalienceStrategy(stream_extraction=True)
+        strategy.client = mock_client
+        strategy.embedding_model = Mock(encode=Mock(side_effect=encode))
+        strategy.initialize("Test goal", [])
+        
+        result = strategy._extract_salient_information([])
+        assert result == ["Budget: $200", "10 people"]
+        assert mock_client.chat.completions.create.call_args.kwargs["stream"] is True
+        
+        merged = strategy._merge_salience([], result)
+        assert merged == result
+        assert encoded == ["Budget: $200", "10 people"]
+
+
 class TestBackgroundCompression:
     """Tests for background compression with mocked API."""
     
@@ -202,6 +319,56 @@ class TestBackgroundCompression:
         assert isinstance(result, str)
         assert len(result) > 0
 
+    @patch('strategies.strategy_h_selective_salience.OpenAI')
+    def test_compress_background_reuses_summary_for_same_older_turns(self, mock_openai_class):
+        """Only the recent window changed: the previous summary is reused."""
+        mock_client = Mock()
+        mock_openai_class.return_value = mock_client
+        
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = "Summary"
+        mock_client.chat.completions.create.return_value = mock_response
+        
+        strategy = SelectiveSalienceStrategy()
+        strategy.client = mock_client
+        strategy.initialize("Test goal", [])
+        
+        context = [{"id": i, "role": "user", "content": f"Turn {i}"} for i in range(1, 6)]
+        edited = context[:-1] + [{"id": 5, "role": "user", "content": "Edited"}]
+        
+        assert strategy._compress_background(context, []) == "Summary"
+        assert strategy._compress_background(edited, []) == "Summary"
+        assert mock_client.chat.completions.create.call_count == 1
+        
+        changed = [{"id": 1, "role": "user", "content": "Different"}] + context[1:]
+        strategy._compress_background(changed, [])
+        assert mock_client.chat.completions.create.call_count == 2
+
+    def test_extractive_background_keeps_central_sentences(self):
+        """TextRank keeps the best-connected sentences, in conversation order."""
+        strategy = SelectiveSalienceStrategy()
+        vectors = {
+            "Turn 1 (user): Build a CRM for the clinic.": [1.0, 0.0],
+            "Turn 2 (assistant): Sure, a CRM for the clinic.": [1.0, 0.0],
+            "Nice weather today.": [0.0, 1.0],
+            "Turn 3 (user): The CRM must track patients.": [1.0, 0.0],
+        }
+        strategy.embedding_model = Mock(encode=Mock(
+            side_effect=lambda items, **kwargs: np.array([vectors[item] for item in items])
+        ))
+
+        summary = strategy._extractive_background(
+            "Turn 1 (user): Build a CRM for the clinic.\n"
+            "Turn 2 (assistant): Sure, a CRM for the clinic. Nice weather today.\n"
+            "Turn 3 (user): The CRM must track patients."
+        )
+
+        assert summary == (
+            "Turn 1 (user): Build a CRM for the clinic. "
+            "Turn 2 (assistant): Sure, a CRM for the clinic."
+        )
+
 
 class TestContextRebuilding:
     """Tests for context rebuilding."""
@@ -328,6 +495,83 @@ class TestSalienceManagement:
         assert len(result) >= 1
         assert len(result) <= len(existing) + len(new)
     
+    def test_merge_salience_indexes_incrementally(self):
+        """Merging embeds only new items and keeps the shorter duplicate."""
+        strategy = SelectiveSalienceStrategy()
+        vectors = {
+            "Budget: maximum $200": [1.0, 0.0],
+            "Budget: max $200": [1.0, 0.0],
+            "Must accommodate 10 people": [0.0, 1.0],
+        }
+        encoded = []
+        
+        def encode(items, **kwargs):
+            encoded.extend(items)
+            return np.array([vectors[item] for item in items], dtype=np.float32)
+        
+        strategy.embedding_model = Mock(encode=Mock(side_effect=encode))
+        
+        first = strategy._merge_salience([], ["Budget: maximum $200", "Must accommodate 10 people"])
+        assert first == ["Budget: maximum $200", "Must accommodate 10 people"]
+        
+        second = strategy._merge_salience(first, ["Budget: max $200"])
+        assert second == ["Budget: max $200", "Must accommodate 10 people"]
+        assert encoded == ["Budget: maximum $200", "Must accommodate 10 people", "Budget: max $200"]
+
+    def test_fit_salience_budget_keeps_goal_relevant_items(self):
+        """Over budget, items with the best goal similarity per token are kept."""
+        strategy = SelectiveSalienceStrategy(salience_token_budget=6)
+        strategy.token_encoder = Mock(encode=lambda text: text.split())
+        strategy.initialize("Stay under budget", [])
+        vectors = {
+            "Stay under budget": [1.0, 0.0],
+            "Budget: maximum $10K": [1.0, 0.0],
+            "We chatted about the weather for a while": [0.0, 1.0],
+            "Deadline is March": [0.6, 0.8],
+        }
+        encoded = []
+
+        def encode(items, **kwargs):
+            encoded.extend(items)
+            return np.array([vectors[item] for item in items], dtype=np.float32)
+
+        strategy.embedding_model = Mock(encode=Mock(side_effect=encode))
+
+        merged = strategy._merge_salience([], [
+            "Budget: maximum $10K",
+            "We chatted about the weather for a while",
+            "Deadline is March",
+        ])
+        kept = strategy._fit_salience_budget(merged)
+
+        assert kept == ["Budget: maximum $10K", "Deadline is March"]
+        # The index is trimmed too, so the next merge doesn't re-embed the set
+        assert strategy._salience_index.items == kept
+        assert strategy._fit_salience_budget(kept) == kept
+        assert encoded == merged + ["Stay under budget"]
+
+    def test_quantized_index_matches_float_similarity(self, monkeypatch):
+        """int8 embeddings give nearly the same cosine similarities as float32."""
+        import strategies.strategy_h_selective_salience as salience
+        monkeypatch.setattr(salience, "USEARCH_AVAILABLE", False)
+        
+        rng = np.random.default_rng(0)
+        stored = rng.normal(size=(50, 384)).astype(np.float32)
+        stored /= np.linalg.norm(stored, axis=1, keepdims=True)
+        queries = stored[:5] + rng.normal(size=(5, 384)).astype(np.float32) * 0.02
+        queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+        
+        quantized = salience._SalienceIndex(quantize=True)
+        exact = salience._SalienceIndex(quantize=False)
+        for i, vector in enumerate(stored):
+            quantized.add(str(i), vector)
+            exact.add(str(i), vector)
+        
+        q_positions, q_scores = quantized.nearest(queries)
+        positions, scores = exact.nearest(queries)
+        assert (q_positions == positions).all()
+        assert np.abs(q_scores - scores).max() < 0.01
+    
     def test_prioritize_items_constraints_first(self):
         """Test prioritization puts constraints first."""
         strategy = SelectiveSalienceStrategy()
@@ -387,7 +631,7 @@ class TestCompressMethod:
         assert len(result) >= 0
     
     @patch('strategies.strategy_h_selective_salience.OpenAI')
-    def test_compress_full_flow(self, mock_openai_class):
+    def test_compress_full_flow(self, mock_openai_class, route_chat_responses):
         """Test full compression flow with mocked API."""
         mock_client = Mock()
         mock_openai_class.return_value = mock_client
@@ -405,10 +649,9 @@ class TestCompressMethod:
         compression_response.choices[0].message.content = "Background summary"
         
         # Set up side effect to return different responses
-        mock_client.chat.completions.create.side_effect = [
-            extraction_response,
-            compression_response
-        ]
+        mock_client.chat.completions.create.side_effect = route_chat_responses(
+            [extraction_response], [compression_response]
+        )
         
         strategy = SelectiveSalienceStrategy()
         strategy.client = mock_client
@@ -427,7 +670,7 @@ class TestCompressMethod:
         assert mock_client.chat.completions.create.call_count == 2
     
     @patch('strategies.strategy_h_selective_salience.OpenAI')
-    def test_compress_salience_accumulation(self, mock_openai_class):
+    def test_compress_salience_accumulation(self, mock_openai_class, route_chat_responses):
         """Test that salience accumulates across compressions."""
         mock_client = Mock()
         mock_openai_class.return_value = mock_client
@@ -443,12 +686,9 @@ class TestCompressMethod:
         compression_response.choices = [Mock()]
         compression_response.choices[0].message.content = "Summary"
         
-        mock_client.chat.completions.create.side_effect = [
-            extraction_response,
-            compression_response,
-            extraction_response,
-            compression_response,
-        ]
+        mock_client.chat.completions.create.side_effect = route_chat_responses(
+            [extraction_response] * 2, [compression_response] * 2
+        )
         
         strategy = SelectiveSalienceStrategy()
         strategy.client = mock_client
@@ -469,6 +709,60 @@ class TestCompressMethod:
         
         # Salience should accumulate (or at least not decrease)
         assert second_salience_count >= first_salience_count
+        assert "Item 1" in strategy.salience_set
+        assert mock_client.chat.completions.create.call_count == 4
+
+    @patch('strategies.strategy_h_selective_salience.OpenAI')
+    def test_compress_batch_mode_queues_background(self, mock_openai_class):
+        """In batch mode only extraction calls the API; background is queued."""
+        mock_client = Mock()
+        mock_openai_class.return_value = mock_client
+        
+        extraction_response = Mock()
+        extraction_response.choices = [Mock()]
+        extraction_response.choices[0].message.content = json.dumps({
+            "salient_items": ["Budget: $200"]
+        })
+        mock_client.chat.completions.create.return_value = extraction_response
+        
+        strategy = SelectiveSalienceStrategy(batch_mode=True)
+        strategy.client = mock_client
+        strategy.initialize("Test goal", [])
+        
+        context = [
+            {"id": 1, "role": "user", "content": "Turn 1"},
+            {"id": 2, "role": "assistant", "content": "Turn 2"},
+        ]
+        result = strategy.compress(context, 2)
+        
+        assert mock_client.chat.completions.create.call_count == 1
+        assert "Previous conversation context (2 turns)." in result
+        
+        requests = strategy.drain_background_requests()
+        assert [r["custom_id"] for r in requests] == ["2"]
+        assert requests[0]["body"]["model"] == strategy.compression_model
+        assert strategy.drain_background_requests() == []
+
+    @patch('strategies.strategy_h_selective_salience.OpenAI')
+    def test_compress_short_context_skips_llm(self, mock_openai_class):
+        """Contexts under extraction_min_tokens keep user messages verbatim."""
+        mock_client = Mock()
+        mock_openai_class.return_value = mock_client
+
+        strategy = SelectiveSalienceStrategy(extraction_min_tokens=500)
+        strategy.client = mock_client
+        strategy.initialize("Test goal", [])
+
+        context = [
+            {"id": 1, "role": "user", "content": "Budget: maximum $10K"},
+            {"id": 2, "role": "assistant", "content": "Noted."},
+        ]
+        result = strategy.compress(context, 2)
+
+        mock_client.chat.completions.create.assert_not_called()
+        assert strategy.salience_set == ["Budget: maximum $10K"]
+        assert "=== SALIENT INFORMATION ===\n1. Budget: maximum $10K" in result
+        assert "BACKGROUND SUMMARY" not in result
 
 
 class TestErrorHandling:
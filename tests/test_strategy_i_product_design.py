@@ -8,7 +8,6 @@ import pytest
 from pathlib import Path
 
 from evaluation.harness import load_template, run_single_trial, EvaluationResults
-from strategies.strategy_i_hybrid_amem_protected import StrategyI_AMemProtectedCore
 
 
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -31,6 +30,8 @@ class TestStrategyIProductDesign:
 
     def test_strategy_i_initializes(self):
         """Strategy I should initialise with both subsystems active."""
+        from strategies.strategy_i_hybrid_amem_protected import StrategyI_AMemProtectedCore
+
         template = load_template(str(TEMPLATE_PATH))
         setup = template["initial_setup"]
 
@@ -45,6 +46,8 @@ class TestStrategyIProductDesign:
 
     def test_strategy_i_single_trial(self):
         """Strategy I should complete a single trial without error."""
+        from strategies.strategy_i_hybrid_amem_protected import StrategyI_AMemProtectedCore
+
         template = load_template(str(TEMPLATE_PATH))
         setup = template["initial_setup"]
 
@@ -10,8 +10,8 @@ import pytest
 
 from strategies.strategy_b_codex import StrategyB_CodexCheckpoint
 from evaluation.harness import MockAgent, load_template
-from evaluation.metrics import _constraint_mentioned, _get_client
-from evaluation.token_budget import BUDGET_8K, estimate_tokens
+from evaluation.metrics import _constraint_mentioned
+from evaluation.token_budget import BUDGET_8K
 
 
 TEMPLATE_PATH = "templates/research-synthesis-008-8k-4compactions-realistic.json"
@@ -23,7 +23,7 @@ class TestWithActualCompression:
     """Test compression triggering and constraint retention."""
 
     @pytest.fixture(autouse=True)
-    def _check_prerequisites(self):
+    def _check_prerequisites(self, llm_client):
         """Skip if API key or template missing."""
         if not os.getenv("OPENAI_API_KEY") and not os.getenv("ANTHROPIC_API_KEY"):
             pytest.skip("No LLM API key available")
@@ -31,7 +31,7 @@ class TestWithActualCompression:
             self.template = load_template(TEMPLATE_PATH)
         except FileNotFoundError:
             pytest.skip(f"Template not found: {TEMPLATE_PATH}")
-        self.client = _get_client()
+        self.client = llm_client
 
     def test_compression_triggers(self):
         """Compression should trigger when token budget is exceeded."""
@@ -68,8 +68,8 @@ class TestWithActualCompression:
 
         assert cp1_turn is not None, "Template should have at least one compression point"
 
-        reconstructed = strategy.render_reconstructed_prompt(agent.context)
-        tokens_est = estimate_tokens(reconstructed)
+        # Running total kept by add_turn; no need to re-render the prompt
+        assert agent.estimated_tokens > 0
 
         # Compress
         agent.compress(cp1_turn["turn_id"])